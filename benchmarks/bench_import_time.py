@@ -0,0 +1,119 @@
+"""Measure d2spy startup time with `python -X importtime` and fail if it exceeds
+a budget or if importing d2spy loads the optional geo stack.
+
+The budget is relative to a bare `import requests` measured in the same run,
+which d2spy can not import faster than, so that it holds on slow and fast
+machines alike. An absolute budget in milliseconds is machine-specific and
+only checked when given.
+
+Usage:
+    python benchmarks/bench_import_time.py [--module d2spy.workspace]
+        [--budget-ratio 2] [--budget-ms 500] [--repeat 5]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# Module whose import time the budget is relative to
+BASELINE_MODULE = "requests"
+
+# Optional dependencies that must only be imported on first use
+HEAVY_MODULES = ("rasterio", "geopandas", "shapely", "numpy", "exifread", "pyarrow")
+
+IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| *(\S+)")
+
+
+def import_times(module: str) -> Tuple[Dict[str, int], List[str]]:
+    """Import module in a fresh interpreter.
+
+    Returns:
+        Tuple[Dict[str, int], List[str]]: Cumulative import time in microseconds
+            of each module, and heavy modules that were imported.
+    """
+    check = (
+        f"import sys, {module}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            times[match.group(3)] = int(match.group(2))
+
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return times, loaded
+
+
+def best_time(module: str, repeat: int) -> Tuple[Dict[str, int], List[str]]:
+    """Import module `repeat` times, returning the fastest run. It is the least
+    affected by other processes and cold disk caches.
+    """
+    runs = [import_times(module) for _ in range(repeat)]
+    return min(runs, key=lambda run: run[0].get(module, 0))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--module", default="d2spy.workspace")
+    parser.add_argument(
+        "--budget-ratio",
+        type=float,
+        default=2.0,
+        help=f"Budget as a multiple of the `import {BASELINE_MODULE}` time",
+    )
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Absolute, machine-specific budget. Not checked by default.",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    best, loaded = best_time(args.module, args.repeat)
+    total_ms = best.get(args.module, 0) / 1000
+    baseline, _ = best_time(BASELINE_MODULE, args.repeat)
+    baseline_ms = baseline.get(BASELINE_MODULE, 0) / 1000
+    budget_ms = baseline_ms * args.budget_ratio
+
+    print(
+        f"import {args.module}: {total_ms:.1f} ms (budget {budget_ms:.0f} ms, "
+        f"{args.budget_ratio:g} x import {BASELINE_MODULE} {baseline_ms:.1f} ms)"
+    )
+    # Slowest modules imported while importing the module
+    slowest = sorted(
+        (item for item in best.items() if item[0] != args.module),
+        key=lambda item: -item[1],
+    )
+    for name, microseconds in slowest[:10]:
+        print(f"  {name:<40} {microseconds / 1000:8.1f} ms")
+
+    failures = []
+    if loaded:
+        failures.append(f"optional modules imported at startup: {', '.join(loaded)}")
+    if total_ms > budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds budget")
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        failures.append(
+            f"import time {total_ms:.1f} ms exceeds {args.budget_ms:.0f} ms"
+        )
+
+    if failures:
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
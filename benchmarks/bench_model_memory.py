@@ -0,0 +1,128 @@
+"""Compare memory retained by data product models before and after slotted,
+lazily-hydrated models.
+
+Usage:
+    python benchmarks/bench_model_memory.py [--count 1000000]
+"""
+
+import argparse
+import gc
+import json
+import tracemalloc
+import uuid
+from typing import Any, Callable, Dict, List
+
+from d2spy import schemas
+from d2spy.api_client import APIClient
+from d2spy.models.data_product import DataProduct
+from requests import Session
+
+
+class LegacyDataProduct:
+    """Data product model as implemented before slotted models."""
+
+    def __init__(self, client: APIClient, **kwargs):
+        self.client = client
+        self.__dict__.update(kwargs)
+
+
+def synthetic_row(index: int) -> Dict[str, Any]:
+    """Return data product row shaped like a D2S API response."""
+    data_product_id = str(uuid.UUID(int=index))
+    flight_id = str(uuid.UUID(int=index // 4))
+    return {
+        "id": data_product_id,
+        "data_type": "ortho" if index % 2 else "dsm",
+        "filepath": f"/static/projects/p/flights/{flight_id}/{data_product_id}.tif",
+        "original_filename": f"product_{index}.tif",
+        "is_active": True,
+        "flight_id": flight_id,
+        "deactivated_at": None,
+        "public": False,
+        "stac_properties": {
+            "raster": [
+                {
+                    "data_type": "float32",
+                    "stats": {
+                        "minimum": 187.8,
+                        "maximum": 188.1,
+                        "mean": 187.9,
+                        "stddev": 0.04,
+                    },
+                }
+            ],
+            "eo": [{"name": "b1", "description": "Gray"}],
+        },
+        "status": "SUCCESS",
+        "url": f"https://example.com/static/{data_product_id}.tif",
+    }
+
+
+def build_legacy(client: APIClient, rows: List[Dict[str, Any]]) -> List[Any]:
+    return [
+        LegacyDataProduct(client, **schemas.DataProduct.from_dict(row).__dict__)
+        for row in rows
+    ]
+
+
+def build_slotted(client: APIClient, rows: List[Dict[str, Any]]) -> List[Any]:
+    return [
+        DataProduct(client, **schemas.DataProduct.from_dict(row).__dict__)
+        for row in rows
+    ]
+
+
+def build_from_row(client: APIClient, rows: List[Dict[str, Any]]) -> List[Any]:
+    return [DataProduct.from_row(client, row) for row in rows]
+
+
+def build_from_json(client: APIClient, rows: List[Dict[str, Any]]) -> List[Any]:
+    # Raw rows are kept undecoded until an attribute is accessed
+    return [DataProduct.from_json(client, json.dumps(row).encode()) for row in rows]
+
+
+def measure(
+    name: str,
+    build: Callable[[APIClient, List[Dict[str, Any]]], List[Any]],
+    client: APIClient,
+    count: int,
+) -> None:
+    gc.collect()
+    tracemalloc.start()
+
+    # Rows are created inside the measurement, as a parsed response would be,
+    # and only what the models keep alive is retained afterwards
+    rows = [synthetic_row(index) for index in range(count)]
+    instances = build(client, rows)
+    del rows
+    gc.collect()
+
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{name:<10} {count:>9} objects  "
+        f"retained {retained / 2**20:9.1f} MiB  "
+        f"peak {peak / 2**20:9.1f} MiB  "
+        f"{retained / count:7.1f} B/object"
+    )
+    del instances
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    session = Session()
+    session.cookies.set("access_token", "fake_token")
+    client = APIClient("https://example.com", session)
+
+    measure("legacy", build_legacy, client, args.count)
+    measure("slotted", build_slotted, client, args.count)
+    measure("from_row", build_from_row, client, args.count)
+    measure("from_json", build_from_json, client, args.count)
+
+
+if __name__ == "__main__":
+    main()
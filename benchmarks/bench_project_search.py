@@ -0,0 +1,95 @@
+"""Compare ProjectCollection title/description search using the inverted text
+index against scanning every project.
+
+Usage:
+    python benchmarks/bench_project_search.py [--count 50000]
+"""
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.models.project import Project
+from d2spy.models.project_collection import ProjectCollection
+
+CROPS = ["corn", "soybean", "wheat", "sorghum", "cotton", "alfalfa", "canola"]
+WORDS = ["trial", "nitrogen", "hybrid", "plots", "tillage", "irrigation", "yield"]
+SITES = ["ACRE", "Throckmorton", "Pinney", "Davis", "Southeast", "Northeast"]
+
+# Queries typed one keystroke at a time in a project picker
+KEYSTROKES = ["s", "so", "soy", "soyb", "soybe", "soybea", "soybean", "acre", "20"]
+
+
+def synthetic_projects(client: APIClient, count: int) -> List[Project]:
+    """Return projects with realistic titles and descriptions."""
+    rng = random.Random(0)
+    return [
+        Project(
+            client,
+            id=str(index),
+            title=(
+                f"{rng.choice(SITES)} {rng.choice(CROPS)} "
+                f"{rng.choice(WORDS)} {2015 + index % 10}"
+            ),
+            description=" ".join(rng.choice(CROPS + WORDS) for _ in range(12)),
+        )
+        for index in range(count)
+    ]
+
+
+def scan(collection: ProjectCollection, keyword: str) -> int:
+    """Baseline substring scan over every project."""
+    return len(
+        [
+            project
+            for project in collection.collection
+            if keyword.lower() in project.title.lower()
+        ]
+    )
+
+
+def indexed(collection: ProjectCollection, keyword: str) -> int:
+    return len(collection.filter_by_title(keyword))
+
+
+def timed(name: str, function: Callable[[], object], repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{name:<40} {elapsed * 1000:10.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50_000)
+    args = parser.parse_args()
+
+    session = Session()
+    session.cookies.set("access_token", "fake_token")
+    client = APIClient("https://example.com", session)
+    collection = ProjectCollection(collection=synthetic_projects(client, args.count))
+
+    print(f"{args.count} projects, {len(KEYSTROKES)} keystrokes")
+    timed("scan (all keystrokes)", lambda: [scan(collection, q) for q in KEYSTROKES])
+    timed("index build (title)", lambda: collection._text_index("title"))
+    timed("index build (description)", lambda: collection._text_index("description"))
+    timed(
+        "indexed (all keystrokes)",
+        lambda: [indexed(collection, q) for q in KEYSTROKES],
+        repeat=5,
+    )
+    timed("search 'soy trial' (both fields)", lambda: collection.search("soy trial"))
+    timed(
+        "search 'soy trial' prefix, limit 20",
+        lambda: collection.search("soy trial", mode="prefix", limit=20),
+        repeat=5,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Fixtures and defaults for the pytest-benchmark suite.
+
+Baselines are stored as JSON in benchmarks/.baselines regardless of the working
+directory, and runs compared against a baseline fail when the median time of a
+benchmark regresses by more than REGRESSION_THRESHOLD unless another
+--benchmark-compare-fail expression is given.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.auth import Auth
+from d2spy.testing import FakeD2SServer
+from d2spy.testing.server import EMAIL, PASSWORD
+from d2spy.workspace import Workspace
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_STORAGE = "file://" + os.path.join(BENCHMARKS_DIR, ".baselines")
+DEFAULT_STORAGE = "file://./.benchmarks"
+
+REGRESSION_THRESHOLD = "median:20%"
+
+# Rows in list responses used by schema parsing and filtering benchmarks
+ROWS = 100_000
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    # Runs before pytest-benchmark reads its options (its hook is trylast)
+    option = config.option
+    if getattr(option, "benchmark_storage", None) == DEFAULT_STORAGE:
+        option.benchmark_storage = BASELINE_STORAGE
+    if getattr(option, "benchmark_compare", None) and not getattr(
+        option, "benchmark_compare_fail", None
+    ):
+        from pytest_benchmark.utils import parse_compare_fail
+
+        option.benchmark_compare_fail = [parse_compare_fail(REGRESSION_THRESHOLD)]
+
+
+@pytest.fixture(scope="session")
+def client() -> APIClient:
+    """Client for models that are built without a server."""
+    session = Session()
+    session.cookies.set("access_token", "benchmark")
+    return APIClient("http://127.0.0.1", session)
+
+
+@pytest.fixture(scope="session")
+def rows() -> Dict[str, List[Dict[str, Any]]]:
+    """Generated project, flight, and data product rows as returned by D2S."""
+    server = FakeD2SServer(
+        projects=ROWS // 10,
+        flights_per_project=10,
+        data_products_per_flight=1,
+        raw_data_per_flight=0,
+        layers_per_project=0,
+    )
+    projects = list(server.projects.values())
+    return {
+        # Pad projects to ROWS by reusing generated rows with new IDs
+        "projects": [
+            {**projects[index % len(projects)], "id": str(index)}
+            for index in range(ROWS)
+        ],
+        "flights": list(server.flights.values()),
+        "data_products": list(server.data_products.values()),
+    }
+
+
+@pytest.fixture(scope="session")
+def server() -> Iterator[FakeD2SServer]:
+    with FakeD2SServer(
+        projects=20, flights_per_project=10, data_products_per_flight=3
+    ) as fake_server:
+        yield fake_server
+
+
+@pytest.fixture(scope="session")
+def tmp_dir() -> Iterator[str]:
+    with tempfile.TemporaryDirectory() as directory:
+        yield directory
+
+
+@pytest.fixture(scope="session")
+def server_process():
+    return _server_process
+
+
+@contextmanager
+def _server_process(*args: str) -> Iterator[Workspace]:
+    """Run fake D2S server with command line `args` in a separate process, so
+    that its memory use and CPU time are not attributed to the client, and
+    yield a workspace connected to it."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "d2spy.testing.server", "--port=0", *args],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        # First line reads "Fake D2S server running at <url> (...)"
+        url = process.stdout.readline().split()[5]  # type: ignore
+        session = Auth(url).login(email=EMAIL, password=PASSWORD)
+        if session is None:
+            raise RuntimeError("Unable to sign in to fake D2S server")
+        yield Workspace(url, session)
+    finally:
+        process.terminate()
+        process.wait()
@@ -0,0 +1,90 @@
+"""Canopy height model of a 4096 x 4096 DSM: reading and resampling the whole
+DSM and DTM into memory compared to canopy_height_model, which aligns and
+processes them block by block. Peak memory is reported as peak_mib."""
+
+import os
+import tracemalloc
+
+import pytest
+
+from d2spy.extras.geo import HAS_GEO
+
+pytestmark = pytest.mark.skipif(not HAS_GEO, reason="requires d2spy[geo]")
+
+SIZE = 4096
+RESOLUTION = 0.05
+# DTM pixels are 4 times larger than DSM pixels
+DTM_FACTOR = 4
+
+
+@pytest.fixture(scope="module")
+def rasters(tmp_dir):
+    import numpy as np
+
+    from d2spy.testing.rasters import write_raster
+
+    rng = np.random.default_rng(0)
+    terrain = np.tile(
+        np.linspace(190, 200, SIZE // DTM_FACTOR, dtype="float32"),
+        (SIZE // DTM_FACTOR, 1),
+    )
+    surface = np.repeat(np.repeat(terrain, DTM_FACTOR, axis=0), DTM_FACTOR, axis=1)
+    surface += rng.uniform(0, 3, surface.shape).astype("float32")
+    dsm = write_raster(
+        os.path.join(tmp_dir, "chm_dsm.tif"), surface, resolution=RESOLUTION
+    )
+    dtm = write_raster(
+        os.path.join(tmp_dir, "chm_dtm.tif"),
+        terrain,
+        resolution=RESOLUTION * DTM_FACTOR,
+    )
+    return dsm, dtm
+
+
+def in_memory(dsm, dtm, out_raster):
+    import numpy as np
+    import rasterio
+    from rasterio.warp import Resampling, reproject
+
+    with rasterio.open(dsm) as dataset:
+        surface = dataset.read(1)
+        profile = dataset.profile
+    terrain = np.empty_like(surface)
+    with rasterio.open(dtm) as dataset:
+        reproject(
+            rasterio.band(dataset, 1),
+            terrain,
+            dst_transform=profile["transform"],
+            dst_crs=profile["crs"],
+            resampling=Resampling.bilinear,
+        )
+    heights = np.maximum(surface - terrain, 0)
+    profile.update(
+        driver="COG",
+        compress="zstd",
+        predictor="YES",
+        blocksize=512,
+        overview_resampling="average",
+    )
+    with rasterio.open(out_raster, "w", **profile) as out:
+        out.write(heights, 1)
+    return out_raster
+
+
+def blockwise(dsm, dtm, out_raster):
+    from d2spy.extras.terrain import canopy_height_model
+
+    return canopy_height_model(dsm, dtm, out_raster)
+
+
+@pytest.mark.parametrize("compute", [in_memory, blockwise])
+def test_canopy_height_model(benchmark, tmp_dir, rasters, compute):
+    out_raster = os.path.join(tmp_dir, f"chm_{compute.__name__}.tif")
+    result = benchmark.pedantic(compute, args=(*rasters, out_raster), rounds=1)
+    assert os.path.exists(result)
+
+    tracemalloc.start()
+    compute(*rasters, out_raster)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_mib"] = peak / 1024 / 1024
@@ -0,0 +1,81 @@
+"""Filtering of large project and flight collections."""
+
+from datetime import date
+
+import pytest
+
+from d2spy import models, schemas
+from d2spy.models.flight_collection import FlightCollection
+from d2spy.models.project_collection import ProjectCollection
+
+
+@pytest.fixture(scope="module")
+def projects(client, rows) -> ProjectCollection:
+    return ProjectCollection(
+        collection=[
+            models.Project(client, **schemas.MultiProject.from_dict(row).__dict__)
+            for row in rows["projects"]
+        ]
+    )
+
+
+@pytest.fixture(scope="module")
+def flights(client, rows) -> FlightCollection:
+    return FlightCollection(
+        collection=[
+            models.Flight(client, **schemas.Flight.from_dict(row).__dict__)
+            for row in rows["flights"]
+        ]
+    )
+
+
+def run(benchmark, collection, function, *args, indexed=True):
+    """Benchmark function, dropping cached indexes before each round unless
+    indexed so that every round builds them."""
+
+    def setup():
+        if not indexed:
+            collection.invalidate_indexes()
+        return args, {}
+
+    return benchmark.pedantic(
+        function, setup=setup, rounds=5, warmup_rounds=1 if indexed else 0
+    )
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["cold", "warm"])
+def test_filter_by_title(benchmark, projects, indexed):
+    result = run(
+        benchmark, projects, projects.filter_by_title, "soybean", indexed=indexed
+    )
+    assert len(result) > 0
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["cold", "warm"])
+def test_filter_by_date(benchmark, flights, indexed):
+    result = run(
+        benchmark,
+        flights,
+        flights.filter_by_date,
+        date(2024, 3, 1),
+        date(2024, 5, 31),
+        indexed=indexed,
+    )
+    assert len(result) > 0
+
+
+@pytest.mark.parametrize("indexed", [False, True], ids=["cold", "warm"])
+def test_filter_by_sensor(benchmark, flights, indexed):
+    result = run(benchmark, flights, flights.filter_by_sensor, "RGB", indexed=indexed)
+    assert len(result) > 0
+
+
+def test_query(benchmark, flights):
+    query = (
+        flights.query()
+        .date_range(date(2024, 3, 1), date(2024, 5, 31))
+        .sensor("Multispectral")
+        .platform("M350")
+    )
+    result = run(benchmark, flights, query.execute, indexed=False)
+    assert len(result) > 0
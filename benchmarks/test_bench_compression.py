@@ -0,0 +1,76 @@
+"""Response and request body compression: bytes on the wire and client CPU."""
+
+import time
+
+import pytest
+
+from d2spy.compression import HAS_ZSTD
+from d2spy.instrumentation import MetricsAggregator
+
+FEATURES = 50_000
+
+
+@pytest.fixture(scope="module")
+def project(server_process):
+    with server_process(
+        "--projects=1",
+        "--flights-per-project=0",
+        f"--features-per-layer={FEATURES}",
+        "--compress-responses",
+    ) as workspace:
+        yield workspace.get_projects()[0]
+
+
+@pytest.fixture(scope="module")
+def feature_collection(project):
+    return {
+        "type": "FeatureCollection",
+        "features": project.get_map_layers()[0]["features"],
+    }
+
+
+def measure(benchmark, client, function):
+    """Benchmark function and record bytes on the wire and client CPU time of
+    one call."""
+    benchmark.pedantic(function, rounds=3, warmup_rounds=1)
+
+    metrics = client.add_hook(MetricsAggregator())
+    start = time.process_time()
+    function()
+    benchmark.extra_info["cpu_s"] = time.process_time() - start
+    client.remove_hook(metrics)
+    (row,) = metrics.summary()
+    benchmark.extra_info["request_bytes"] = row["request_bytes"]
+    benchmark.extra_info["response_bytes"] = row["response_bytes"]
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip", "zstd"])
+def test_get_map_layers(benchmark, project, encoding):
+    if encoding == "zstd" and "zstd" not in project.client.session.headers.get(
+        "Accept-Encoding", ""
+    ):
+        pytest.skip("zstd responses require d2spy[compression]")
+
+    headers = project.client.session.headers
+    negotiated = headers["Accept-Encoding"]
+    headers["Accept-Encoding"] = encoding
+    try:
+        measure(benchmark, project.client, project.get_map_layers)
+    finally:
+        headers["Accept-Encoding"] = negotiated
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_add_map_layer(benchmark, project, feature_collection, compression):
+    if compression == "zstd" and not HAS_ZSTD:
+        pytest.skip("zstd request compression requires a zstd library")
+
+    project.client.request_compression = compression
+    try:
+        measure(
+            benchmark,
+            project.client,
+            lambda: project.add_map_layer("plots", feature_collection),
+        )
+    finally:
+        project.client.request_compression = None
@@ -0,0 +1,23 @@
+"""Crawl of projects, flights, and data products over HTTP."""
+
+from d2spy.identity_map import IdentityMap
+
+
+def crawl(workspace) -> int:
+    count = 0
+    for project in workspace.get_projects():
+        for flight in project.get_flights():
+            count += len(flight.get_data_products())
+    return count
+
+
+def test_crawl(benchmark, server):
+    workspace = server.connect()
+    count = benchmark.pedantic(crawl, args=(workspace,), rounds=3, warmup_rounds=1)
+    assert count == len(server.data_products)
+
+
+def test_crawl_identity_map(benchmark, server):
+    workspace = server.connect(identity_map=IdentityMap())
+    count = benchmark.pedantic(crawl, args=(workspace,), rounds=3, warmup_rounds=1)
+    assert count == len(server.data_products)
@@ -0,0 +1,100 @@
+"""Season of DSMs over a plot set: clipping every data product to disk and
+reading the clips back, compared to a lazy FlightCollection.to_cube."""
+
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from d2spy.extras.geo import HAS_GEO
+
+pytestmark = pytest.mark.skipif(not HAS_GEO, reason="requires d2spy[geo]")
+
+FLIGHTS = 12
+# 4096 x 4096 pixels at 5 cm
+SIZE = 4096
+ORIGIN = (504000.0, 4588000.0)
+RESOLUTION = 0.05
+
+
+@pytest.fixture(scope="module")
+def rasters(tmp_dir):
+    import numpy as np
+
+    from d2spy.testing.rasters import write_raster
+
+    rng = np.random.default_rng(0)
+    data = rng.normal(190, 1, (SIZE, SIZE)).astype("float32")
+    return [
+        write_raster(
+            os.path.join(tmp_dir, f"cube_dsm_{flight}.tif"),
+            data + flight,
+            origin=ORIGIN,
+            resolution=RESOLUTION,
+            overviews=True,
+        )
+        for flight in range(FLIGHTS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def plots():
+    """Bounding box in WGS84 of a 40 m x 20 m plot set inside the rasters."""
+    from pyproj import Transformer
+
+    transformer = Transformer.from_crs("EPSG:32616", "EPSG:4326", always_xy=True)
+    xmin, ymin = transformer.transform(ORIGIN[0] + 50, ORIGIN[1] - 150)
+    xmax, ymax = transformer.transform(ORIGIN[0] + 90, ORIGIN[1] - 130)
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [[xmin, ymin], [xmax, ymin], [xmax, ymax], [xmin, ymax], [xmin, ymin]]
+            ],
+        },
+        "properties": {},
+    }
+
+
+def clip_and_reread(rasters, plots, out_dir):
+    import numpy as np
+    import rasterio
+
+    from d2spy.extras.geo import clip_by_mask
+
+    layers = []
+    for flight, raster in enumerate(rasters):
+        out_raster = os.path.join(out_dir, f"clip_{flight}.tif")
+        clip_by_mask(raster, plots, out_raster)
+        with rasterio.open(out_raster) as dataset:
+            layers.append(dataset.read())
+    return np.stack(layers)
+
+
+def cube(rasters, plots):
+    import numpy as np
+
+    from d2spy.extras.raster import Grid, RasterCube
+
+    start = date(2024, 5, 1)
+    return np.asarray(
+        RasterCube(
+            rasters,
+            [start + timedelta(days=7 * flight) for flight in range(len(rasters))],
+            Grid.from_geometry(plots, RESOLUTION),
+            bands=1,
+        )
+    )
+
+
+def test_cube_clip_and_reread(benchmark, tmp_dir, rasters, plots):
+    stack = benchmark.pedantic(
+        clip_and_reread, args=(rasters, plots, tmp_dir), rounds=3
+    )
+    assert stack.shape[0] == FLIGHTS
+
+
+def test_cube_to_cube(benchmark, rasters, plots):
+    stack = benchmark.pedantic(cube, args=(rasters, plots), rounds=3)
+    assert stack.shape[:2] == (FLIGHTS, 1)
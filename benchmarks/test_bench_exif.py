@@ -0,0 +1,95 @@
+"""EXIF GPS extraction: full reads, parallel header-only reads, and reads from
+zip members."""
+
+import glob
+import os
+import tempfile
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from d2spy.extras.geo import HAS_GEO
+from d2spy.testing.images import write_geotagged_images
+
+pytestmark = pytest.mark.skipif(not HAS_GEO, reason="requires d2spy[geo]")
+
+IMAGES = 2_000
+# Drone cameras write several KiB of MakerNote data
+MAKER_NOTE = 16 * 1024
+
+
+@pytest.fixture(scope="module")
+def images(tmp_dir):
+    directory = os.path.join(tmp_dir, "exif_images")
+    write_geotagged_images(directory, IMAGES, maker_note=MAKER_NOTE)
+    return sorted(glob.glob(os.path.join(directory, "*.JPG")))
+
+
+@pytest.fixture(scope="module")
+def zip_path(tmp_dir, images):
+    path = os.path.join(tmp_dir, "exif_images.zip")
+    with ZipFile(path, "w", ZIP_DEFLATED) as zip_file:
+        for image in images:
+            zip_file.write(image, f"flight/{os.path.basename(image)}")
+    return path
+
+
+def full(images):
+    from d2spy.extras.geo import get_exif_data, get_gps_coordinates
+
+    return [get_gps_coordinates(get_exif_data(image)) for image in images]
+
+
+def header_only(images, **kwargs):
+    from d2spy.extras.geo import read_gps_coordinates_parallel
+
+    return read_gps_coordinates_parallel(images, **kwargs)
+
+
+def test_exif_full(benchmark, images):
+    coordinates = benchmark.pedantic(full, args=(images,), rounds=1)
+    assert all(coordinates)
+
+
+@pytest.mark.parametrize(
+    "workers,executor", [(1, "thread"), (None, "thread"), (None, "process")]
+)
+def test_exif_header_only(benchmark, images, workers, executor):
+    coordinates = benchmark.pedantic(
+        header_only,
+        args=(images,),
+        kwargs={"workers": workers, "executor": executor},
+        rounds=3,
+    )
+    assert len(coordinates) == IMAGES and all(coordinates)
+
+
+def extract_and_read(zip_path, tmp_dir):
+    """Previous approach: extract images to a temporary directory first."""
+    from d2spy.extras.geo import read_gps_coordinates_parallel
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as extract_dir:
+        with ZipFile(zip_path) as zip_file:
+            zip_file.extractall(extract_dir)
+        images = glob.glob(os.path.join(extract_dir, "flight", "*.JPG"))
+        return read_gps_coordinates_parallel(images)
+
+
+def test_exif_zip_extract(benchmark, zip_path, tmp_dir):
+    coordinates = benchmark.pedantic(
+        extract_and_read, args=(zip_path, tmp_dir), rounds=3
+    )
+    assert len(coordinates) == IMAGES
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_exif_zip_members(benchmark, zip_path, executor):
+    from d2spy.extras.geo import read_zip_gps_coordinates
+
+    coordinates = benchmark.pedantic(
+        read_zip_gps_coordinates,
+        args=(zip_path,),
+        kwargs={"executor": executor},
+        rounds=3,
+    )
+    assert len(coordinates) == IMAGES and all(coordinates)
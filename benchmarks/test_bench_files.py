@@ -0,0 +1,48 @@
+"""Listing an image tree: os.walk with a Path per file compared to the
+scandir-based iter_files, serial and with parallel folder listing."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from d2spy.extras.utils import iter_files
+
+FOLDERS = 200
+FILES_PER_FOLDER = 100
+TYPES = [".jpg", ".tif"]
+
+
+@pytest.fixture(scope="module")
+def image_tree(tmp_dir):
+    root = os.path.join(tmp_dir, "image_tree")
+    for folder in range(FOLDERS):
+        directory = os.path.join(root, f"flight_{folder // 20}", f"camera_{folder}")
+        os.makedirs(directory)
+        for index in range(FILES_PER_FOLDER):
+            extension = ".JPG" if index % 4 else ".txt"
+            open(os.path.join(directory, f"IMG_{index:04d}{extension}"), "w").close()
+    return root
+
+
+def walk_with_path(folder, types):
+    # find_files before it was based on os.scandir
+    images = []
+    for path, _, files in os.walk(folder):
+        for file in files:
+            if Path(file).suffix.lower() in types:
+                images.append(os.path.join(path, file))
+    return images
+
+
+def test_files_os_walk(benchmark, image_tree):
+    files = benchmark(walk_with_path, image_tree, TYPES)
+    assert len(files) == FOLDERS * FILES_PER_FOLDER * 3 // 4
+
+
+@pytest.mark.parametrize("workers", [1, 8])
+def test_files_iter_files(benchmark, image_tree, workers):
+    files = benchmark(
+        lambda: list(iter_files(image_tree, TYPES, max_depth=7, workers=workers))
+    )
+    assert len(files) == FOLDERS * FILES_PER_FOLDER * 3 // 4
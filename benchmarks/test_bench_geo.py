@@ -0,0 +1,85 @@
+"""Client-side geospatial processing: raster clipping and EXIF bounding boxes."""
+
+import os
+
+import pytest
+
+from d2spy.testing.images import write_geotagged_images
+
+IMAGES = 10_000
+
+
+@pytest.fixture(scope="module")
+def cog(tmp_dir) -> str:
+    """Synthetic 3-band 4096x4096 Cloud Optimized GeoTIFF in UTM zone 16N."""
+    np = pytest.importorskip("numpy")
+    rasterio = pytest.importorskip("rasterio")
+    from rasterio.shutil import copy
+    from rasterio.transform import from_origin
+
+    profile = {
+        "driver": "GTiff",
+        "width": 4096,
+        "height": 4096,
+        "count": 3,
+        "dtype": "uint8",
+        "crs": "EPSG:32616",
+        "transform": from_origin(500000, 4475000, 0.05, 0.05),
+        "tiled": True,
+    }
+    data = np.random.default_rng(0).integers(0, 255, (3, 4096, 4096), dtype="uint8")
+    gtiff = os.path.join(tmp_dir, "ortho_gtiff.tif")
+    with rasterio.open(gtiff, "w", **profile) as dataset:
+        dataset.write(data)
+
+    path = os.path.join(tmp_dir, "ortho.tif")
+    copy(gtiff, path, driver="COG", compress="deflate")
+    return path
+
+
+@pytest.fixture(scope="module")
+def mask() -> dict:
+    """Polygon covering about half of the synthetic COG."""
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [
+                [
+                    [-86.99969, 40.42471],
+                    [-86.99879, 40.42401],
+                    [-86.99789, 40.42471],
+                    [-86.99879, 40.42541],
+                    [-86.99969, 40.42471],
+                ]
+            ],
+        },
+        "properties": {},
+    }
+
+
+@pytest.fixture(scope="module")
+def image_dir(tmp_dir) -> str:
+    pytest.importorskip("exifread")
+    directory = os.path.join(tmp_dir, "images")
+    write_geotagged_images(directory, IMAGES)
+    return directory
+
+
+def test_clip_by_mask(benchmark, cog, mask, tmp_dir):
+    from d2spy.extras.geo import clip_by_mask
+
+    out_raster = os.path.join(tmp_dir, "clipped", "ortho.tif")
+    benchmark.pedantic(
+        clip_by_mask, args=(cog, mask, out_raster), rounds=5, warmup_rounds=1
+    )
+    assert os.path.exists(out_raster)
+
+
+def test_bounding_box_from_exif(benchmark, image_dir):
+    from d2spy.extras.geo import get_bounding_box_from_exif_data
+
+    bounding_box = benchmark.pedantic(
+        get_bounding_box_from_exif_data, args=(image_dir,), rounds=3
+    )
+    assert len(bounding_box[0]) == 5
@@ -0,0 +1,105 @@
+"""Mean per plot per flight: one clip per plot and flight compared to
+FlightCollection.extract_plot_series, which reads each data product once and
+rasterizes the plots once."""
+
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from d2spy.extras.geo import HAS_GEO
+
+pytestmark = pytest.mark.skipif(not HAS_GEO, reason="requires d2spy[geo]")
+
+FLIGHTS = 4
+# Grid of 10 x 10 plots of 2 m x 1 m
+ROWS = 10
+COLUMNS = 10
+SIZE = 2048
+ORIGIN = (504000.0, 4588000.0)
+RESOLUTION = 0.05
+
+
+@pytest.fixture(scope="module")
+def rasters(tmp_dir):
+    import numpy as np
+
+    from d2spy.testing.rasters import write_raster
+
+    data = np.random.default_rng(0).normal(0.6, 0.1, (SIZE, SIZE)).astype("float32")
+    return [
+        write_raster(
+            os.path.join(tmp_dir, f"series_ndvi_{flight}.tif"),
+            data + flight / 100,
+            origin=ORIGIN,
+            resolution=RESOLUTION,
+        )
+        for flight in range(FLIGHTS)
+    ]
+
+
+@pytest.fixture(scope="module")
+def plots():
+    from pyproj import Transformer
+
+    transformer = Transformer.from_crs("EPSG:32616", "EPSG:4326", always_xy=True)
+    features = []
+    for row in range(ROWS):
+        for column in range(COLUMNS):
+            left = ORIGIN[0] + 10 + column * 3
+            top = ORIGIN[1] - 10 - row * 2
+            ring = [
+                list(transformer.transform(x, y))
+                for x, y in [
+                    (left, top - 1),
+                    (left + 2, top - 1),
+                    (left + 2, top),
+                    (left, top),
+                    (left, top - 1),
+                ]
+            ]
+            features.append(
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": [ring]},
+                    "properties": {"id": f"{row}-{column}"},
+                }
+            )
+    return features
+
+
+def clip_each_plot(rasters, plots, out_dir):
+    import numpy as np
+    import rasterio
+
+    from d2spy.extras.geo import clip_by_mask
+
+    means = []
+    for flight, raster in enumerate(rasters):
+        for plot in plots:
+            out_raster = os.path.join(out_dir, f"plot_{flight}.tif")
+            clip_by_mask(raster, plot, out_raster)
+            with rasterio.open(out_raster) as dataset:
+                means.append(np.mean(dataset.read(1, masked=True)))
+    return means
+
+
+def plot_series(rasters, plots):
+    from d2spy.extras.zonal import extract_plot_series
+
+    start = date(2024, 5, 1)
+    sources = [
+        (start + timedelta(days=7 * flight), raster)
+        for flight, raster in enumerate(rasters)
+    ]
+    return extract_plot_series(sources, plots, stats=["mean"])
+
+
+def test_plot_series_clip_each_plot(benchmark, tmp_dir, rasters, plots):
+    means = benchmark.pedantic(clip_each_plot, args=(rasters, plots, tmp_dir), rounds=1)
+    assert len(means) == FLIGHTS * ROWS * COLUMNS
+
+
+def test_plot_series_extract_plot_series(benchmark, rasters, plots):
+    series = benchmark.pedantic(plot_series, args=(rasters, plots), rounds=3)
+    assert len(series) == FLIGHTS * ROWS * COLUMNS
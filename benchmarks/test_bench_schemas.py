@@ -0,0 +1,71 @@
+"""Schema parsing and decoding of large list responses."""
+
+import json
+
+import pytest
+from requests import Response
+
+from d2spy import models, schemas
+from d2spy.api_client import decode_json
+from d2spy.identity_map import build_model, build_models
+
+SCHEMAS = {
+    "projects": schemas.Project,
+    "multi_projects": schemas.MultiProject,
+    "flights": schemas.Flight,
+    "data_products": schemas.DataProduct,
+}
+
+# Model and schema of each list endpoint
+LISTS = {
+    "projects": (models.Project, schemas.MultiProject),
+    "flights": (models.Flight, schemas.Flight),
+    "data_products": (models.DataProduct, schemas.DataProduct),
+}
+
+
+@pytest.mark.parametrize("name", list(SCHEMAS))
+def test_from_dict(benchmark, rows, name):
+    schema = SCHEMAS[name]
+    data = rows["projects" if name == "multi_projects" else name]
+
+    parsed = benchmark.pedantic(
+        lambda: [schema.from_dict(row) for row in data], rounds=3, iterations=1
+    )
+    assert len(parsed) == len(data)
+
+
+def schema_models(model, client, data, schema):
+    """Rows to schema instances to models, as before single-pass decoding."""
+    return [build_model(model, client, schema.from_dict(row).__dict__) for row in data]
+
+
+@pytest.mark.parametrize("decoder", ["schema", "single_pass"])
+@pytest.mark.parametrize("name", list(LISTS))
+def test_rows_to_models(benchmark, client, rows, name, decoder):
+    """Rows to models as in `Workspace.get_projects`, `Project.get_flights`, and
+    `Flight.get_data_products`."""
+    model, schema = LISTS[name]
+    data = rows[name]
+    decode = build_models if decoder == "single_pass" else schema_models
+
+    instances = benchmark.pedantic(
+        decode, args=(model, client, data, schema), rounds=3, iterations=1
+    )
+    assert len(instances) == len(data)
+
+
+@pytest.mark.parametrize("parser", ["json", "orjson"])
+def test_decode_json(benchmark, monkeypatch, rows, parser):
+    """Decoding a 100k-project list response body."""
+    if parser == "orjson":
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("d2spy.api_client.HAS_ORJSON", parser == "orjson")
+
+    response = Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps(rows["projects"]).encode()
+
+    data = benchmark.pedantic(decode_json, args=(response,), rounds=3, iterations=1)
+    assert len(data) == len(rows["projects"])
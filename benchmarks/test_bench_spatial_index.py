@@ -0,0 +1,79 @@
+"""Spatial queries over map layer features with and without a spatial index."""
+
+import pytest
+
+from d2spy.extras.geo import HAS_GEO
+
+pytestmark = pytest.mark.skipif(not HAS_GEO, reason="requires d2spy[geo]")
+
+FEATURES = 100_000
+SIZE = 0.0001
+
+
+@pytest.fixture(scope="module")
+def features():
+    return [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        [col * SIZE, row * SIZE],
+                        [(col + 1) * SIZE, row * SIZE],
+                        [(col + 1) * SIZE, (row + 1) * SIZE],
+                        [col * SIZE, (row + 1) * SIZE],
+                        [col * SIZE, row * SIZE],
+                    ]
+                ],
+            },
+            "properties": {"row": row + 1, "col": col + 1},
+        }
+        for row in range(FEATURES // 1000)
+        for col in range(1000)
+    ]
+
+
+@pytest.fixture(scope="module")
+def index(features):
+    from d2spy.models import SpatialIndex
+
+    index = SpatialIndex()
+    index.add_features(features)
+    # Build tree before timing queries
+    index.features_within((0, 0, 0, 0))
+    return index
+
+
+# Footprint of a data product covering 20 x 20 features
+BBOX = (0.01, 0.005, 0.012, 0.007)
+
+
+def scan(features):
+    from shapely.geometry import box, shape
+
+    footprint = box(*BBOX)
+    return [
+        feature
+        for feature in features
+        if footprint.contains(shape(feature["geometry"]))
+    ]
+
+
+def test_features_within_scan(benchmark, features):
+    assert len(benchmark.pedantic(scan, args=(features,), rounds=3)) == 400
+
+
+def test_features_within_index(benchmark, index):
+    assert len(benchmark(index.features_within, BBOX)) == 400
+
+
+def test_build_index(benchmark, features):
+    from d2spy.models import SpatialIndex
+
+    def build():
+        index = SpatialIndex()
+        index.add_features(features)
+        index.features_within(BBOX)
+
+    benchmark.pedantic(build, rounds=3)
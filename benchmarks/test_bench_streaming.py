@@ -0,0 +1,47 @@
+"""Buffered and streamed map layer downloads."""
+
+import time
+import tracemalloc
+
+import pytest
+
+FEATURES = 100_000
+
+
+@pytest.fixture(scope="module")
+def project(server_process):
+    with server_process(
+        "--projects=1", "--flights-per-project=0", f"--features-per-layer={FEATURES}"
+    ) as workspace:
+        yield workspace.get_projects()[0]
+
+
+def buffered(project) -> int:
+    return sum(len(layer["features"]) for layer in project.get_map_layers())
+
+
+def streamed(project) -> int:
+    return sum(1 for _ in project.iter_map_layer_features())
+
+
+def first_feature(project, download) -> float:
+    """Seconds until the first feature can be used."""
+    start = time.perf_counter()
+    if download is streamed:
+        next(iter(project.iter_map_layer_features()))
+    else:
+        project.get_map_layers()[0]["features"][0]
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("download", [buffered, streamed])
+def test_map_layer_features(benchmark, project, download):
+    count = benchmark.pedantic(download, args=(project,), rounds=3, warmup_rounds=1)
+    assert count == FEATURES
+
+    benchmark.extra_info["first_feature_s"] = first_feature(project, download)
+    tracemalloc.start()
+    download(project)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_mib"] = peak / 1024 / 1024
@@ -0,0 +1,53 @@
+"""tus upload throughput for several chunk sizes."""
+
+import os
+
+import pytest
+
+from d2spy.testing import FakeD2SServer
+
+MiB = 1024 * 1024
+FILE_SIZE = 32 * MiB
+
+
+@pytest.fixture(scope="module")
+def flight():
+    with FakeD2SServer(projects=1, flights_per_project=1) as fake_server:
+        yield fake_server.connect().get_projects()[0].get_flights()[0]
+
+
+@pytest.fixture(scope="module")
+def data_product(tmp_dir) -> str:
+    path = os.path.join(tmp_dir, "upload.tif")
+    with open(path, "wb") as upload_file:
+        upload_file.write(os.urandom(FILE_SIZE))
+    return path
+
+
+@pytest.mark.parametrize(
+    "chunk_size",
+    [256 * 1024, MiB, 4 * MiB, 10 * MiB],
+    ids=["256KiB", "1MiB", "4MiB", "10MiB"],
+)
+def test_upload(benchmark, flight, data_product, chunk_size):
+    from d2spy.extras.third_party.tusclient import client as tusc
+
+    client = flight.client
+
+    def upload():
+        tus_client = tusc.TusClient(f"{client.base_url}/files")
+        tus_client.set_headers(
+            {"X-Project-ID": str(flight.project_id), "X-Flight-ID": str(flight.id)}
+        )
+        tus_client.set_cookies({"access_token": client.session.cookies["access_token"]})
+        tus_uploader = tus_client.uploader(
+            data_product, chunk_size=chunk_size, metadata={"filename": "upload.tif"}
+        )
+        flight._upload_chunks(tus_uploader)
+        return tus_uploader.offset
+
+    uploaded = benchmark.pedantic(upload, rounds=3, warmup_rounds=1)
+    assert uploaded == FILE_SIZE
+    benchmark.extra_info["throughput_mib_s"] = (
+        FILE_SIZE / MiB / benchmark.stats["median"]
+    )
@@ -0,0 +1,69 @@
+"""Buffered and streamed map layer uploads."""
+
+import json
+import os
+import tracemalloc
+
+import pytest
+
+FEATURES = 20_000
+
+
+@pytest.fixture(scope="module")
+def project(server_process):
+    with server_process("--projects=1", "--flights-per-project=0") as workspace:
+        yield workspace.get_projects()[0]
+
+
+@pytest.fixture(scope="module")
+def geojson_file(tmp_dir) -> str:
+    filepath = os.path.join(tmp_dir, "field_boundaries.geojson")
+    size = 0.00001
+    features = [
+        {
+            "type": "Feature",
+            "geometry": {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        [-86.9 + col * size, 40.4 + row * size],
+                        [-86.9 + (col + 1) * size, 40.4 + row * size],
+                        [-86.9 + (col + 1) * size, 40.4 + (row + 1) * size],
+                        [-86.9 + col * size, 40.4 + (row + 1) * size],
+                        [-86.9 + col * size, 40.4 + row * size],
+                    ]
+                ],
+            },
+            "properties": {"row": row + 1, "col": col + 1},
+        }
+        for row in range(FEATURES // 100)
+        for col in range(100)
+    ]
+    with open(filepath, "w") as geojson_file:
+        json.dump({"type": "FeatureCollection", "features": features}, geojson_file)
+    return filepath
+
+
+def buffered(project, filepath) -> int:
+    with open(filepath) as geojson_file:
+        feature_collection = json.load(geojson_file)
+    map_layer = project.add_map_layer("field_boundaries", feature_collection)
+    return len(map_layer["features"])
+
+
+def streamed(project, filepath) -> int:
+    map_layer = project.upload_map_layer(filepath, progress=False)
+    return len(map_layer["features"])
+
+
+@pytest.mark.parametrize("upload", [buffered, streamed])
+def test_upload_map_layer(benchmark, project, geojson_file, upload):
+    count = benchmark.pedantic(upload, args=(project, geojson_file), rounds=3)
+    assert count == FEATURES
+
+    # Peak includes the map layer returned by D2S, which both uploads decode
+    tracemalloc.start()
+    upload(project, geojson_file)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    benchmark.extra_info["peak_mib"] = peak / 1024 / 1024
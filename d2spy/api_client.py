@@ -1,10 +1,38 @@
+import json
 import threading
-from typing import Any, Dict, List, Union
+import time
+from importlib.util import find_spec
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    MutableMapping,
+    Optional,
+    Union,
+)
 from urllib.parse import urlparse
 
 from requests import Session, Response
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+from d2spy.compression import RequestCompression, accept_encoding, compress
 
 from d2spy.extras.utils import pretty_print_response
+from d2spy.identity_map import IdentityMap
+from d2spy.instrumentation import RequestEvent, endpoint_template
+from d2spy.json_stream import iter_json
+from d2spy.utils.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+# orjson is optional and decodes large list responses several times faster than
+# the standard library
+HAS_ORJSON = find_spec("orjson") is not None
+
+RequestHook = Callable[[RequestEvent], None]
 
 
 class APIClient:
@@ -24,11 +52,127 @@ class APIClient:
         self.session = session
         self._is_refreshing = False
         self._refresh_lock = threading.Lock()
+        # Set by Workspace when model instances should be cached by ID
+        self.identity_map: Optional[IdentityMap] = None
+        # Called with a RequestEvent after every request
+        self.hooks: List[RequestHook] = []
+        # Compression of JSON request bodies of at least compression_threshold
+        # bytes. Off by default since the D2S server must accept it.
+        self.request_compression: Optional[RequestCompression] = None
+        self.compression_threshold = 64 * 1024
+
+        # Ask for the most compact response coding that can be decoded (e.g.,
+        # zstd or br when their libraries are installed) unless set by the caller
+        headers = getattr(self.session, "headers", None)
+        if (
+            isinstance(headers, MutableMapping)
+            and headers.get("Accept-Encoding") == DEFAULT_ACCEPT_ENCODING
+        ):
+            headers["Accept-Encoding"] = accept_encoding()
 
         # Check if access token in session cookies (avoid ambiguous .get())
         if not any(cookie.name == "access_token" for cookie in self.session.cookies):
             raise ValueError("Session missing access token. Must sign in first.")
 
+    def add_hook(self, hook: RequestHook) -> RequestHook:
+        """Register function called with a `RequestEvent` after every request,
+        including token refreshes, tus upload chunks, and raster clips. Hooks
+        are called in the thread that made the request and must be fast.
+
+        Args:
+            hook (RequestHook): Function that accepts a RequestEvent
+                (e.g., `d2spy.instrumentation.MetricsAggregator`).
+
+        Returns:
+            RequestHook: The registered hook.
+        """
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook: RequestHook) -> None:
+        """Unregister hook added with `add_hook`.
+
+        Args:
+            hook (RequestHook): Registered hook.
+        """
+        self.hooks.remove(hook)
+
+    def emit(self, event: RequestEvent) -> None:
+        """Pass request event to registered hooks. Errors raised by hooks are
+        logged and do not affect the request.
+
+        Args:
+            event (RequestEvent): Request event.
+        """
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.warning(f"Request hook {hook!r} failed: {e}")
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        retry: bool = False,
+        refresh: bool = False,
+        **kwargs,
+    ) -> Response:
+        """Send request and report it to registered hooks.
+
+        Args:
+            method (str): HTTP method (GET, POST, PUT, etc.)
+            endpoint (str): D2S endpoint for request.
+            retry (bool, optional): Request is a retry after token refresh.
+            refresh (bool, optional): Request refreshes the access token.
+            **kwargs: Additional arguments for the request.
+
+        Returns:
+            Response: The response object.
+        """
+        url = self.base_url + endpoint
+        send = getattr(self.session, method.lower())
+        if not self.hooks:
+            return send(url, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            response = send(url, **kwargs)
+        except Exception as e:
+            self.emit(
+                RequestEvent(
+                    method=method.upper(),
+                    endpoint=endpoint_template(endpoint),
+                    status=None,
+                    elapsed=time.perf_counter() - start,
+                    retry=retry,
+                    refresh=refresh,
+                    error=type(e).__name__,
+                )
+            )
+            raise
+        elapsed = time.perf_counter() - start
+
+        if kwargs.get("stream"):
+            # Reading the body would consume the stream
+            response_bytes = int(response.headers.get("Content-Length") or 0)
+        else:
+            response_bytes = wire_size(response)
+
+        self.emit(
+            RequestEvent(
+                method=method.upper(),
+                endpoint=endpoint_template(endpoint),
+                status=response.status_code,
+                elapsed=elapsed,
+                request_bytes=body_size(getattr(response.request, "body", None)),
+                response_bytes=response_bytes,
+                retry=retry,
+                refresh=refresh,
+            )
+        )
+        return response
+
     def _refresh_access_token(self) -> bool:
         """Refresh the access token using the refresh token.
 
@@ -39,12 +183,21 @@ class APIClient:
         if not any(cookie.name == "refresh_token" for cookie in self.session.cookies):
             return False
 
-        url = f"{self.base_url}/api/v1/auth/refresh-token"
         try:
-            response = self.session.post(url)
+            response = self._send("POST", "/api/v1/auth/refresh-token", refresh=True)
             if response.status_code == 200:
                 # Normalize cookies to be scoped to the API host to avoid duplicates
                 host = urlparse(self.base_url).hostname or ""
+                # The session also stored the response cookies under the host's
+                # domain, which would duplicate the host-less localhost cookies
+                for cookie in list(self.session.cookies):
+                    if cookie.name in response.cookies and cookie.name in (
+                        "access_token",
+                        "refresh_token",
+                    ):
+                        self.session.cookies.clear(
+                            cookie.domain, cookie.path, cookie.name
+                        )
                 if "access_token" in response.cookies:
                     # Don't set explicit domain for localhost to
                     # avoid port-matching issues
@@ -99,13 +252,15 @@ class APIClient:
         Raises:
             Exception: If token refresh fails or request fails after retry.
         """
-        url = self.base_url + endpoint
-
         # Extract _retry flag and remove it from kwargs before making request
         is_retry = kwargs.pop("_retry", False)
 
+        # Retries reuse the body compressed by the first attempt
+        if self.request_compression and "json" in kwargs:
+            kwargs = self._compress_json(kwargs)
+
         # Make the initial request
-        response = getattr(self.session, method.lower())(url, **kwargs)
+        response = self._send(method, endpoint, retry=is_retry, **kwargs)
 
         # If we get a 401 and it's not the refresh endpoint, try to refresh
         if (
@@ -113,6 +268,9 @@ class APIClient:
             and endpoint != "/api/v1/auth/refresh-token"
             and not is_retry
         ):
+            if kwargs.get("stream"):
+                # Release the connection of the unread streamed response
+                response.close()
 
             with self._refresh_lock:
                 if not self._is_refreshing:
@@ -136,14 +294,32 @@ class APIClient:
                         self._is_refreshing = False
                 else:
                     # Another thread is already refreshing, wait and retry once
-                    import time
-
                     time.sleep(0.1)
                     kwargs["_retry"] = True
                     response = self._make_request_with_retry(method, endpoint, **kwargs)
 
         return response
 
+    def _compress_json(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace `json` request argument with a compressed body if its encoded
+        size reaches the compression threshold.
+
+        Args:
+            kwargs (Dict[str, Any]): Request arguments with `json`.
+
+        Returns:
+            Dict[str, Any]: Request arguments.
+        """
+        body = json.dumps(
+            kwargs["json"], separators=(",", ":"), allow_nan=False
+        ).encode()
+        headers = {**(kwargs.get("headers") or {}), "Content-Type": "application/json"}
+        if len(body) >= self.compression_threshold:
+            body = compress(body, self.request_compression)  # type: ignore
+            headers["Content-Encoding"] = self.request_compression
+        kwargs = {key: value for key, value in kwargs.items() if key != "json"}
+        return {**kwargs, "data": body, "headers": headers}
+
     def make_get_request(
         self, endpoint: str, **kwargs
     ) -> Union[Dict[Any, Any], List[Dict[Any, Any]]]:
@@ -161,7 +337,39 @@ class APIClient:
             pretty_print_response(response)
             response.raise_for_status()
 
-        return response.json()
+        return decode_json(response)
+
+    def iter_get(
+        self,
+        endpoint: str,
+        path: str = "item",
+        chunk_size: int = 64 * 1024,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Makes streaming GET request to D2S API and yields JSON values at `path`
+        as they are received. Unlike `make_get_request`, the response body is
+        never held in memory as a whole.
+
+        Args:
+            endpoint (str): D2S endpoint for request.
+            path (str, optional): Dot-separated path of values to yield, where
+                "item" stands for every element of an array (e.g.,
+                "item.features.item"). Defaults to "item".
+            chunk_size (int, optional): Bytes read from the response at a time.
+                Defaults to 64 KiB.
+
+        Yields:
+            Any: Decoded JSON values.
+        """
+        response = self._make_request_with_retry("GET", endpoint, stream=True, **kwargs)
+        try:
+            if response.status_code != 200:
+                pretty_print_response(response)
+                response.raise_for_status()
+
+            yield from iter_json(response.iter_content(chunk_size), path)
+        finally:
+            response.close()
 
     def make_post_request(self, endpoint: str, **kwargs) -> Dict[Any, Any]:
         """Make POST request to D2S API.
@@ -203,3 +411,59 @@ class APIClient:
             response.raise_for_status()
 
         return response.json()
+
+
+def wire_size(response: Response) -> int:
+    """Returns size of response body in bytes as received, before any content
+    coding (e.g., gzip) was decoded.
+
+    Args:
+        response (Response): Response with body already read.
+
+    Returns:
+        int: Size of body in bytes.
+    """
+    tell = getattr(response.raw, "tell", None)
+    received = tell() if tell is not None else None
+    if isinstance(received, int) and received > 0:
+        return received
+    return len(response.content or b"")
+
+
+def body_size(body: Any) -> int:
+    """Returns size of request body in bytes, or 0 if the body is streamed.
+
+    Args:
+        body (Any): Prepared request body.
+
+    Returns:
+        int: Size of body in bytes.
+    """
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode())
+    return 0
+
+
+def decode_json(response: Response) -> Any:
+    """Returns decoded JSON response body, using orjson when it is installed.
+
+    Args:
+        response (Response): Response from D2S API.
+
+    Raises:
+        requests.exceptions.JSONDecodeError: Raised if body is not valid JSON.
+
+    Returns:
+        Any: Decoded JSON.
+    """
+    if HAS_ORJSON:
+        import orjson
+
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            # Raise the same error as Response.json
+            pass
+    return response.json()
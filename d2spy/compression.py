@@ -0,0 +1,158 @@
+"""
+HTTP content codings supported by d2spy.
+
+Responses are decoded by urllib3, which decodes gzip and deflate and also
+Brotli and Zstandard when their libraries are installed. Request bodies can be
+compressed with gzip, or with Zstandard when a zstd library is installed.
+"""
+
+import gzip
+import sys
+import zlib
+from importlib.util import find_spec
+from typing import Any, Iterable, Iterator, Literal, Optional
+
+from urllib3.util.request import ACCEPT_ENCODING
+
+RequestCompression = Literal["gzip", "zstd"]
+
+# Response codings urllib3 can decode, most compact first
+PREFERRED_ENCODINGS = ("zstd", "br", "gzip", "deflate")
+
+
+def _zstd_module() -> Optional[str]:
+    if sys.version_info >= (3, 14):
+        return "compression.zstd"
+    for name in ("backports.zstd", "zstandard"):
+        try:
+            if find_spec(name) is not None:
+                return name
+        except ModuleNotFoundError:
+            # Parent package (e.g., backports) is not installed
+            pass
+    return None
+
+
+ZSTD_MODULE = _zstd_module()
+HAS_ZSTD = ZSTD_MODULE is not None
+
+
+def accept_encoding() -> str:
+    """Returns Accept-Encoding header value listing every response coding that
+    can be decoded, most compact first.
+
+    Returns:
+        str: Accept-Encoding header value (e.g., "zstd, br, gzip, deflate").
+    """
+    supported = {coding.strip() for coding in ACCEPT_ENCODING.split(",")}
+    return ", ".join(coding for coding in PREFERRED_ENCODINGS if coding in supported)
+
+
+def compress(data: bytes, encoding: RequestCompression, level: int = 3) -> bytes:
+    """Compress request body.
+
+    Args:
+        data (bytes): Request body.
+        encoding (RequestCompression): "gzip" or "zstd".
+        level (int, optional): Compression level. Low levels are several times
+            faster with slightly larger output. Defaults to 3.
+
+    Raises:
+        ImportError: Raised if zstd is requested but no zstd library is installed.
+        ValueError: Raised if encoding is not supported.
+
+    Returns:
+        bytes: Compressed body.
+    """
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=level)
+    if encoding == "zstd":
+        if ZSTD_MODULE is None:
+            raise ImportError(
+                "zstd request compression requires a zstd library.\n"
+                "Install with: pip install d2spy[compression]"
+            )
+        if ZSTD_MODULE == "zstandard":
+            import zstandard
+
+            return zstandard.ZstdCompressor(level=level).compress(data)
+        import importlib
+
+        return importlib.import_module(ZSTD_MODULE).compress(data, level=level)
+    raise ValueError(f"Unsupported request compression: {encoding!r}")
+
+
+def compress_stream(
+    chunks: Iterable[bytes], encoding: RequestCompression, level: int = 3
+) -> Iterator[bytes]:
+    """Compress request body that is produced in chunks, without holding the
+    whole body in memory.
+
+    Args:
+        chunks (Iterable[bytes]): Request body in chunks.
+        encoding (RequestCompression): "gzip" or "zstd".
+        level (int, optional): Compression level. Defaults to 3.
+
+    Raises:
+        ImportError: Raised if zstd is requested but no zstd library is installed.
+        ValueError: Raised if encoding is not supported.
+
+    Returns:
+        Iterator[bytes]: Compressed body in chunks.
+    """
+    compressor: Any
+    if encoding == "gzip":
+        # wbits=31 writes a gzip header and trailer
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    elif encoding == "zstd" and ZSTD_MODULE == "zstandard":
+        import zstandard
+
+        compressor = zstandard.ZstdCompressor(level=level).compressobj()
+    elif encoding == "zstd" and ZSTD_MODULE is not None:
+        import importlib
+
+        compressor = importlib.import_module(ZSTD_MODULE).ZstdCompressor(level=level)
+    elif encoding == "zstd":
+        raise ImportError(
+            "zstd request compression requires a zstd library.\n"
+            "Install with: pip install d2spy[compression]"
+        )
+    else:
+        raise ValueError(f"Unsupported request compression: {encoding!r}")
+
+    # Compressor is created before the first chunk is requested, so that
+    # unsupported encodings fail before the request is sent
+    def compressed_chunks() -> Iterator[bytes]:
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    return compressed_chunks()
+
+
+def decompress(data: bytes, encoding: str) -> bytes:
+    """Decompress body compressed with `compress`.
+
+    Args:
+        data (bytes): Compressed body.
+        encoding (str): "gzip" or "zstd".
+
+    Raises:
+        ValueError: Raised if encoding is not supported.
+
+    Returns:
+        bytes: Decompressed body.
+    """
+    if encoding == "gzip":
+        return gzip.decompress(data)
+    if encoding == "zstd" and ZSTD_MODULE == "zstandard":
+        import zstandard
+
+        return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    if encoding == "zstd" and ZSTD_MODULE is not None:
+        import importlib
+
+        return importlib.import_module(ZSTD_MODULE).decompress(data)
+    raise ValueError(f"Unsupported content encoding: {encoding!r}")
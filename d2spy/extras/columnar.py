@@ -0,0 +1,263 @@
+"""
+Columnar (Apache Arrow / pandas) views of d2spy model collections.
+
+These functions require optional dependencies.
+Install with: pip install d2spy[arrow]
+"""
+
+import json
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+from uuid import UUID
+
+from d2spy.models.base import Model
+from d2spy.utils.dates import parse_date
+
+# Optional columnar dependencies
+try:
+    import pyarrow as pa
+
+    HAS_ARROW = True
+except ImportError:
+    HAS_ARROW = False
+
+
+# Model class rebuilt by models_from_arrow
+M = TypeVar("M", bound=Model)
+
+# Names of statistics flattened from STAC raster properties
+STAC_STATS = ("minimum", "maximum", "mean", "stddev")
+
+
+def require_arrow():
+    """Raise helpful error if columnar dependencies are missing."""
+    if not HAS_ARROW:
+        raise ImportError(
+            "Columnar views require additional dependencies.\n"
+            "Install with: pip install d2spy[arrow]"
+        )
+
+
+def _encode_uuid(value: Any) -> Optional[bytes]:
+    return UUID(str(value)).bytes if value is not None else None
+
+
+def _decode_uuid(value: Optional[bytes]) -> Optional[str]:
+    return str(UUID(bytes=value)) if value is not None else None
+
+
+def _encode_datetime(value: Any) -> Optional[datetime]:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        return value
+    return None
+
+
+def _decode_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _decode_date(value: Any) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _encode_json(value: Any) -> Optional[str]:
+    return json.dumps(value, default=str) if value is not None else None
+
+
+def _decode_json(value: Optional[str]) -> Any:
+    return json.loads(value) if value is not None else None
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Column kinds: (arrow type factory, encoder, decoder)
+_KINDS: Dict[str, Tuple[Callable[[], Any], Callable, Callable]] = {
+    "uuid": (lambda: pa.binary(16), _encode_uuid, _decode_uuid),
+    "date": (lambda: pa.date32(), parse_date, _decode_date),
+    "datetime": (lambda: pa.timestamp("us"), _encode_datetime, _decode_datetime),
+    "json": (lambda: pa.string(), _encode_json, _decode_json),
+    "string": (lambda: pa.string(), _identity, _identity),
+    "category": (lambda: pa.string(), _identity, _identity),
+    "float": (lambda: pa.float64(), _identity, _identity),
+    "int": (lambda: pa.int64(), _identity, _identity),
+    "bool": (lambda: pa.bool_(), _identity, _identity),
+    "float_list": (lambda: pa.list_(pa.float64()), _identity, _identity),
+}
+
+# Model attribute -> column kind
+FLIGHT_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("id", "uuid"),
+    ("name", "string"),
+    ("acquisition_date", "date"),
+    ("altitude", "float"),
+    ("side_overlap", "float"),
+    ("forward_overlap", "float"),
+    ("sensor", "category"),
+    ("platform", "category"),
+    ("is_active", "bool"),
+    ("deactivated_at", "datetime"),
+    ("project_id", "uuid"),
+    ("pilot_id", "uuid"),
+    ("data_products", "json"),
+)
+
+PROJECT_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("id", "uuid"),
+    ("title", "string"),
+    ("description", "string"),
+    ("role", "category"),
+    ("flight_count", "int"),
+    ("start_date", "date"),
+    ("end_date", "date"),
+    ("is_active", "bool"),
+    ("deactivated_at", "datetime"),
+    ("location_id", "string"),
+    ("team_id", "string"),
+    ("centroid", "json"),
+    ("field", "json"),
+)
+
+DATA_PRODUCT_COLUMNS: Sequence[Tuple[str, str]] = (
+    ("id", "uuid"),
+    ("flight_id", "uuid"),
+    ("data_type", "category"),
+    ("filepath", "string"),
+    ("original_filename", "string"),
+    ("status", "category"),
+    ("url", "string"),
+    ("is_active", "bool"),
+    ("public", "bool"),
+    ("deactivated_at", "datetime"),
+    ("bbox", "float_list"),
+    ("crs", "json"),
+    ("resolution", "json"),
+    ("stac_properties", "json"),
+)
+
+
+def models_to_arrow(
+    instances: Sequence[Model], columns: Sequence[Tuple[str, str]]
+) -> "pa.Table":
+    """Build Arrow table with one row per model instance.
+
+    Args:
+        instances (Sequence[Model]): Model instances.
+        columns (Sequence[Tuple[str, str]]): Attribute names and column kinds.
+
+    Returns:
+        pa.Table: Table with one column per attribute.
+    """
+    require_arrow()
+
+    arrays = []
+    names = []
+    for name, kind in columns:
+        arrow_type, encode, _ = _KINDS[kind]
+        values = [encode(getattr(instance, name, None)) for instance in instances]
+        if kind == "category":
+            # Few distinct values, store each once
+            array = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            array = pa.array(values, type=arrow_type())
+        arrays.append(array)
+        names.append(name)
+
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def models_from_arrow(
+    table: "pa.Table",
+    cls: Type[M],
+    client,
+    columns: Sequence[Tuple[str, str]],
+) -> List[M]:
+    """Rebuild model instances from a table created by `models_to_arrow`.
+    Columns that are not model attributes (e.g., flattened statistics) are
+    ignored.
+
+    Args:
+        table (pa.Table): Table with model attribute columns.
+        cls (Type[M]): Model class.
+        client (APIClient): Client for the model instances.
+        columns (Sequence[Tuple[str, str]]): Attribute names and column kinds.
+
+    Returns:
+        List[M]: Model instances of `cls`.
+    """
+    require_arrow()
+
+    decoded: Dict[str, List[Any]] = {}
+    nested = set()
+    for name, kind in columns:
+        if name not in table.column_names:
+            continue
+        decode = _KINDS[kind][2]
+        decoded[name] = [decode(value) for value in table.column(name).to_pylist()]
+        if kind == "json":
+            nested.add(name)
+
+    instances: List[M] = []
+    for index in range(table.num_rows):
+        row = {}
+        for name, values in decoded.items():
+            # Missing nested attributes (e.g., project boundary) stay missing
+            if values[index] is None and name in nested:
+                continue
+            row[name] = values[index]
+        instances.append(cls.from_row(client, row))
+
+    return instances
+
+
+def flatten_stac_stats(table: "pa.Table", instances: Sequence[Model]) -> "pa.Table":
+    """Append band count and per-band STAC raster statistics columns named
+    `b{band}_{statistic}` (e.g., `b1_mean`) to a data product table.
+
+    Args:
+        table (pa.Table): Data product table.
+        instances (Sequence[Model]): Data products in table row order.
+
+    Returns:
+        pa.Table: Table with flattened statistics columns.
+    """
+    require_arrow()
+
+    rasters = []
+    for instance in instances:
+        stac_properties = getattr(instance, "stac_properties", None) or {}
+        rasters.append(stac_properties.get("raster") or [])
+
+    band_count = max((len(raster) for raster in rasters), default=0)
+    table = table.append_column(
+        "band_count", pa.array([len(raster) for raster in rasters], type=pa.int32())
+    )
+
+    for band in range(band_count):
+        for stat in STAC_STATS:
+            values = [
+                (
+                    raster[band].get("stats", {}).get(stat)
+                    if band < len(raster)
+                    else None
+                )
+                for raster in rasters
+            ]
+            table = table.append_column(
+                f"b{band + 1}_{stat}", pa.array(values, type=pa.float64())
+            )
+
+    return table
@@ -5,26 +5,52 @@ These functions require optional geo dependencies.
 Install with: pip install d2spy[geo]
 """
 
+import io
 import os
 import subprocess
-import tempfile
-from typing import Any, Dict, List, Optional, Tuple
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    IO,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from zipfile import is_zipfile, ZipFile
 
 from d2spy.utils.logging_config import get_logger
 
-# Optional geo dependencies
-try:
-    import exifread
+if TYPE_CHECKING:
     import geopandas as gpd
     import numpy as np
-    import rasterio
-    import rasterio.mask
-    from shapely.geometry import shape
 
-    HAS_GEO = True
-except ImportError:
-    HAS_GEO = False
+# Optional geo dependencies are imported on first use. Checking that they are
+# installed does not import them, so importing d2spy does not load GDAL.
+GEO_PACKAGES = ("exifread", "geopandas", "numpy", "rasterio", "shapely")
+HAS_GEO = all(find_spec(package) is not None for package in GEO_PACKAGES)
+
+# EXIF GPS coordinates only require the image IFD up to its GPS IFD pointer
+GPS_STOP_TAG = "GPSInfo"
+# Bytes read from the start of zip members, enough for the EXIF segment of JPEG
+# images and the first IFD of most TIFF images
+ZIP_HEADER_SIZE = 256 * 1024
+# Footprints narrower than about 0.1 m (in DD) are treated as lines
+COLLINEAR_TOLERANCE = 1e-6
+IMAGE_EXTENSIONS = (".jpg", ".tif")
+
+Executor = Literal["thread", "process"]
+ProgressCallback = Callable[[int, int], None]
 
 logger = get_logger(__name__)
 
@@ -74,6 +100,12 @@ def clip_by_mask(
     """
     require_geo()
 
+    import geopandas as gpd
+    import numpy as np
+    import rasterio
+    import rasterio.mask
+    from shapely.geometry import shape
+
     feature = validate_geojson_polygon_feature(geojson)
 
     if not os.path.exists(os.path.dirname(out_raster)):
@@ -131,11 +163,16 @@ def clip_by_mask(
                 logger.warning("GDAL is not available. Unable to export VRT file.")
 
 
-def get_exif_data(image_path: str) -> Dict:
+def get_exif_data(
+    image_path: str, details: bool = True, stop_tag: Optional[str] = None
+) -> Dict:
     """Returns EXIF data extracted from an image.
 
     Args:
         image_path: Path to image.
+        details: Read MakerNote, XMP, and thumbnail data. Defaults to True.
+        stop_tag: Stop reading an IFD after this tag (e.g., "GPSInfo").
+            Defaults to None (read every tag).
 
     Returns:
         Dict: EXIF data.
@@ -146,8 +183,242 @@ def get_exif_data(image_path: str) -> Dict:
     require_geo()
 
     with open(image_path, "rb") as image_file:
-        tags = exifread.process_file(image_file)
-        return tags
+        return _read_exif(image_file, details, stop_tag)
+
+
+def _read_exif(
+    image_file: IO[bytes], details: bool = True, stop_tag: Optional[str] = None
+) -> Dict:
+    import exifread
+
+    options: Dict[str, Any] = {"details": details, "extract_thumbnail": details}
+    if stop_tag:
+        options["stop_tag"] = stop_tag
+    # Zip members are IO[bytes], which exifread reads like any binary file
+    return exifread.process_file(cast(BinaryIO, image_file), **options)
+
+
+def read_gps_coordinates(image_path: str) -> Optional[Tuple[float, float]]:
+    """Returns latitude and longitude in DD from an image's EXIF data. Only the
+    tags needed to find the GPS IFD are read, skipping MakerNote, XMP, and
+    thumbnail data, which is much faster than `get_exif_data` for drone images.
+
+    Args:
+        image_path: Path to image.
+
+    Returns:
+        Optional[Tuple[float, float]]: Latitude and longitude in DD (if available).
+    """
+    tags = get_exif_data(image_path, details=False, stop_tag=GPS_STOP_TAG)
+    return get_gps_coordinates(tags)
+
+
+def read_zip_member_gps_coordinates(
+    zip_file: ZipFile, member: str
+) -> Optional[Tuple[float, float]]:
+    """Returns latitude and longitude in DD from the EXIF data of an image in a
+    zip file, without extracting it. Only the first `ZIP_HEADER_SIZE` bytes of
+    the member are decompressed unless its EXIF data lies beyond them.
+
+    Args:
+        zip_file: Open zip file.
+        member: Name of image in zip file.
+
+    Returns:
+        Optional[Tuple[float, float]]: Latitude and longitude in DD (if available).
+    """
+    with zip_file.open(member) as member_file:
+        header = member_file.read(ZIP_HEADER_SIZE)
+        try:
+            gps_coords = get_gps_coordinates(
+                _read_exif(io.BytesIO(header), False, GPS_STOP_TAG)
+            )
+        except Exception:
+            # IFD offsets point beyond the header
+            gps_coords = None
+        if gps_coords is None and len(header) == ZIP_HEADER_SIZE:
+            # Images with EXIF data at the end (e.g., some TIFFs) are read from
+            # the member, which decompresses up to each requested offset
+            gps_coords = get_gps_coordinates(
+                _read_exif(member_file, False, GPS_STOP_TAG)
+            )
+    return gps_coords
+
+
+def read_gps_coordinates_parallel(
+    images: Sequence[str],
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Optional[ProgressCallback] = None,
+) -> List[Optional[Tuple[float, float]]]:
+    """Returns latitude and longitude in DD of each image, read in parallel.
+
+    Args:
+        images: Paths to images.
+        workers: Number of threads or processes. Defaults to the executor's
+            default. Images are read serially if 1.
+        executor: Read images in a "thread" pool, which suits slow or network
+            storage, or a "process" pool, which suits fast local storage since
+            EXIF parsing holds the GIL. Defaults to "thread".
+        progress: Function called with the number of images read and the total
+            number of images after each image.
+
+    Returns:
+        List[Optional[Tuple[float, float]]]: Coordinates in the order of `images`.
+    """
+    require_geo()
+    return _map_parallel(read_gps_coordinates, images, workers, executor, progress)
+
+
+def read_zip_gps_coordinates(
+    zip_path: str,
+    members: Optional[Sequence[str]] = None,
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Optional[ProgressCallback] = None,
+) -> List[Optional[Tuple[float, float]]]:
+    """Returns latitude and longitude in DD of each image in a zip file, read in
+    parallel from the zip members without extracting them.
+
+    Args:
+        zip_path: Path to zip file.
+        members: Names of images in zip file. Defaults to every .jpg and .tif.
+        workers: Number of threads or processes. Defaults to the executor's
+            default. Images are read serially if 1.
+        executor: "thread" or "process" pool. Threads share one open zip file,
+            and each process opens its own. Defaults to "thread".
+        progress: Function called with the number of images read and the total
+            number of images after each image.
+
+    Returns:
+        List[Optional[Tuple[float, float]]]: Coordinates in the order of `members`.
+    """
+    require_geo()
+
+    with ZipFile(zip_path) as zip_file:
+        if members is None:
+            members = zip_image_members(zip_file)
+        if executor == "process":
+            try:
+                return _map_parallel(
+                    _read_worker_zip_member,
+                    members,
+                    workers,
+                    executor,
+                    progress,
+                    initializer=_open_worker_zip,
+                    initargs=(zip_path,),
+                )
+            finally:
+                # Images read serially use the zip file opened in this process
+                _close_worker_zip()
+        return _map_parallel(
+            partial(read_zip_member_gps_coordinates, zip_file),
+            members,
+            workers,
+            executor,
+            progress,
+        )
+
+
+def zip_image_members(zip_file: ZipFile) -> List[str]:
+    """Returns names of .jpg and .tif files in a zip file.
+
+    Args:
+        zip_file: Open zip file.
+
+    Returns:
+        List[str]: Names of images in zip file.
+    """
+    return [
+        info.filename
+        for info in zip_file.infolist()
+        if not info.is_dir() and info.filename.lower().endswith(IMAGE_EXTENSIONS)
+    ]
+
+
+# Zip file opened by each worker process of read_zip_gps_coordinates
+_worker_zip: Optional[ZipFile] = None
+
+
+def _open_worker_zip(zip_path: str) -> None:
+    global _worker_zip
+    _worker_zip = ZipFile(zip_path)
+
+
+def _close_worker_zip() -> None:
+    global _worker_zip
+    if _worker_zip is not None:
+        _worker_zip.close()
+        _worker_zip = None
+
+
+def _read_worker_zip_member(member: str) -> Optional[Tuple[float, float]]:
+    assert _worker_zip is not None
+    return read_zip_member_gps_coordinates(_worker_zip, member)
+
+
+def _map_parallel(
+    function: Callable[[str], Optional[Tuple[float, float]]],
+    items: Sequence[str],
+    workers: Optional[int],
+    executor: Executor,
+    progress: Optional[ProgressCallback],
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: Tuple = (),
+) -> List[Optional[Tuple[float, float]]]:
+    """Apply function to items in a thread or process pool, in order."""
+    if executor not in ("thread", "process"):
+        raise ValueError("executor must be 'thread' or 'process'")
+
+    total = len(items)
+    if workers == 1 or total <= 1:
+        if initializer:
+            initializer(*initargs)
+        return _collect(map(function, items), total, progress)
+
+    # Same defaults as the executors
+    cpus = os.cpu_count() or 1
+    if executor == "thread":
+        pool_class: Any = ThreadPoolExecutor
+        workers = workers or min(32, cpus + 4)
+    else:
+        pool_class = ProcessPoolExecutor
+        workers = workers or cpus
+
+    with pool_class(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        # Batches of images per task amortize inter-process communication
+        chunksize = max(1, total // (workers * 16))
+        results = pool.map(function, items, chunksize=chunksize)
+        return _collect(results, total, progress)
+
+
+def _collect(
+    results, total: int, progress: Optional[ProgressCallback]
+) -> List[Optional[Tuple[float, float]]]:
+    coordinates = []
+    for gps_coords in results:
+        coordinates.append(gps_coords)
+        if progress:
+            progress(len(coordinates), total)
+    return coordinates
+
+
+def print_progress(done: int, total: int) -> None:
+    """Print EXIF extraction progress about every 1% of images.
+
+    Args:
+        done: Images read.
+        total: Total number of images.
+    """
+    if done == total or done % max(1, total // 100) == 0:
+        print(
+            f"Extracting coordinates from image [{done}/{total}]...",
+            end="\r",
+            flush=True,
+        )
 
 
 def get_gps_coordinates(tags: Dict) -> Optional[Tuple[float, float]]:
@@ -183,71 +454,272 @@ def get_gps_coordinates(tags: Dict) -> Optional[Tuple[float, float]]:
         return None
 
 
-def extract_lat_lon(image_dir: str) -> List[List[float]]:
-    """Returns geographic bounding box based on lat/lon coordinates from EXIF.
+def read_image_positions(
+    image_dir: str,
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Union[bool, ProgressCallback] = True,
+) -> Tuple[List[str], "np.ndarray"]:
+    """Returns positions of images with GPS coordinates in their EXIF data.
+    Images are read in parallel and only up to their GPS tags. Images in zip
+    files are read from the zip members without extracting them.
 
     Args:
-        image_dir: Directory containing images.
+        image_dir: Directory or zip file containing images.
+        workers: Number of threads or processes. Defaults to the executor's
+            default. Images are read serially if 1.
+        executor: "thread" or "process" pool. Defaults to "thread".
+        progress: Print progress, or function called with the number of images
+            read and the total number of images. Defaults to True.
 
     Returns:
-        List[List[float]]: Geographic bounding box.
+        Tuple[List[str], np.ndarray]: Paths (or zip member names) of images with
+            GPS coordinates, and array of their longitudes and latitudes in DD
+            with shape (number of images, 2).
 
     Raises:
         ImportError: If exifread not installed.
+        ValueError: If no images are found.
     """
     require_geo()
 
+    import numpy as np
+
     from d2spy.extras.utils import find_files
 
-    print("Finding image files...", end="", flush=True)
-    images = find_files(image_dir, [".jpg", ".tif"])
-    print("Done!")
+    is_zip = os.path.isfile(image_dir) and is_zipfile(image_dir)
+    if progress is True:
+        print("Finding image files...", end="", flush=True)
+    if is_zip:
+        with ZipFile(image_dir) as zip_file:
+            images = zip_image_members(zip_file)
+    else:
+        images = find_files(image_dir, list(IMAGE_EXTENSIONS))
+    if progress is True:
+        print("Done!")
 
     if len(images) == 0:
         raise ValueError("No images found in provided directory/zip")
 
-    lats = []
-    lons = []
-
-    for index, image in enumerate(images):
-        if index % 10 == 0:
-            print(
-                f"Extracting coordinates from image [{index + 1}/{len(images)}]...",
-                end="\r",
-                flush=True,
-            )
+    report = print_progress if progress is True else progress or None
+    if is_zip:
+        coordinates = read_zip_gps_coordinates(
+            image_dir, images, workers=workers, executor=executor, progress=report
+        )
+    else:
+        coordinates = read_gps_coordinates_parallel(
+            images, workers=workers, executor=executor, progress=report
+        )
 
-        tags = get_exif_data(image)
-        gps_coords = get_gps_coordinates(tags)
+    if progress is True:
+        print(
+            f"Extracting coordinates from image [{len(images)}/{len(images)}]...Done!"
+        )
 
-        if gps_coords:
-            lats.append(gps_coords[0])
-            lons.append(gps_coords[1])
+    located = [index for index, gps_coords in enumerate(coordinates) if gps_coords]
+    positions = np.empty((len(located), 2), dtype=np.float64)
+    for row, index in enumerate(located):
+        lat, lon = coordinates[index]  # type: ignore[misc]
+        positions[row] = (lon, lat)
+    return [images[index] for index in located], positions
 
-    print(f"Extracting coordinates from image [{index + 1}/{len(images)}]...Done!")
 
-    if len(lats) == 0 or len(lons) == 0:
+def _check_positions(positions: "np.ndarray") -> None:
+    if len(positions) == 0:
         raise ValueError("Unable to extract coordinates from EXIF data")
 
-    if len(lats) < 3 or len(lons) < 3:
+    if len(positions) < 3:
         raise ValueError(
             "Must have at least three coordinate pairs to create bounding box"
         )
 
-    xmin, xmax = min(lons), max(lons)
-    ymin, ymax = min(lats), max(lats)
+
+def extract_lat_lon(
+    image_dir: str,
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Union[bool, ProgressCallback] = True,
+) -> List[List[float]]:
+    """Returns geographic bounding box based on lat/lon coordinates from EXIF.
+    Images are read in parallel and only up to their GPS tags. Images in zip
+    files are read from the zip members without extracting them.
+
+    Args:
+        image_dir: Directory or zip file containing images.
+        workers: Number of threads or processes. Defaults to the executor's
+            default. Images are read serially if 1.
+        executor: "thread" or "process" pool. Defaults to "thread".
+        progress: Print progress, or function called with the number of images
+            read and the total number of images. Defaults to True.
+
+    Returns:
+        List[List[float]]: Geographic bounding box.
+
+    Raises:
+        ImportError: If exifread not installed.
+    """
+    _, positions = read_image_positions(image_dir, workers, executor, progress)
+    _check_positions(positions)
+
+    xmin, ymin = positions.min(axis=0).tolist()
+    xmax, ymax = positions.max(axis=0).tolist()
 
     return [[xmin, ymin], [xmin, ymax], [xmax, ymax], [xmax, ymin], [xmin, ymin]]
 
 
+def get_footprint_from_exif_data(
+    image_dir: str,
+    method: Literal["convex", "concave", "bbox"] = "convex",
+    ratio: float = 0.3,
+    buffer: float = 0,
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Union[bool, ProgressCallback] = True,
+) -> Dict[str, Any]:
+    """Returns footprint polygon of image positions from EXIF data. Unlike the
+    bounding box, a convex or concave hull follows diagonal and irregular
+    flight plans. The footprint can be passed as `location` to
+    `Workspace.add_project` or used to clip data products.
+
+    Args:
+        image_dir: Directory or zip file containing images.
+        method: "convex" hull, "concave" hull (alpha shape), or "bbox".
+            Defaults to "convex".
+        ratio: Concave hull ratio between 0 (most concave) and 1 (convex hull).
+            Defaults to 0.3.
+        buffer: Distance in meters the footprint is grown by, e.g., half the
+            ground coverage of an image so that the footprint covers the
+            images and not only their centers. Defaults to 0.
+        workers: Number of threads or processes reading images. Defaults to
+            the executor's default.
+        executor: "thread" or "process" pool. Defaults to "thread".
+        progress: Print progress, or function called with the number of images
+            read and the total number of images. Defaults to True.
+
+    Raises:
+        ImportError: If geo extras not installed.
+        ValueError: If there are fewer than three image positions, they are
+            collinear, or the method is not supported.
+
+    Returns:
+        Dict[str, Any]: GeoJSON Polygon Feature in WGS84.
+    """
+    if method not in ("convex", "concave", "bbox"):
+        raise ValueError("method must be 'convex', 'concave', or 'bbox'")
+
+    _, positions = read_image_positions(image_dir, workers, executor, progress)
+    return positions_footprint(positions, method, ratio, buffer)
+
+
+def positions_footprint(
+    positions: "np.ndarray",
+    method: Literal["convex", "concave", "bbox"] = "convex",
+    ratio: float = 0.3,
+    buffer: float = 0,
+) -> Dict[str, Any]:
+    """Returns footprint polygon of positions.
+
+    Args:
+        positions: Longitudes and latitudes in DD with shape (n, 2).
+        method: "convex" hull, "concave" hull (alpha shape), or "bbox".
+            Defaults to "convex".
+        ratio: Concave hull ratio between 0 (most concave) and 1 (convex hull).
+            Defaults to 0.3.
+        buffer: Distance in meters the footprint is grown by. Defaults to 0.
+
+    Raises:
+        ValueError: If there are fewer than three positions or they are
+            collinear.
+
+    Returns:
+        Dict[str, Any]: GeoJSON Polygon Feature in WGS84.
+    """
+    require_geo()
+
+    import json
+
+    import shapely
+
+    _check_positions(positions)
+
+    points = shapely.multipoints(positions)
+    if method == "concave":
+        footprint = shapely.concave_hull(points, ratio=ratio)
+    elif method == "bbox":
+        footprint = shapely.envelope(points)
+    else:
+        footprint = shapely.convex_hull(points)
+
+    # Positions on a line have a sliver hull due to rounding in the EXIF data,
+    # whose area is about half its perimeter times its width
+    if footprint.geom_type != "Polygon" or (
+        footprint.area < COLLINEAR_TOLERANCE * footprint.length
+    ):
+        raise ValueError("Image positions are collinear and have no footprint")
+
+    if buffer:
+        import geopandas as gpd
+
+        footprints = gpd.GeoSeries([footprint], crs="EPSG:4326")
+        utm = footprints.estimate_utm_crs()
+        footprint = footprints.to_crs(utm).buffer(buffer).to_crs("EPSG:4326")[0]
+
+    return {
+        "type": "Feature",
+        "geometry": json.loads(shapely.to_geojson(footprint)),
+        "properties": {},
+    }
+
+
+def get_image_positions(
+    image_dir: str,
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Union[bool, ProgressCallback] = True,
+) -> "gpd.GeoDataFrame":
+    """Returns positions of images with GPS coordinates in their EXIF data.
+
+    Args:
+        image_dir: Directory or zip file containing images.
+        workers: Number of threads or processes reading images. Defaults to
+            the executor's default.
+        executor: "thread" or "process" pool. Defaults to "thread".
+        progress: Print progress, or function called with the number of images
+            read and the total number of images. Defaults to True.
+
+    Returns:
+        gpd.GeoDataFrame: Image path (or zip member name) and point geometry in
+            WGS84 for each image.
+    """
+    images, positions = read_image_positions(image_dir, workers, executor, progress)
+
+    import geopandas as gpd
+
+    return gpd.GeoDataFrame(
+        {"image": images},
+        geometry=gpd.points_from_xy(positions[:, 0], positions[:, 1]),
+        crs="EPSG:4326",
+    )
+
+
 def get_bounding_box_from_exif_data(
-    image_dir: str, tmpdir: Optional[str] = None
+    image_dir: str,
+    tmpdir: Optional[str] = None,
+    workers: Optional[int] = None,
+    executor: Executor = "thread",
+    progress: Union[bool, ProgressCallback] = True,
 ) -> List[List[List[float]]]:
     """Returns geographic bounding box from EXIF data in images.
 
     Args:
         image_dir: Directory or zip file containing images.
-        tmpdir: Optional root temp dir. Defaults to None.
+        tmpdir: Deprecated and unused, images in zip files are read without
+            extracting them. Defaults to None.
+        workers: Number of threads or processes reading images. Defaults to
+            the executor's default.
+        executor: "thread" or "process" pool. Defaults to "thread".
+        progress: Print progress, or function called with the number of images
+            read and the total number of images. Defaults to True.
 
     Raises:
         ImportError: If exifread not installed.
@@ -264,35 +736,17 @@ def get_bounding_box_from_exif_data(
             "Could not find image directory at path provided by 'image_dir'"
         )
 
-    if tmpdir and not os.path.exists(tmpdir):
-        raise FileNotFoundError("Provided alternate temp directory does not exist")
-
-    if os.path.isdir(image_dir):
-        bounding_box = extract_lat_lon(image_dir)
-
-    elif is_zipfile(image_dir):
-        with tempfile.TemporaryDirectory(dir=tmpdir) as tmp_dir:
-            # Unzip all images (.jpg or .tif) to temporary directory
-            with ZipFile(image_dir) as zip_file:
-                zip_contents = zip_file.namelist()
-
-                for index, zf in enumerate(zip_contents):
-
-                    if index % 10 == 0:
-                        print(
-                            f"Extracting file [{index + 1}/{len(zip_contents)}]...",
-                            end="\r",
-                            flush=True,
-                        )
-
-                    if zf.lower().endswith(".jpg") or zf.lower().endswith(".tif"):
-                        zip_file.extract(zf, tmp_dir)
-
-                print(
-                    f"Extracting file [{index + 1}/{len(zip_contents)}]...Done!",
-                )
+    if tmpdir:
+        warnings.warn(
+            "'tmpdir' is deprecated and will be removed in future versions.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if not os.path.exists(tmpdir):
+            raise FileNotFoundError("Provided alternate temp directory does not exist")
 
-                bounding_box = extract_lat_lon(tmp_dir)
+    if os.path.isdir(image_dir) or is_zipfile(image_dir):
+        bounding_box = extract_lat_lon(image_dir, workers, executor, progress)
     else:
         raise ValueError(
             "Must provide path to image directory or zip file containing images"
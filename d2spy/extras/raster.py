@@ -0,0 +1,473 @@
+"""
+Aligned reads of data product rasters.
+
+Rasters are read through a WarpedVRT defined on a common target grid, so that
+only the source blocks (or overviews) covering the grid are requested and
+resampled, and rasters with different coordinate systems and resolutions line
+up pixel for pixel. Rasters served by D2S are Cloud Optimized GeoTIFFs, so a
+read of a small area fetches a few byte ranges instead of the whole file.
+
+Requires: pip install d2spy[geo]
+"""
+
+import os
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Sequence, Union
+
+from d2spy.extras.geo import require_geo
+from d2spy.utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from d2spy.models.data_product import DataProduct
+
+# GDAL options for reading COGs over HTTP: skip listing the remote directory for
+# sidecar files and merge requests for neighbouring blocks
+GDAL_READ_OPTIONS = {
+    "GDAL_DISABLE_READDIR_ON_OPEN": "EMPTY_DIR",
+    "GDAL_HTTP_MERGE_CONSECUTIVE_RANGES": "YES",
+    "GDAL_HTTP_MULTIPLEX": "YES",
+    "VSI_CACHE": "TRUE",
+}
+
+Source = Union[str, "DataProduct"]
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class Grid:
+    """Target grid that rasters are aligned to."""
+
+    # rasterio.crs.CRS
+    crs: Any
+    # affine.Affine of the upper left corner, with square pixels
+    transform: Any
+    width: int
+    height: int
+
+    @classmethod
+    def from_geometry(
+        cls, geometry: Any, resolution: float, crs: Optional[Any] = None
+    ) -> "Grid":
+        """Returns grid covering the bounds of a geometry. Grid edges are snapped
+        to multiples of the resolution, so that grids built for overlapping
+        geometries at the same resolution share pixel boundaries.
+
+        Args:
+            geometry (Any): Shapely geometry, GeoJSON geometry or Feature, or
+                bounding box (min x, min y, max x, max y) in WGS84.
+            resolution (float): Pixel size in units of `crs`.
+            crs (Optional[Any], optional): Coordinate reference system of the
+                grid. Defaults to the UTM zone of the geometry.
+
+        Raises:
+            ValueError: Raised if resolution is not positive.
+
+        Returns:
+            Grid: Grid covering the geometry.
+        """
+        require_geo()
+
+        import math
+
+        from rasterio.crs import CRS
+        from rasterio.transform import from_origin
+        from rasterio.warp import transform_bounds
+
+        from d2spy.models.spatial_index import to_geometry
+
+        if resolution <= 0:
+            raise ValueError("resolution must be positive")
+
+        bounds = to_geometry(geometry).bounds
+        crs = CRS.from_user_input(crs or utm_crs(*bounds))
+        xmin, ymin, xmax, ymax = transform_bounds("EPSG:4326", crs, *bounds)
+
+        left = math.floor(xmin / resolution) * resolution
+        top = math.ceil(ymax / resolution) * resolution
+        width = max(math.ceil((xmax - left) / resolution), 1)
+        height = max(math.ceil((top - ymin) / resolution), 1)
+        return cls(crs, from_origin(left, top, resolution, resolution), width, height)
+
+    @property
+    def bounds(self) -> tuple:
+        """Grid bounds (left, bottom, right, top) in grid CRS."""
+        from rasterio.transform import array_bounds
+
+        return tuple(array_bounds(self.height, self.width, self.transform))
+
+    @property
+    def resolution(self) -> float:
+        """Pixel size in units of grid CRS."""
+        return self.transform.a
+
+    @property
+    def x(self) -> "np.ndarray":
+        """X coordinates of pixel centers."""
+        import numpy as np
+
+        return self.transform.c + self.transform.a * (np.arange(self.width) + 0.5)
+
+    @property
+    def y(self) -> "np.ndarray":
+        """Y coordinates of pixel centers, from top to bottom."""
+        import numpy as np
+
+        return self.transform.f + self.transform.e * (np.arange(self.height) + 0.5)
+
+
+def utm_crs(xmin: float, ymin: float, xmax: float, ymax: float) -> str:
+    """Returns UTM zone (WGS84) of the center of a bounding box in WGS84.
+
+    Returns:
+        str: EPSG code of the UTM zone (e.g., "EPSG:32616").
+    """
+    lon = (xmin + xmax) / 2
+    lat = (ymin + ymax) / 2
+    zone = min(int((lon + 180) // 6) + 1, 60)
+    return f"EPSG:{32600 + zone if lat >= 0 else 32700 + zone}"
+
+
+def source_url(source: Source) -> str:
+    """Returns URL or path of a data product raster."""
+    return source if isinstance(source, str) else source.url
+
+
+def open_raster(source: Source):
+    """Open data product raster with rasterio, retrying with the API key from the
+    D2S_API_KEY environment variable if access is denied.
+
+    Args:
+        source (Source): Data product, or URL or path of a raster.
+
+    Raises:
+        PermissionError: Raised if access is denied.
+
+    Returns:
+        rasterio.DatasetReader: Opened dataset.
+    """
+    import rasterio
+    from rasterio.errors import RasterioIOError
+
+    url = source_url(source)
+    try:
+        return rasterio.open(url)
+    except RasterioIOError as e:
+        if str(e) != "HTTP response code: 401":
+            raise
+        if not os.environ.get("D2S_API_KEY"):
+            raise PermissionError(
+                "Set the 'D2S_API_KEY' environment variable before reading rasters"
+            ) from e
+    try:
+        return rasterio.open(url + "?API_KEY=" + os.environ["D2S_API_KEY"])
+    except RasterioIOError as e:
+        if str(e) == "HTTP response code: 401":
+            raise PermissionError(
+                "You do not have permission to access this raster"
+            ) from e
+        raise
+
+
+def read_aligned(
+    source: Source,
+    grid: Grid,
+    bands: Optional[Sequence[int]] = None,
+    resampling: str = "bilinear",
+    out: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    """Read raster resampled to a grid. Only the parts of the raster covering the
+    grid are read, from the overview closest to the grid resolution.
+
+    Args:
+        source (Source): Data product, or URL or path of a raster.
+        grid (Grid): Target grid.
+        bands (Optional[Sequence[int]], optional): 1-based indexes of bands to
+            read. Defaults to all bands.
+        resampling (str, optional): rasterio resampling method (e.g., "nearest",
+            "bilinear", "average"). Defaults to "bilinear".
+        out (Optional[np.ndarray], optional): float32 array with shape (number
+            of bands, grid height, grid width) to read into, such as a slice of
+            a memory-mapped array.
+
+    Returns:
+        np.ndarray: float32 values with shape (bands, height, width). Nodata and
+            pixels outside the raster are NaN.
+    """
+    require_geo()
+
+    import rasterio
+
+    with rasterio.Env(**GDAL_READ_OPTIONS), open_raster(source) as dataset:
+        return read_dataset_aligned(dataset, grid, bands, resampling, out)
+
+
+def read_dataset_aligned(
+    dataset,
+    grid: Grid,
+    bands: Optional[Sequence[int]] = None,
+    resampling: str = "bilinear",
+    out: Optional["np.ndarray"] = None,
+) -> "np.ndarray":
+    """Read open raster resampled to a grid, like `read_aligned`, for callers
+    that already opened the raster (e.g., to check its band count or grid).
+
+    Args:
+        dataset (rasterio.DatasetReader): Open raster.
+        grid (Grid): Target grid.
+        bands (Optional[Sequence[int]], optional): 1-based indexes of bands to
+            read. Defaults to all bands.
+        resampling (str, optional): rasterio resampling method. Defaults to
+            "bilinear".
+        out (Optional[np.ndarray], optional): float32 array with shape (number
+            of bands, grid height, grid width) to read into.
+
+    Returns:
+        np.ndarray: float32 values with shape (bands, height, width). Nodata and
+            pixels outside the raster are NaN.
+    """
+    import numpy as np
+    from rasterio.enums import Resampling
+    from rasterio.vrt import WarpedVRT
+
+    indexes = list(bands) if bands else list(dataset.indexes)
+    if out is None:
+        out = np.empty((len(indexes), grid.height, grid.width), dtype=np.float32)
+    # Warped values are float32 with NaN for source nodata and for pixels
+    # outside the source, read straight into out
+    with WarpedVRT(
+        dataset,
+        crs=grid.crs,
+        transform=grid.transform,
+        width=grid.width,
+        height=grid.height,
+        resampling=Resampling[resampling],
+        dtype="float32",
+        nodata=np.nan,
+    ) as vrt:
+        vrt.read(indexes, out=out)
+    return out
+
+
+class RasterCube:
+    """Lazily read time × band × y × x stack of rasters aligned to a common grid.
+
+    Values are stored in a memory-mapped float32 array, so that stacks larger
+    than memory can be built and sliced. Time steps are read on first access,
+    in parallel, with one windowed warped read per raster. Nodata and pixels
+    outside a raster are NaN.
+
+    Requires: pip install d2spy[geo]
+    """
+
+    dims = ("time", "band", "y", "x")
+
+    def __init__(
+        self,
+        sources: Sequence[Source],
+        dates: Sequence[date],
+        grid: Grid,
+        bands: int,
+        band_names: Optional[Sequence[str]] = None,
+        resampling: str = "bilinear",
+        filename: Optional[str] = None,
+        workers: Optional[int] = None,
+    ):
+        """Constructor for RasterCube class.
+
+        Args:
+            sources (Sequence[Source]): Data product or raster of each time step.
+            dates (Sequence[date]): Acquisition date of each time step.
+            grid (Grid): Target grid.
+            bands (int): Number of bands. Time steps with fewer bands are NaN in
+                the remaining bands.
+            band_names (Optional[Sequence[str]], optional): Name of each band.
+                Defaults to "b1", "b2", ...
+            resampling (str, optional): rasterio resampling method. Defaults to
+                "bilinear".
+            filename (Optional[str], optional): File backing the array. Defaults
+                to a temporary file removed with the cube.
+            workers (Optional[int], optional): Number of rasters read at a time.
+                Defaults to the thread pool default.
+        """
+        require_geo()
+
+        import numpy as np
+
+        if len(sources) != len(dates):
+            raise ValueError("sources and dates must have the same length")
+
+        self.sources = list(sources)
+        self.dates = np.array(dates, dtype="datetime64[D]")
+        self.grid = grid
+        self.bands = list(band_names or [f"b{band + 1}" for band in range(bands)])
+        self.resampling = resampling
+        self.filename = filename
+        self.workers = workers
+        self._data: Optional["np.ndarray"] = None
+        self._loaded = np.zeros(len(self.sources), dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.sources)
+
+    def __repr__(self) -> str:
+        return (
+            f"RasterCube(shape={self.shape}, dates={len(self.dates)}, "
+            f"bands={self.bands!r}, crs={self.grid.crs.to_string()!r}, "
+            f"resolution={self.grid.resolution!r}, loaded={int(self._loaded.sum())})"
+        )
+
+    @property
+    def shape(self) -> tuple:
+        """Shape (time, band, y, x) of the cube."""
+        return (len(self.sources), len(self.bands), self.grid.height, self.grid.width)
+
+    @property
+    def x(self) -> "np.ndarray":
+        """X coordinates of pixel centers in grid CRS."""
+        return self.grid.x
+
+    @property
+    def y(self) -> "np.ndarray":
+        """Y coordinates of pixel centers in grid CRS."""
+        return self.grid.y
+
+    @property
+    def data(self) -> "np.ndarray":
+        """Memory-mapped array of every time step, read on first access."""
+        self.load()
+        return self._array()
+
+    def _array(self) -> "np.ndarray":
+        if self._data is None:
+            import numpy as np
+
+            filename = self.filename
+            if filename is None:
+                descriptor, filename = tempfile.mkstemp(
+                    prefix="d2spy_cube_", suffix=".dat"
+                )
+                os.close(descriptor)
+                weakref.finalize(self, _remove, filename)
+            self._data = np.memmap(
+                filename, dtype=np.float32, mode="w+", shape=self.shape
+            )
+        return self._data
+
+    def load(self, times: Optional[Iterable[int]] = None) -> "RasterCube":
+        """Read time steps that have not been read yet.
+
+        Args:
+            times (Optional[Iterable[int]], optional): Positions of time steps to
+                read. Defaults to all.
+
+        Returns:
+            RasterCube: This cube.
+        """
+        import numpy as np
+        import rasterio
+
+        positions = range(len(self)) if times is None else times
+        missing = sorted({int(p) for p in positions if not self._loaded[int(p)]})
+        if not missing:
+            return self
+
+        data = self._array()
+
+        def read(position: int) -> None:
+            source = self.sources[position]
+            with rasterio.Env(**GDAL_READ_OPTIONS), open_raster(source) as dataset:
+                count = min(dataset.count, len(self.bands))
+                data[position, count:] = np.nan
+                read_dataset_aligned(
+                    dataset,
+                    self.grid,
+                    bands=range(1, count + 1),
+                    resampling=self.resampling,
+                    out=data[position, :count],
+                )
+            self._loaded[position] = True
+
+        if len(missing) == 1 or self.workers == 1:
+            for position in missing:
+                read(position)
+        else:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                # Consume results to raise errors from reads
+                list(pool.map(read, missing))
+        return self
+
+    def __getitem__(self, key) -> "np.ndarray":
+        """Returns values at key, reading only the time steps it selects."""
+        import numpy as np
+
+        time_key = key[0] if isinstance(key, tuple) else key
+        if time_key is Ellipsis:
+            times: Iterable[int] = range(len(self))
+        else:
+            times = np.arange(len(self))[time_key]
+        self.load(np.atleast_1d(np.asarray(times)))
+        return self._array()[key]
+
+    def __array__(self, dtype=None, copy=None) -> "np.ndarray":
+        import numpy as np
+
+        return np.asarray(self.data, dtype=dtype)
+
+    def time_index(self, day: date) -> int:
+        """Returns position of the time step acquired on a date.
+
+        Args:
+            day (date): Acquisition date.
+
+        Raises:
+            KeyError: Raised if no time step was acquired on the date.
+
+        Returns:
+            int: Position of time step.
+        """
+        import numpy as np
+
+        matches = np.flatnonzero(self.dates == np.datetime64(day, "D"))
+        if len(matches) == 0:
+            raise KeyError(f"No time step acquired on {day}")
+        return int(matches[0])
+
+
+def _remove(filename: str) -> None:
+    try:
+        os.remove(filename)
+    except OSError:
+        # Still mapped (Windows), left in the temporary directory
+        pass
+
+
+def band_count(data_product: "DataProduct") -> int:
+    """Returns number of bands of a data product from its STAC properties,
+    without opening the raster.
+    """
+    stac_properties = data_product.stac_properties or {}
+    for bands in (stac_properties.get("eo"), stac_properties.get("raster")):
+        if isinstance(bands, list) and bands:
+            return len(bands)
+    return 1
+
+
+def band_names(data_products: List["DataProduct"], bands: int) -> List[str]:
+    """Returns band descriptions of the data product with the most bands, or
+    "b1", "b2", ... if they are not known.
+    """
+    for data_product in data_products:
+        eo = (data_product.stac_properties or {}).get("eo")
+        if isinstance(eo, list) and len(eo) == bands:
+            return [
+                band.get("description") or band.get("name") or f"b{index + 1}"
+                for index, band in enumerate(eo)
+            ]
+    return [f"b{band + 1}" for band in range(bands)]
@@ -0,0 +1,372 @@
+"""
+Canopy height models and hillshades computed locally.
+
+The DSM and DTM are aligned to the output grid and processed block by block,
+with a margin of pixels around each block for the neighborhood operations, so
+that memory use depends on the block size and not on the size of the mosaics.
+Results are written as tiled, compressed Cloud Optimized GeoTIFFs.
+
+Requires: pip install d2spy[geo]
+"""
+
+import math
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, Optional, Tuple
+
+from d2spy.extras.geo import require_geo
+from d2spy.extras.raster import (
+    GDAL_READ_OPTIONS,
+    Grid,
+    Source,
+    open_raster,
+    read_aligned,
+)
+from d2spy.utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Pixels per side of the blocks that are read, processed, and written at a time
+BLOCK_SIZE = 1024
+# Nodata value of canopy height models
+NODATA = -9999.0
+
+logger = get_logger(__name__)
+
+
+def percentile_filter(
+    array: "np.ndarray", percentile: float, size: int = 3
+) -> "np.ndarray":
+    """Returns percentile of the values in a size × size window around each
+    pixel. NaN values are ignored. A percentile of 100 fills pits in canopy
+    height models (e.g., gaps between leaves) with the highest neighbor.
+
+    Args:
+        array (np.ndarray): 2D array.
+        percentile (float): Percentile between 0 and 100.
+        size (int, optional): Odd window size in pixels. Defaults to 3.
+
+    Raises:
+        ValueError: Raised if size is not a positive odd number or the
+            percentile is out of range.
+
+    Returns:
+        np.ndarray: Filtered array.
+    """
+    import numpy as np
+
+    if size < 1 or size % 2 == 0:
+        raise ValueError("size must be a positive odd number")
+    if not 0 <= percentile <= 100:
+        raise ValueError("percentile must be between 0 and 100")
+    if size == 1:
+        return array.copy()
+
+    margin = size // 2
+    padded = np.pad(array, margin, mode="constant", constant_values=np.nan)
+    if percentile == 100:
+        # Running maximum over shifted views is much faster than sorting
+        return _reduce_windows(np.fmax, padded, array.shape, size)
+    if percentile == 0:
+        return _reduce_windows(np.fmin, padded, array.shape, size)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, (size, size))
+    # Sorting puts NaN values last, so the valid values of each window come first
+    values = np.sort(windows.reshape(*array.shape, size * size), axis=-1)
+    counts = size * size - np.isnan(values).sum(axis=-1)
+    rank = np.maximum(counts - 1, 0) * (percentile / 100)
+    low = np.floor(rank).astype(np.intp)
+    high = np.minimum(low + 1, np.maximum(counts - 1, 0))
+    fraction = (rank - low).astype(array.dtype)
+    low_values = np.take_along_axis(values, low[..., np.newaxis], axis=-1)[..., 0]
+    high_values = np.take_along_axis(values, high[..., np.newaxis], axis=-1)[..., 0]
+    # Windows without valid values are NaN
+    return low_values + (high_values - low_values) * fraction
+
+
+def _reduce_windows(
+    function: Callable, padded: "np.ndarray", shape: Tuple[int, int], size: int
+) -> "np.ndarray":
+    height, width = shape
+    result = padded[:height, :width].copy()
+    for row in range(size):
+        bottom = row + height
+        for col in range(size):
+            right = col + width
+            function(result, padded[row:bottom, col:right], out=result)
+    return result
+
+
+def hillshade(
+    array: "np.ndarray",
+    resolution: float,
+    azimuth: float = 315.0,
+    altitude: float = 45.0,
+    z_factor: float = 1.0,
+) -> "np.ndarray":
+    """Returns hillshade of an elevation array, computed like gdaldem hillshade
+    (Horn's method). Edge pixels and pixels next to NaN values are NaN.
+
+    Args:
+        array (np.ndarray): 2D elevation array.
+        resolution (float): Pixel size in the units of the elevations.
+        azimuth (float, optional): Direction of the light source in degrees
+            clockwise from north. Defaults to 315.
+        altitude (float, optional): Angle of the light source above the horizon
+            in degrees. Defaults to 45.
+        z_factor (float, optional): Vertical exaggeration. Defaults to 1.
+
+    Returns:
+        np.ndarray: Illumination between 0 and 255 as float32.
+    """
+    import numpy as np
+
+    shade = np.full(array.shape, np.nan, dtype=np.float32)
+    if min(array.shape) < 3:
+        return shade
+
+    z = array.astype(np.float64) * z_factor
+    # Neighbors of the interior pixels, named by their position in the window
+    a, b, c = z[:-2, :-2], z[:-2, 1:-1], z[:-2, 2:]
+    d, f = z[1:-1, :-2], z[1:-1, 2:]
+    g, h, i = z[2:, :-2], z[2:, 1:-1], z[2:, 2:]
+    dz_dx = ((c + 2 * f + i) - (a + 2 * d + g)) / (8 * resolution)
+    dz_dy = ((g + 2 * h + i) - (a + 2 * b + c)) / (8 * resolution)
+
+    zenith = math.radians(90 - altitude)
+    # Azimuth in mathematical angle (counterclockwise from east)
+    azimuth_math = math.radians((360 - azimuth + 90) % 360)
+    slope = np.arctan(np.hypot(dz_dx, dz_dy))
+    aspect = np.arctan2(dz_dy, -dz_dx)
+    value = 255 * (
+        math.cos(zenith) * np.cos(slope)
+        + math.sin(zenith) * np.sin(slope) * np.cos(azimuth_math - aspect)
+    )
+    shade[1:-1, 1:-1] = np.clip(value, 0, 255)
+    return shade
+
+
+def output_grid(dataset, resolution: Optional[float] = None) -> Grid:
+    """Returns grid covering a dataset in its coordinate system, at its own
+    resolution or resampled to `resolution`.
+    """
+    from rasterio.transform import from_origin
+
+    if resolution is None:
+        return Grid(dataset.crs, dataset.transform, dataset.width, dataset.height)
+    left, bottom, right, top = dataset.bounds
+    left = math.floor(left / resolution) * resolution
+    top = math.ceil(top / resolution) * resolution
+    width = max(math.ceil((right - left) / resolution), 1)
+    height = max(math.ceil((top - bottom) / resolution), 1)
+    return Grid(
+        dataset.crs, from_origin(left, top, resolution, resolution), width, height
+    )
+
+
+def iter_blocks(
+    grid: Grid, block_size: int = BLOCK_SIZE
+) -> Iterator[Tuple[int, int, int, int]]:
+    """Yields (column offset, row offset, width, height) of the blocks of a
+    grid, row by row.
+    """
+    for row in range(0, grid.height, block_size):
+        for col in range(0, grid.width, block_size):
+            yield (
+                col,
+                row,
+                min(block_size, grid.width - col),
+                min(block_size, grid.height - row),
+            )
+
+
+def block_grid(grid: Grid, block: Tuple[int, int, int, int], margin: int = 0) -> Grid:
+    """Returns grid of a block extended by `margin` pixels on each side."""
+    from affine import Affine
+
+    col, row, width, height = block
+    return Grid(
+        grid.crs,
+        grid.transform * Affine.translation(col - margin, row - margin),
+        width + 2 * margin,
+        height + 2 * margin,
+    )
+
+
+def _ordered_map(
+    function: Callable, items: Iterable, workers: Optional[int]
+) -> Iterator:
+    """Map function over items in a thread pool, yielding results in order with
+    at most twice the number of workers results pending, so that finished
+    blocks do not pile up in memory while they wait to be written.
+    """
+    if workers == 1:
+        yield from map(function, items)
+        return
+    # Default number of threads of ThreadPoolExecutor
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        limit = 2 * workers
+        pending: deque = deque()
+        for item in items:
+            pending.append(pool.submit(function, item))
+            if len(pending) >= limit:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def canopy_height_model(
+    dsm: Source,
+    dtm: Source,
+    out_raster: str,
+    resolution: Optional[float] = None,
+    percentile: Optional[float] = None,
+    window_size: int = 3,
+    min_height: Optional[float] = 0.0,
+    hillshade_raster: Optional[str] = None,
+    block_size: int = BLOCK_SIZE,
+    workers: Optional[int] = None,
+) -> str:
+    """Compute canopy height model (DSM − DTM) and write it to a Cloud Optimized
+    GeoTIFF. The DTM is aligned to the grid of the DSM (or the DSM and DTM to a
+    grid with pixel size `resolution`) with windowed warped reads, one block at
+    a time, so multi-GB mosaics are processed with bounded memory.
+
+    Requires: pip install d2spy[geo]
+
+    Args:
+        dsm (Source): DSM data product, or URL or path of a DSM.
+        dtm (Source): DTM (bare earth) data product, or URL or path of a DTM.
+        out_raster (str): Path for output canopy height model.
+        resolution (Optional[float], optional): Pixel size in units of the DSM
+            coordinate system. Defaults to the DSM resolution.
+        percentile (Optional[float], optional): Replace each height with this
+            percentile of the heights in a window around it, e.g., 100 to fill
+            pits or 50 to remove noise. Defaults to None (no filtering).
+        window_size (int, optional): Odd window size of the percentile filter in
+            pixels. Defaults to 3.
+        min_height (Optional[float], optional): Heights below this value (e.g.,
+            negative heights from DTM errors) are set to it. Defaults to 0.
+        hillshade_raster (Optional[str], optional): Path for a hillshade of the
+            DSM, written on the same grid. Defaults to None.
+        block_size (int, optional): Pixels per side of the blocks processed at a
+            time. Defaults to 1024.
+        workers (Optional[int], optional): Number of blocks processed at a time.
+            Defaults to the thread pool default.
+
+    Returns:
+        str: Path of canopy height model.
+    """
+    require_geo()
+
+    import numpy as np
+    import rasterio
+    from rasterio.windows import Window
+
+    if percentile is not None and window_size > 1:
+        # Fail before any block is read
+        percentile_filter(np.zeros((1, 1), dtype=np.float32), percentile, window_size)
+
+    with rasterio.Env(**GDAL_READ_OPTIONS), open_raster(dsm) as dataset:
+        grid = output_grid(dataset, resolution)
+
+    # Pixels around each block needed by the percentile filter and hillshade
+    margin = max(window_size // 2 if percentile is not None else 0, 1)
+
+    def process(block: Tuple[int, int, int, int]):
+        extended = block_grid(grid, block, margin)
+        surface = read_aligned(dsm, extended, bands=[1])[0]
+        terrain = read_aligned(dtm, extended, bands=[1])[0]
+        heights = surface - terrain
+        if min_height is not None:
+            np.maximum(heights, min_height, out=heights)
+        if percentile is not None:
+            filtered = percentile_filter(heights, percentile, window_size)
+            # Keep nodata where there is no DSM or DTM
+            heights = np.where(np.isnan(heights), np.nan, filtered)
+        inner = (slice(margin, -margin), slice(margin, -margin))
+        shade = (
+            hillshade(surface, grid.resolution)[inner]
+            if hillshade_raster is not None
+            else None
+        )
+        return block, heights[inner], shade
+
+    directory = os.path.dirname(os.path.abspath(out_raster))
+    os.makedirs(directory, exist_ok=True)
+    profile = {
+        "driver": "GTiff",
+        "crs": grid.crs,
+        "transform": grid.transform,
+        "width": grid.width,
+        "height": grid.height,
+        "count": 1,
+        "tiled": True,
+        "blockxsize": 512,
+        "blockysize": 512,
+        # Intermediate rasters are copied to COGs, so favor speed over size
+        "compress": "zstd",
+        "zstd_level": 1,
+        "BIGTIFF": "IF_SAFER",
+    }
+    with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+        chm_path = os.path.join(temp_dir, "chm.tif")
+        shade_path = os.path.join(temp_dir, "hillshade.tif")
+        with rasterio.Env(**GDAL_READ_OPTIONS):
+            chm_dataset = rasterio.open(
+                chm_path, "w", dtype="float32", nodata=NODATA, **profile
+            )
+            shade_dataset = (
+                rasterio.open(shade_path, "w", dtype="uint8", nodata=0, **profile)
+                if hillshade_raster is not None
+                else None
+            )
+            try:
+                for block, heights, shade in _ordered_map(
+                    process, iter_blocks(grid, block_size), workers
+                ):
+                    window = Window(*block)
+                    chm_dataset.write(
+                        np.where(np.isnan(heights), NODATA, heights).astype("float32"),
+                        1,
+                        window=window,
+                    )
+                    if shade_dataset is not None:
+                        # 0 is nodata, so shaded pixels are at least 1
+                        shade = np.where(
+                            np.isnan(shade), 0, np.clip(np.round(shade), 1, 255)
+                        )
+                        shade_dataset.write(shade.astype("uint8"), 1, window=window)
+            finally:
+                chm_dataset.close()
+                if shade_dataset is not None:
+                    shade_dataset.close()
+
+            write_cog(chm_path, out_raster)
+            if hillshade_raster is not None:
+                write_cog(shade_path, hillshade_raster)
+
+    logger.info("Canopy height model computed successfully")
+    return out_raster
+
+
+def write_cog(in_raster: str, out_raster: str) -> None:
+    """Copy raster to a tiled, compressed Cloud Optimized GeoTIFF with overviews.
+    The raster is copied block by block.
+    """
+    from rasterio.shutil import copy
+
+    copy(
+        in_raster,
+        out_raster,
+        driver="COG",
+        compress="zstd",
+        predictor="YES",
+        blocksize=512,
+        overview_resampling="average",
+        num_threads="ALL_CPUS",
+        BIGTIFF="IF_SAFER",
+    )
@@ -8,9 +8,9 @@ For geospatial utilities, see d2spy.extras.geo (requires d2spy[geo]).
 import json
 import os
 import shutil
+from fnmatch import fnmatchcase
 from http import HTTPStatus
-from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from requests import Response
 
@@ -90,24 +90,122 @@ def find_files(folder: str, types: List[str]) -> List[str]:
     Returns:
         List[str]: List of matched files.
     """
-    images = []
-    max_depth = 7
-    # get current depth level relative to root
-    root_depth = folder.rstrip(os.path.sep).count(os.path.sep)
-
-    for path, _, files in os.walk(folder):
-        # get depth of current path relative to root depth
-        current_depth = path.count(os.path.sep) - root_depth
-
-        if current_depth < max_depth:
-            for file in files:
-                if Path(file).suffix.lower() in types:
-                    images.append(os.path.join(path, file))
-        else:
-            # remove remaining folders to stop os.walk
-            del _[:]
-
-    return images
+    return list(iter_files(folder, types, max_depth=7))
+
+
+def iter_files(
+    folder: str,
+    types: Optional[Iterable[str]] = None,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    max_depth: Optional[int] = None,
+    workers: int = 1,
+) -> Iterator[str]:
+    """Walks down a folder and its subfolders yielding matched files as they
+    are found. Directories are listed with os.scandir, which returns the file
+    type with each entry, so that no file is stat-ed. Symbolic links to
+    folders are not followed, and folders that can not be listed are skipped.
+
+    Args:
+        folder (str): Folder with files.
+        types (Optional[Iterable[str]], optional): File extensions to match
+            (e.g., [".jpg", ".tif"]), case-insensitive. Defaults to all files,
+            and an empty list matches no files.
+        include (Optional[Iterable[str]], optional): Glob patterns, at least one
+            of which files must match. Patterns are matched against the path
+            relative to folder with "/" separators, and patterns without "/"
+            also against the file name (e.g., "flight_1/*" or "DJI_*").
+        exclude (Optional[Iterable[str]], optional): Glob patterns of files and
+            folders to skip, matched like `include`. Excluded folders are not
+            listed.
+        max_depth (Optional[int], optional): Number of folder levels listed,
+            where 1 lists only folder itself. Defaults to no limit.
+        workers (int, optional): Number of threads listing folders. With more
+            than one, folders are listed in parallel, which is much faster on
+            network filesystems, and files are yielded in the order their
+            folders are listed. Defaults to 1.
+
+    Returns:
+        Iterator[str]: Paths of matched files. The folder is listed as the
+            iterator is consumed.
+    """
+    # None matches all files, an empty list of types matches none
+    suffixes = tuple(suffix.lower() for suffix in types) if types is not None else None
+    includes = list(include) if include is not None else []
+    excludes = list(exclude) if exclude is not None else []
+
+    def matches(relpath: str, name: str, patterns: List[str]) -> bool:
+        return any(
+            fnmatchcase(relpath, pattern)
+            or "/" not in pattern
+            and fnmatchcase(name, pattern)
+            for pattern in patterns
+        )
+
+    def scan(directory: str, prefix: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """List directory, returning matched files and subfolders to list."""
+        files = []
+        subfolders = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    relpath = prefix + name
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if excludes and matches(relpath, name, excludes):
+                        continue
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subfolders.append((entry.path, relpath + "/"))
+                    elif (suffixes is None or name.lower().endswith(suffixes)) and (
+                        not includes or matches(relpath, name, includes)
+                    ):
+                        files.append(entry.path)
+        except OSError:
+            pass
+        return files, subfolders
+
+    if workers > 1:
+        return _iter_files_parallel(scan, folder, max_depth, workers)
+    return _iter_files_serial(scan, folder, max_depth)
+
+
+def _iter_files_serial(scan, folder: str, max_depth: Optional[int]) -> Iterator[str]:
+    # Depth first, in the order of os.walk
+    stack = [(folder, "", 1)]
+    while stack:
+        directory, prefix, depth = stack.pop()
+        files, subfolders = scan(directory, prefix)
+        yield from files
+        if max_depth is None or depth < max_depth:
+            stack.extend(
+                (path, relpath, depth + 1) for path, relpath in reversed(subfolders)
+            )
+
+
+def _iter_files_parallel(
+    scan, folder: str, max_depth: Optional[int], workers: int
+) -> Iterator[str]:
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        pending = {pool.submit(scan, folder, ""): 1}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                depth = pending.pop(future)
+                files, subfolders = future.result()
+                if max_depth is None or depth < max_depth:
+                    for path, relpath in subfolders:
+                        pending[pool.submit(scan, path, relpath)] = depth + 1
+                yield from files
+    finally:
+        # Stop listing folders if the iterator is closed early
+        pool.shutdown(wait=True, cancel_futures=True)
 
 
 # Re-export geo utilities for backwards compatibility
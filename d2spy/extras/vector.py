@@ -0,0 +1,138 @@
+"""
+Streaming readers for vector files.
+
+Features are read in batches and yielded one at a time as GeoJSON Feature dicts
+in WGS84, so that layers of any size can be processed with bounded memory.
+GeoJSON files are read without optional dependencies. GeoPackage and Shapefile
+require d2spy[geo], and GeoParquet also requires d2spy[arrow].
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, Optional
+
+from d2spy.extras.geo import require_geo
+from d2spy.json_stream import iter_json
+
+GEOJSON_EXTENSIONS = (".geojson", ".json")
+OGR_EXTENSIONS = (".gpkg", ".shp", ".zip")
+PARQUET_EXTENSIONS = (".parquet", ".geoparquet")
+
+# Bytes of GeoJSON read at a time
+READ_SIZE = 1024 * 1024
+
+
+def _extension(filepath: str) -> str:
+    return os.path.splitext(filepath)[1].lower()
+
+
+def _require_geoparquet() -> None:
+    from d2spy.extras.columnar import require_arrow
+
+    require_geo()
+    require_arrow()
+
+
+def count_features(filepath: str) -> Optional[int]:
+    """Returns number of features in vector file, or None if it can not be
+    determined without reading the whole file (GeoJSON).
+
+    Args:
+        filepath (str): Path to vector file.
+
+    Returns:
+        Optional[int]: Number of features.
+    """
+    extension = _extension(filepath)
+    if extension in OGR_EXTENSIONS:
+        require_geo()
+        import pyogrio
+
+        return pyogrio.read_info(filepath)["features"]
+    if extension in PARQUET_EXTENSIONS:
+        _require_geoparquet()
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(filepath).metadata.num_rows
+    return None
+
+
+def iter_features(filepath: str, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+    """Returns iterator over features of a GeoJSON, GeoPackage, Shapefile, or
+    GeoParquet file as GeoJSON Feature dicts in WGS84. At most `batch_size`
+    features are held in memory at a time.
+
+    Args:
+        filepath (str): Path to vector file. Zipped Shapefiles are supported.
+        batch_size (int, optional): Features read at a time. Defaults to 1000.
+
+    Raises:
+        FileNotFoundError: Raised if the file does not exist.
+        ImportError: Raised if the optional dependencies for the format are
+            missing.
+        ValueError: Raised if the file format is not supported.
+
+    Returns:
+        Iterator[Dict[str, Any]]: GeoJSON Features. The file is checked when
+            called, and read as the iterator is consumed.
+    """
+    if not os.path.exists(filepath):
+        raise FileNotFoundError(f"Vector file not found: {filepath}")
+
+    extension = _extension(filepath)
+    if extension in GEOJSON_EXTENSIONS:
+        return _iter_geojson(filepath)
+    elif extension in OGR_EXTENSIONS:
+        require_geo()
+        return _iter_ogr(filepath, batch_size)
+    elif extension in PARQUET_EXTENSIONS:
+        _require_geoparquet()
+        return _iter_geoparquet(filepath, batch_size)
+    else:
+        raise ValueError(
+            f"Unsupported vector file extension '{extension}'. Must be one of: "
+            + ", ".join(GEOJSON_EXTENSIONS + OGR_EXTENSIONS + PARQUET_EXTENSIONS)
+        )
+
+
+def _iter_geojson(filepath: str) -> Iterator[Dict[str, Any]]:
+    # GeoJSON coordinates are WGS84 (RFC 7946)
+    with open(filepath, "rb") as geojson_file:
+        chunks = iter(lambda: geojson_file.read(READ_SIZE), b"")
+        yield from iter_json(chunks, "features.item")
+
+
+def _iter_ogr(filepath: str, batch_size: int) -> Iterator[Dict[str, Any]]:
+    import pyogrio
+
+    total = pyogrio.read_info(filepath)["features"]
+    for offset in range(0, total, batch_size):
+        gdf = pyogrio.read_dataframe(
+            filepath, skip_features=offset, max_features=batch_size
+        )
+        yield from _iter_gdf(gdf)
+
+
+def _iter_geoparquet(filepath: str, batch_size: int) -> Iterator[Dict[str, Any]]:
+    import geopandas as gpd
+    import pyarrow.parquet as pq
+    import shapely
+
+    parquet_file = pq.ParquetFile(filepath)
+    metadata = json.loads(parquet_file.schema_arrow.metadata[b"geo"])
+    column = metadata["primary_column"]
+    # CRS is PROJJSON, defaulting to WGS84 if omitted (GeoParquet spec)
+    crs = metadata["columns"][column].get("crs", "OGC:CRS84")
+    if isinstance(crs, dict):
+        crs = json.dumps(crs)
+
+    for batch in parquet_file.iter_batches(batch_size=batch_size):
+        df = batch.to_pandas()
+        geometry = shapely.from_wkb(df.pop(column))
+        yield from _iter_gdf(gpd.GeoDataFrame(df, geometry=geometry, crs=crs))
+
+
+def _iter_gdf(gdf) -> Iterator[Dict[str, Any]]:
+    if gdf.crs is not None and gdf.crs.to_epsg() != 4326 and gdf.crs != "OGC:CRS84":
+        gdf = gdf.to_crs(epsg=4326)
+    yield from gdf.iterfeatures(na="null", drop_id=True)
@@ -0,0 +1,349 @@
+"""
+Per-plot statistics of data product rasters computed locally.
+
+Plots are rasterized once per grid into a label array whose pixels are sorted
+by plot, so that every statistic of every plot is computed with a few
+vectorized reductions over the raster instead of one masked read per plot.
+Rasters that share a grid (e.g., all flights resampled to a common grid) share
+the rasterization.
+
+Requires: pip install d2spy[geo]
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from d2spy.extras.geo import require_geo
+from d2spy.extras.raster import (
+    GDAL_READ_OPTIONS,
+    Grid,
+    Source,
+    open_raster,
+    read_dataset_aligned,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+STATISTICS = ("count", "sum", "mean", "std", "min", "max", "median")
+# Percentiles are named "p" followed by the percentile (e.g., "p95")
+PERCENTILE = re.compile(r"p(\d+(?:\.\d+)?)$")
+
+SERIES_COLUMNS = ["plot_id", "acquisition_date", "stat", "value"]
+
+
+def validate_stats(stats: Sequence[str]) -> List[str]:
+    """Returns statistics if they are supported.
+
+    Args:
+        stats (Sequence[str]): Statistic names.
+
+    Raises:
+        ValueError: Raised if a statistic is not supported.
+
+    Returns:
+        List[str]: Statistic names.
+    """
+    for stat in stats:
+        match = PERCENTILE.match(stat)
+        if stat not in STATISTICS and not (match and float(match.group(1)) <= 100):
+            raise ValueError(
+                f"Unsupported statistic {stat!r}. Must be one of: "
+                + ", ".join(STATISTICS)
+                + ", or a percentile such as 'p95'"
+            )
+    return list(stats)
+
+
+def plot_id(feature: Dict[str, Any], index: int, id_property: Optional[str]) -> Any:
+    """Returns ID of a plot feature: the `id_property` of the feature (or of the
+    attributes of a D2S map layer feature), the D2S feature ID, or the position
+    of the feature.
+    """
+    properties = feature.get("properties") or {}
+    if id_property is not None:
+        if id_property in properties:
+            return properties[id_property]
+        attributes = properties.get("properties")
+        if isinstance(attributes, dict) and id_property in attributes:
+            return attributes[id_property]
+        raise KeyError(f"Feature {index} has no {id_property!r} property")
+    return properties.get("id", feature.get("id", index))
+
+
+class Zones:
+    """Plots rasterized to a grid, with pixel positions sorted by plot."""
+
+    def __init__(
+        self, geometries: Sequence[Any], grid: Grid, all_touched: bool = False
+    ):
+        """Constructor for Zones class.
+
+        Args:
+            geometries (Sequence[Any]): Shapely geometries of plots in grid CRS.
+                Pixels covered by overlapping plots belong to the last plot.
+            grid (Grid): Grid of the rasters.
+            all_touched (bool, optional): Include every pixel touched by a plot
+                instead of the pixels whose center is within the plot. Defaults
+                to False.
+        """
+        import numpy as np
+        from rasterio.features import rasterize
+
+        self.count = len(geometries)
+        shapes = [
+            (geometry, index + 1)
+            for index, geometry in enumerate(geometries)
+            if geometry is not None and not geometry.is_empty
+        ]
+        labels = np.zeros((grid.height, grid.width), dtype=np.int32)
+        if shapes:
+            rasterize(
+                shapes,
+                out=labels,
+                transform=grid.transform,
+                all_touched=all_touched,
+            )
+        pixel_labels = labels.ravel()
+        order = np.argsort(pixel_labels, kind="stable")
+        # Skip pixels outside every plot (label 0)
+        first = int(np.searchsorted(pixel_labels[order], 1))
+        self.pixels = order[first:]
+        self.labels = pixel_labels[self.pixels]
+
+    def statistics(
+        self, values: "np.ndarray", stats: Sequence[str]
+    ) -> Dict[str, "np.ndarray"]:
+        """Returns statistics of each plot. NaN values are ignored, and
+        statistics of plots without values are NaN (count is 0).
+
+        Args:
+            values (np.ndarray): Raster values on the grid with shape (height,
+                width).
+            stats (Sequence[str]): Statistic names.
+
+        Returns:
+            Dict[str, np.ndarray]: Value of each statistic for each plot, in plot
+                order.
+        """
+        import numpy as np
+
+        plot_values = values.ravel()[self.pixels]
+        valid = ~np.isnan(plot_values)
+        plot_values = plot_values[valid].astype(np.float64)
+        labels = self.labels[valid]
+
+        counts = np.bincount(labels, minlength=self.count + 1)[1:]
+        present = np.flatnonzero(counts)
+        starts = np.concatenate(([0], np.cumsum(counts[present])[:-1]))
+
+        results: Dict[str, "np.ndarray"] = {}
+
+        def reduce(function, array: "np.ndarray") -> "np.ndarray":
+            result = np.full(self.count, np.nan)
+            if len(present):
+                result[present] = function.reduceat(array, starts)
+            return result
+
+        sums = reduce(np.add, plot_values)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means = sums / counts
+        for stat in stats:
+            if stat == "count":
+                results[stat] = counts.astype(np.float64)
+            elif stat == "sum":
+                results[stat] = sums
+            elif stat == "mean":
+                results[stat] = means
+            elif stat == "std":
+                deviations = plot_values - np.repeat(means[present], counts[present])
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    results[stat] = np.sqrt(
+                        reduce(np.add, deviations * deviations) / counts
+                    )
+            elif stat == "min":
+                results[stat] = reduce(np.minimum, plot_values)
+            elif stat == "max":
+                results[stat] = reduce(np.maximum, plot_values)
+
+        percentiles: Dict[str, float] = {}
+        for stat in stats:
+            match = PERCENTILE.match(stat)
+            if stat == "median":
+                percentiles[stat] = 50.0
+            elif match:
+                percentiles[stat] = float(match.group(1))
+        if percentiles:
+            # Sort values within each plot, then interpolate linearly between
+            # the closest ranks like np.percentile
+            sorted_values = plot_values[np.lexsort((plot_values, labels))]
+            present_counts = counts[present]
+            for stat, percentile in percentiles.items():
+                result = np.full(self.count, np.nan)
+                if len(present):
+                    rank = (present_counts - 1) * percentile / 100
+                    low = np.floor(rank).astype(np.int64)
+                    high = np.minimum(low + 1, present_counts - 1)
+                    fraction = rank - low
+                    result[present] = (
+                        sorted_values[starts + low] * (1 - fraction)
+                        + sorted_values[starts + high] * fraction
+                    )
+                results[stat] = result
+        return results
+
+
+def native_grid(dataset, bounds: Tuple[float, float, float, float]) -> Optional[Grid]:
+    """Returns grid of the pixels of a dataset covering bounds in WGS84, or None
+    if the dataset does not cover the bounds.
+    """
+    import math
+
+    from rasterio.warp import transform_bounds
+    from rasterio.windows import Window, from_bounds
+
+    window = from_bounds(
+        *transform_bounds("EPSG:4326", dataset.crs, *bounds),
+        transform=dataset.transform,
+    )
+    col_start = max(math.floor(window.col_off), 0)
+    row_start = max(math.floor(window.row_off), 0)
+    col_end = min(math.ceil(window.col_off + window.width), dataset.width)
+    row_end = min(math.ceil(window.row_off + window.height), dataset.height)
+    if col_end <= col_start or row_end <= row_start:
+        return None
+    window = Window(col_start, row_start, col_end - col_start, row_end - row_start)
+    return Grid(
+        dataset.crs,
+        dataset.window_transform(window),
+        int(window.width),
+        int(window.height),
+    )
+
+
+def extract_plot_series(
+    sources: Sequence[Tuple[date, Source]],
+    features: Iterable[Dict[str, Any]],
+    stats: Sequence[str] = ("mean",),
+    band: int = 1,
+    id_property: Optional[str] = None,
+    resolution: Optional[float] = None,
+    all_touched: bool = False,
+    workers: Optional[int] = None,
+) -> "pd.DataFrame":
+    """Returns statistics of every plot in every raster as a long table.
+
+    Rasters are read in parallel, each with one windowed read covering the
+    plots. Plots are rasterized once per distinct grid.
+
+    Args:
+        sources (Sequence[Tuple[date, Source]]): Acquisition date and data
+            product (or raster URL or path) of each flight.
+        features (Iterable[Dict[str, Any]]): GeoJSON Polygon Features of plots in
+            WGS84 (e.g., from `Project.iter_map_layer_features`).
+        stats (Sequence[str], optional): Statistics to compute: "count", "sum",
+            "mean", "std", "min", "max", "median", or percentiles such as
+            "p95". Defaults to ("mean",).
+        band (int, optional): 1-based index of band. Defaults to 1.
+        id_property (Optional[str], optional): Property holding the plot ID.
+            Defaults to the D2S feature ID.
+        resolution (Optional[float], optional): Resample every raster to a
+            common grid with this pixel size in meters (UTM zone of the plots),
+            so that plots are rasterized once. Defaults to the native grid of
+            each raster.
+        all_touched (bool, optional): Include every pixel touched by a plot.
+            Defaults to False (pixels whose center is within the plot).
+        workers (Optional[int], optional): Number of rasters read at a time.
+            Defaults to the thread pool default.
+
+    Raises:
+        ValueError: Raised if a statistic is not supported or there are no plots.
+
+    Returns:
+        pd.DataFrame: Columns plot_id, acquisition_date, stat, and value, with
+            one row per plot, raster, and statistic. Values of plots outside a
+            raster are NaN.
+    """
+    require_geo()
+
+    import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+    import rasterio
+    from shapely.geometry import shape
+
+    stats = validate_stats(stats)
+    features = list(features)
+    if not features:
+        raise ValueError("No plot features provided")
+
+    ids = [
+        plot_id(feature, index, id_property) for index, feature in enumerate(features)
+    ]
+    plots = gpd.GeoSeries(
+        [shape(feature["geometry"]) for feature in features], crs="EPSG:4326"
+    )
+    bounds = tuple(plots.total_bounds)
+    common_grid = Grid.from_geometry(bounds, resolution) if resolution else None
+
+    zones: Dict[Hashable, Zones] = {}
+    lock = threading.Lock()
+
+    def zones_for(grid: Grid) -> Zones:
+        key = (grid.crs.to_wkt(), tuple(grid.transform), grid.width, grid.height)
+        with lock:
+            if key not in zones:
+                zones[key] = Zones(
+                    list(plots.to_crs(grid.crs)), grid, all_touched=all_touched
+                )
+            return zones[key]
+
+    def summarize(source: Source) -> Dict[str, "np.ndarray"]:
+        with rasterio.Env(**GDAL_READ_OPTIONS), open_raster(source) as dataset:
+            grid = common_grid or native_grid(dataset, bounds)
+            if grid is None:
+                return {stat: np.full(len(ids), np.nan) for stat in stats}
+            values = read_dataset_aligned(
+                dataset,
+                grid,
+                bands=[band],
+                resampling="bilinear" if common_grid else "nearest",
+            )
+        return zones_for(grid).statistics(values[0], stats)
+
+    data_products = [source for _, source in sources]
+    if workers == 1 or len(data_products) <= 1:
+        results = [summarize(source) for source in data_products]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(summarize, data_products))
+
+    frames = [
+        pd.DataFrame(
+            {
+                "plot_id": ids,
+                "acquisition_date": day,
+                "stat": stat,
+                "value": result[stat],
+            }
+        )
+        for (day, _), result in zip(sources, results)
+        for stat in stats
+    ]
+    if not frames:
+        return pd.DataFrame(columns=SERIES_COLUMNS)
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,211 @@
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import MISSING, fields
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from d2spy.models.base import Model
+
+
+T = TypeVar("T", bound="Model")
+
+
+class IdentityMap:
+    """Per-workspace cache of model instances keyed by model type and ID.
+
+    Instances are held by weak references so that they are released once they
+    are no longer used. The most recently used instances are also held by
+    strong references, up to `max_size`, so that repeated lookups of the same
+    objects do not depend on the caller keeping them alive.
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """Constructor for IdentityMap class.
+
+        Args:
+            max_size (int, optional): Number of recently used instances kept
+                alive by the map. Defaults to 1024.
+        """
+        if max_size < 0:
+            raise ValueError("max_size must be zero or greater")
+
+        self.max_size = max_size
+        self._refs: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._recent: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: Tuple[str, Hashable]) -> bool:
+        return self.get(*key) is not None
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def get(self, kind: str, id: Hashable) -> Optional[Any]:
+        """Return cached instance for model type and ID if still alive.
+
+        Args:
+            kind (str): Model class name (e.g., "Flight").
+            id (Hashable): Model ID.
+
+        Returns:
+            Optional[Any]: Cached model instance or None.
+        """
+        key = (kind, str(id))
+        with self._lock:
+            instance = self._refs.get(key)
+            if instance is not None:
+                self._touch(key, instance)
+            return instance
+
+    def get_or_create(self, cls: Type[T], client, attrs: Dict[str, Any]) -> T:
+        """Return cached instance refreshed in place with `attrs` or create and
+        cache a new instance.
+
+        Args:
+            cls (Type[T]): Model class.
+            client (APIClient): Client passed to new instances.
+            attrs (Dict[str, Any]): Model attributes returned from API.
+
+        Returns:
+            T: Model instance.
+        """
+        if "id" not in attrs:
+            return cls(client, **attrs)
+
+        key = (cls.__name__, str(attrs["id"]))
+        with self._lock:
+            instance = self._refs.get(key)
+            if instance is None:
+                instance = cls(client, **attrs)
+                self._refs[key] = instance
+            else:
+                for name, value in attrs.items():
+                    setattr(instance, name, value)
+            self._touch(key, instance)
+            return instance
+
+    def discard(self, kind: str, id: Hashable) -> None:
+        """Remove instance from the map.
+
+        Args:
+            kind (str): Model class name (e.g., "Flight").
+            id (Hashable): Model ID.
+        """
+        key = (kind, str(id))
+        with self._lock:
+            self._refs.pop(key, None)
+            self._recent.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all instances from the map."""
+        with self._lock:
+            self._refs.clear()
+            self._recent.clear()
+
+    def _touch(self, key: Tuple[str, str], instance: Any) -> None:
+        """Mark instance as most recently used and evict the least recently used
+        strong references. Caller must hold the lock.
+        """
+        if self.max_size == 0:
+            return
+        self._recent[key] = instance
+        self._recent.move_to_end(key)
+        while len(self._recent) > self.max_size:
+            self._recent.popitem(last=False)
+
+
+def build_model(cls: Type[T], client, attrs: Dict[str, Any]) -> T:
+    """Create model instance, going through the client's identity map when one is
+    enabled.
+
+    Args:
+        cls (Type[T]): Model class.
+        client (APIClient): Client for the model instance.
+        attrs (Dict[str, Any]): Model attributes returned from API.
+
+    Returns:
+        T: New or cached model instance.
+    """
+    identity_map = getattr(client, "identity_map", None)
+    if identity_map is None:
+        return cls(client, **attrs)
+    return identity_map.get_or_create(cls, client, attrs)
+
+
+def build_models(
+    cls: Type[T], client, rows: Iterable[Dict[str, Any]], schema: type
+) -> List[T]:
+    """Create model instances directly from the rows of a list response in a
+    single pass, going through the client's identity map when one is enabled.
+    Rows are checked for the fields required by `schema` but are not converted
+    to schema instances, and date strings are parsed when first accessed.
+
+    Args:
+        cls (Type[T]): Model class.
+        client (APIClient): Client for the model instances.
+        rows (Iterable[Dict[str, Any]]): Rows returned from API.
+        schema (type): Schema dataclass describing each row.
+
+    Raises:
+        KeyError: Raised if a row is missing a required field.
+
+    Returns:
+        List[T]: New or cached model instances.
+    """
+    required = _required_fields(schema)
+    identity_map = getattr(client, "identity_map", None)
+    instances = []
+    for row in rows:
+        if not row.keys() >= required:
+            missing = ", ".join(sorted(required - row.keys()))
+            raise KeyError(f"{schema.__name__} row missing fields: {missing}")
+        if identity_map is None:
+            instances.append(cls.from_row(client, row))  # type: ignore
+        else:
+            instances.append(identity_map.get_or_create(cls, client, row))
+    return instances
+
+
+@lru_cache(maxsize=None)
+def _required_fields(schema: type) -> FrozenSet[str]:
+    """Schema fields without defaults that are not listed in the schema's
+    `optional_fields`."""
+    optional = getattr(schema, "optional_fields", ())
+    return frozenset(
+        field.name
+        for field in fields(schema)
+        if field.default is MISSING
+        and field.default_factory is MISSING
+        and field.name not in optional
+    )
+
+
+def get_cached(client, kind: str, id: Hashable) -> Optional[Any]:
+    """Return instance from the client's identity map if one is enabled.
+
+    Args:
+        client (APIClient): Client that may hold an identity map.
+        kind (str): Model class name (e.g., "Flight").
+        id (Hashable): Model ID.
+
+    Returns:
+        Optional[Any]: Cached model instance or None.
+    """
+    identity_map = getattr(client, "identity_map", None)
+    if identity_map is None:
+        return None
+    return identity_map.get(kind, id)
@@ -0,0 +1,314 @@
+import math
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Any, Deque, Dict, List, Literal, Optional, Tuple
+
+# OpenTelemetry is optional and imported when an exporter is created
+HAS_OTEL = find_spec("opentelemetry") is not None
+
+UUID_PATTERN = re.compile(
+    r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+)
+NUMBER_PATTERN = re.compile(r"/\d+(?=/|$)")
+# tus upload IDs are opaque hex strings appended to /files
+TUS_ID_PATTERN = re.compile(r"/files/[^/]+")
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def require_otel():
+    """Raise helpful error if OpenTelemetry is missing."""
+    if not HAS_OTEL:
+        raise ImportError(
+            "OpenTelemetry export requires additional dependencies.\n"
+            "Install with: pip install d2spy[otel]"
+        )
+
+
+@dataclass
+class RequestEvent:
+    """Describes a single request made by d2spy. Passed to every hook registered
+    with `APIClient.add_hook`.
+    """
+
+    # HTTP method (e.g., "GET")
+    method: str
+    # Endpoint with IDs replaced by "{id}" (e.g., "/api/v1/projects/{id}/flights")
+    endpoint: str
+    # HTTP status code, None if no response was received
+    status: Optional[int]
+    # Wall time in seconds
+    elapsed: float
+    # Size of request body in bytes, 0 if unknown
+    request_bytes: int = 0
+    # Size of response body in bytes as received, before a content coding such
+    # as gzip was decoded, 0 if unknown
+    response_bytes: int = 0
+    # Request was retried after its access token was refreshed
+    retry: bool = False
+    # Request refreshed the access token
+    refresh: bool = False
+    # "api" for D2S API requests, "upload" for tus upload chunks, "clip" for
+    # rasters read by DataProduct.clip
+    kind: Literal["api", "upload", "clip"] = "api"
+    # Exception name or message if the request failed without a status code
+    error: Optional[str] = None
+
+    @property
+    def failed(self) -> bool:
+        """True if the request raised an error or returned an error status."""
+        return self.error is not None or (
+            self.status is not None and self.status >= 400
+        )
+
+
+def endpoint_template(endpoint: str) -> str:
+    """Replace IDs in endpoint with "{id}" so that requests for different models
+    are grouped together. Query strings are removed.
+
+    Args:
+        endpoint (str): Endpoint or URL path.
+
+    Returns:
+        str: Endpoint template.
+    """
+    endpoint = endpoint.split("?", 1)[0]
+    endpoint = UUID_PATTERN.sub("{id}", endpoint)
+    endpoint = TUS_ID_PATTERN.sub("/files/{id}", endpoint)
+    return NUMBER_PATTERN.sub("/{id}", endpoint)
+
+
+def percentile(sorted_values: List[float], quantile: float) -> float:
+    """Returns nearest-rank percentile of sorted values.
+
+    Args:
+        sorted_values (List[float]): Values in ascending order.
+        quantile (float): Quantile between 0 and 1.
+
+    Returns:
+        float: Percentile value, or 0.0 if there are no values.
+    """
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(quantile * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+class EndpointStats:
+    """Request counts, sizes, and recent durations for one endpoint."""
+
+    def __init__(self, max_samples: int):
+        self.count = 0
+        self.errors = 0
+        self.retries = 0
+        self.refreshes = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.total_seconds = 0.0
+        self.statuses: Dict[str, int] = {}
+        # Percentiles are computed from the most recent durations
+        self.durations: Deque[float] = deque(maxlen=max_samples)
+
+    def add(self, event: RequestEvent) -> None:
+        self.count += 1
+        self.errors += event.failed
+        self.retries += event.retry
+        self.refreshes += event.refresh
+        self.request_bytes += event.request_bytes
+        self.response_bytes += event.response_bytes
+        self.total_seconds += event.elapsed
+        status = str(event.status) if event.status is not None else "none"
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        self.durations.append(event.elapsed)
+
+
+class MetricsAggregator:
+    """Hook that aggregates request events per endpoint.
+
+    Example:
+        metrics = MetricsAggregator()
+        workspace.client.add_hook(metrics)
+        ...
+        print(metrics.summary())
+        print(metrics.to_prometheus())
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        """Constructor for MetricsAggregator class.
+
+        Args:
+            max_samples (int, optional): Number of recent durations kept per
+                endpoint for percentiles. Defaults to 10000.
+        """
+        self.max_samples = max_samples
+        self._stats: Dict[Tuple[str, str, str], EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.kind, event.method, event.endpoint)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats(self.max_samples)
+            stats.add(event)
+
+    def reset(self) -> None:
+        """Remove all recorded requests."""
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Returns request statistics per endpoint, slowest p95 first.
+
+        Returns:
+            List[Dict[str, Any]]: Kind, method, endpoint, count, errors, retries,
+                refreshes, bytes sent and received, total seconds, and p50, p95,
+                and p99 durations in seconds.
+        """
+        with self._lock:
+            rows = []
+            for (kind, method, endpoint), stats in self._stats.items():
+                durations = sorted(stats.durations)
+                rows.append(
+                    {
+                        "kind": kind,
+                        "method": method,
+                        "endpoint": endpoint,
+                        "count": stats.count,
+                        "errors": stats.errors,
+                        "retries": stats.retries,
+                        "refreshes": stats.refreshes,
+                        "request_bytes": stats.request_bytes,
+                        "response_bytes": stats.response_bytes,
+                        "total_seconds": stats.total_seconds,
+                        "p50": percentile(durations, 0.5),
+                        "p95": percentile(durations, 0.95),
+                        "p99": percentile(durations, 0.99),
+                    }
+                )
+        return sorted(rows, key=lambda row: -row["p95"])
+
+    def to_prometheus(self, prefix: str = "d2spy") -> str:
+        """Returns metrics in the Prometheus text exposition format.
+
+        Args:
+            prefix (str, optional): Metric name prefix. Defaults to "d2spy".
+
+        Returns:
+            str: Prometheus metrics.
+        """
+        requests_total = [
+            f"# HELP {prefix}_requests_total Requests made by d2spy.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        duration = [
+            f"# HELP {prefix}_request_duration_seconds Request wall time.",
+            f"# TYPE {prefix}_request_duration_seconds summary",
+        ]
+        bytes_total = [
+            f"# HELP {prefix}_request_bytes_total Request and response body bytes.",
+            f"# TYPE {prefix}_request_bytes_total counter",
+        ]
+        retries = [
+            f"# HELP {prefix}_request_retries_total Requests retried after refresh.",
+            f"# TYPE {prefix}_request_retries_total counter",
+        ]
+        refreshes = [
+            f"# HELP {prefix}_token_refreshes_total Access token refresh requests.",
+            f"# TYPE {prefix}_token_refreshes_total counter",
+        ]
+
+        with self._lock:
+            for (kind, method, endpoint), stats in sorted(self._stats.items()):
+                labels = (
+                    f'kind="{kind}",method="{method}",'
+                    f'endpoint="{_escape_label(endpoint)}"'
+                )
+                for status, count in sorted(stats.statuses.items()):
+                    requests_total.append(
+                        f'{prefix}_requests_total{{{labels},status="{status}"}} {count}'
+                    )
+
+                durations = sorted(stats.durations)
+                for quantile in QUANTILES:
+                    value = percentile(durations, quantile)
+                    duration.append(
+                        f"{prefix}_request_duration_seconds"
+                        f'{{{labels},quantile="{quantile}"}} {value}'
+                    )
+                duration.append(
+                    f"{prefix}_request_duration_seconds_sum{{{labels}}} "
+                    f"{stats.total_seconds}"
+                )
+                duration.append(
+                    f"{prefix}_request_duration_seconds_count{{{labels}}} "
+                    f"{stats.count}"
+                )
+
+                bytes_total.append(
+                    f'{prefix}_request_bytes_total{{{labels},direction="sent"}} '
+                    f"{stats.request_bytes}"
+                )
+                bytes_total.append(
+                    f'{prefix}_request_bytes_total{{{labels},direction="received"}} '
+                    f"{stats.response_bytes}"
+                )
+                retries.append(
+                    f"{prefix}_request_retries_total{{{labels}}} {stats.retries}"
+                )
+                refreshes.append(
+                    f"{prefix}_token_refreshes_total{{{labels}}} {stats.refreshes}"
+                )
+
+        lines = requests_total + duration + bytes_total + retries + refreshes
+        # The exposition format requires a line feed after the last line
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryExporter:
+    """Hook that records request events as OpenTelemetry metrics.
+
+    Requires: pip install d2spy[otel]
+    """
+
+    def __init__(self, meter: Any = None):
+        """Constructor for OpenTelemetryExporter class.
+
+        Args:
+            meter (Any, optional): OpenTelemetry meter. Defaults to the meter
+                named "d2spy" from the global meter provider.
+        """
+        require_otel()
+        from opentelemetry import metrics  # type: ignore[import-not-found]
+
+        self.meter = meter or metrics.get_meter("d2spy")
+        self.duration = self.meter.create_histogram(
+            "d2spy.request.duration", unit="s", description="Request wall time."
+        )
+        self.bytes = self.meter.create_counter(
+            "d2spy.request.bytes", unit="By", description="Request and response bytes."
+        )
+        self.requests = self.meter.create_counter(
+            "d2spy.requests", description="Requests made by d2spy."
+        )
+
+    def __call__(self, event: RequestEvent) -> None:
+        attributes = {
+            "d2spy.kind": event.kind,
+            "http.request.method": event.method,
+            "url.template": event.endpoint,
+            "http.response.status_code": event.status or 0,
+            "d2spy.retry": event.retry,
+            "d2spy.refresh": event.refresh,
+        }
+        self.requests.add(1, attributes)
+        self.duration.record(event.elapsed, attributes)
+        self.bytes.add(event.request_bytes, {**attributes, "direction": "sent"})
+        self.bytes.add(event.response_bytes, {**attributes, "direction": "received"})
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
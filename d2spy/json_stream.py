@@ -0,0 +1,158 @@
+"""
+Incremental parsing of large JSON responses.
+
+Elements at a path (e.g., each item of a top-level array) are parsed as soon as
+their bytes arrive and yielded one at a time, so that only the element being
+parsed is held in memory rather than the whole response.
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List
+
+# Consumed text is dropped from the buffer once it is larger than this
+COMPACT_SIZE = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_whitespace = json.decoder.WHITESPACE  # type: ignore[attr-defined]
+# Characters that may continue a number cut off at the end of a chunk
+_number_chars = frozenset("0123456789.eE+-")
+
+
+class _Reader:
+    """Buffer of decoded text read from an iterable of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, size: int = 1) -> bool:
+        """Read chunks until at least `size` more characters are buffered.
+
+        Returns:
+            bool: True if any text was added, False at end of stream.
+        """
+        if self.pos > COMPACT_SIZE:
+            pos = self.pos
+            self.buffer = self.buffer[pos:]
+            self.pos = 0
+
+        parts = [self.buffer]
+        added = 0
+        while added < size and not self.eof:
+            try:
+                text = self._utf8.decode(next(self._chunks))
+            except StopIteration:
+                self.eof = True
+                text = self._utf8.decode(b"", final=True)
+            parts.append(text)
+            added += len(text)
+        self.buffer = "".join(parts)
+        return added > 0
+
+    def peek(self) -> str:
+        """Returns next non-whitespace character without consuming it, or an
+        empty string at end of stream."""
+        while True:
+            self.pos = _whitespace.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        """Consume next non-whitespace character, which must be one of `chars`."""
+        char = self.peek()
+        if not char or char not in chars:
+            found = repr(char) if char else "end of stream"
+            raise ValueError(f"Expected one of {chars!r} in JSON, found {found}")
+        self.pos += 1
+        return char
+
+    def value(self) -> Any:
+        """Parse and consume the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                # Value is incomplete, grow the buffered text at least fourfold so
+                # that large values are only re-parsed a few times
+                self.fill(max(3 * (len(self.buffer) - self.pos), 1))
+                continue
+            # Numbers cut off at the end of the buffer (e.g., "1." of "1.5") may
+            # continue in the next chunk
+            if (
+                not self.eof
+                and (
+                    end == len(self.buffer)
+                    or isinstance(value, (int, float))
+                    and self.buffer[end] in _number_chars
+                )
+                and self.fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+
+def _walk(reader: _Reader, segments: List[str]) -> Iterator[Any]:
+    if not segments:
+        yield reader.value()
+        return
+
+    segment, rest = segments[0], segments[1:]
+    if segment == "item":
+        reader.expect("[")
+        if reader.peek() == "]":
+            reader.pos += 1
+            return
+        while True:
+            yield from _walk(reader, rest)
+            if reader.expect(",]") == "]":
+                return
+    else:
+        reader.expect("{")
+        if reader.peek() == "}":
+            reader.pos += 1
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key == segment:
+                yield from _walk(reader, rest)
+            else:
+                reader.value()
+            if reader.expect(",}") == "}":
+                return
+
+
+def iter_json(chunks: Iterable[bytes], path: str = "item") -> Iterator[Any]:
+    """Yield JSON values at `path` from a JSON document read in chunks.
+
+    Paths are dot-separated object keys, where "item" stands for every element
+    of an array. For example, "item" yields the elements of a top-level array,
+    "features.item" the features of a FeatureCollection, and
+    "item.features.item" the features of every FeatureCollection in an array.
+
+    Args:
+        chunks (Iterable[bytes]): UTF-8 encoded JSON document in chunks (e.g.,
+            `Response.iter_content`).
+        path (str, optional): Path of values to yield. Defaults to "item".
+
+    Raises:
+        ValueError: Raised if the document does not have the structure of `path`
+            or is not valid JSON.
+
+    Yields:
+        Any: Decoded values.
+    """
+    reader = _Reader(chunks)
+    yield from _walk(reader, path.split(".") if path else [])
+    if reader.peek():
+        raise ValueError("Unexpected data after end of JSON document")
@@ -2,3 +2,5 @@ from .data_product import DataProduct
 from .raw_data import RawData
 from .flight import Flight
 from .project import Project
+from .query import Query
+from .spatial_index import SpatialIndex
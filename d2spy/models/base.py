@@ -0,0 +1,186 @@
+import json
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Union
+
+from d2spy.api_client import APIClient
+
+
+class Model:
+    """Base class for D2S models.
+
+    Attributes returned from the API are stored in slots declared by each model
+    instead of a per-instance `__dict__`. Attributes without a slot are kept in a
+    small overflow dict. Models created with `from_json` keep the raw JSON row and
+    only decode it the first time an attribute is accessed.
+    """
+
+    __slots__ = ("client", "_raw", "_extra", "__weakref__")
+
+    # Attributes computed on access (e.g., dates parsed from strings)
+    _decoders: ClassVar[Dict[str, Callable[["Model"], Any]]] = {}
+    # Values returned for attributes missing from the API response
+    _defaults: ClassVar[Dict[str, Any]] = {}
+    # Names of attribute slots declared by the model
+    _fields: ClassVar[FrozenSet[str]] = frozenset()
+
+    client: APIClient
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        fields = set()
+        for klass in cls.__mro__:
+            if klass is not Model:
+                fields.update(klass.__dict__.get("__slots__", ()))
+        cls._fields = frozenset(fields)
+
+    def __init__(self, client: APIClient, **kwargs):
+        self.client = client
+        self._raw = None
+        self._extra = None
+        # model attributes returned from API
+        self._assign(kwargs)
+
+    @classmethod
+    def from_row(cls, client: APIClient, row: Dict[str, Any]):
+        """Create model from a decoded API row.
+
+        Args:
+            client (APIClient): Client for the model instance.
+            row (Dict[str, Any]): Attributes returned from API.
+
+        Returns:
+            Model: New model instance.
+        """
+        instance = cls.__new__(cls)
+        setter = object.__setattr__
+        setter(instance, "client", client)
+        setter(instance, "_raw", None)
+        setter(instance, "_extra", None)
+        instance._assign(row)
+        return instance
+
+    @classmethod
+    def from_json(cls, client: APIClient, raw: Union[bytes, str]):
+        """Create model that keeps the raw JSON row and decodes it the first
+        time one of its attributes is accessed.
+
+        Args:
+            client (APIClient): Client for the model instance.
+            raw (Union[bytes, str]): JSON object returned from API.
+
+        Returns:
+            Model: New model instance.
+        """
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "client", client)
+        object.__setattr__(instance, "_raw", raw)
+        object.__setattr__(instance, "_extra", None)
+        return instance
+
+    def _assign(self, attrs: Dict[str, Any]) -> None:
+        """Store attributes in slots, or in the overflow dict if the model does
+        not declare a slot for them.
+        """
+        fields = self._fields
+        extra: Optional[Dict[str, Any]] = self._extra
+        # Bound once since this runs for every attribute of every row
+        setter = object.__setattr__
+        for name, value in attrs.items():
+            if name in fields:
+                setter(self, name, value)
+            else:
+                if extra is None:
+                    extra = {}
+                    setter(self, "_extra", extra)
+                extra[name] = value
+
+    def _hydrate(self) -> None:
+        """Decode raw JSON row into attributes if not already decoded."""
+        raw = object.__getattribute__(self, "_raw")
+        if raw is not None:
+            object.__setattr__(self, "_raw", None)
+            self._assign(json.loads(raw))
+
+    def _get(self, name: str, default: Any = None) -> Any:
+        """Return stored attribute value without applying decoders."""
+        self._hydrate()
+        if name in self._fields:
+            try:
+                return object.__getattribute__(self, name)
+            except AttributeError:
+                return self._defaults.get(name, default)
+        if self._extra and name in self._extra:
+            return self._extra[name]
+        return self._defaults.get(name, default)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when regular attribute lookup fails
+        if name.startswith("__") or name in Model.__slots__:
+            raise AttributeError(name)
+        try:
+            raw = object.__getattribute__(self, "_raw")
+        except AttributeError:
+            raise AttributeError(name) from None
+
+        if raw is not None:
+            self._hydrate()
+            if name in self._fields:
+                try:
+                    return object.__getattribute__(self, name)
+                except AttributeError:
+                    pass
+
+        decoder = self._decoders.get(name)
+        if decoder is not None:
+            return decoder(self)
+        extra = self._extra
+        if extra and name in extra:
+            return extra[name]
+        if name in self._defaults:
+            return self._defaults[name]
+
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in Model.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        try:
+            self._hydrate()
+        except AttributeError:
+            pass
+        self._assign({name: value})
+
+    def __delattr__(self, name: str) -> None:
+        self._hydrate()
+        if name in self._fields or name in Model.__slots__:
+            object.__delattr__(self, name)
+        elif self._extra and name in self._extra:
+            del self._extra[name]
+        else:
+            raise AttributeError(name)
+
+    def __dir__(self) -> List[str]:
+        self._hydrate()
+        return sorted(
+            set(super().__dir__()) | set(self._extra or ()) | set(self._decoders)
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return model attributes, including decoded attributes, as a dict.
+
+        Returns:
+            Dict[str, Any]: Model attributes.
+        """
+        self._hydrate()
+        attributes = dict(self._defaults)
+        for name in self._fields:
+            try:
+                attributes[name] = object.__getattribute__(self, name)
+            except AttributeError:
+                pass
+        attributes.update(self._extra or {})
+        for name, decoder in self._decoders.items():
+            attributes[name] = decoder(self)
+        return attributes
@@ -2,30 +2,32 @@ import os
 import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
+from urllib.parse import urlparse
 from uuid import UUID
 
-# Geo dependencies are optional
-try:
-    from rasterio.errors import RasterioIOError
-
-    HAS_RASTERIO = True
-except ImportError:
-    HAS_RASTERIO = False
-    RasterioIOError = Exception  # Fallback for type hints
-
 from d2spy import models, schemas
-from d2spy.api_client import APIClient
+from d2spy.instrumentation import RequestEvent, endpoint_template
+from d2spy.models.base import Model
 from d2spy.schemas.stac_properties import STACProperties, STACEOProperties
 from d2spy.utils.logging_config import get_logger
 
+if TYPE_CHECKING:
+    from d2spy.tools import Tool, ToolResult
+
+# Geo dependencies are optional and imported on first use (rasterio loads GDAL)
+HAS_RASTERIO = find_spec("rasterio") is not None
+
 
 # clip_by_mask requires geo extras - import lazily to avoid hard dependency
 def _lazy_import_clip_by_mask():
     """Lazy import of clip_by_mask to avoid requiring geo extras."""
     try:
-        from d2spy.extras.geo import clip_by_mask
+        from d2spy.extras.geo import clip_by_mask, require_geo
 
+        # Importing geo does not import rasterio, so check the extras here
+        require_geo()
         return clip_by_mask
     except ImportError:
         raise ImportError(
@@ -37,7 +39,7 @@ def _lazy_import_clip_by_mask():
 logger = get_logger(__name__)
 
 
-class DataProduct:
+class DataProduct(Model):
     id: UUID
     data_type: str
     filepath: str
@@ -50,14 +52,33 @@ class DataProduct:
     status: str
     url: str
     # Optional fields for additional metadata
-    bbox: Optional[List[float]] = None
-    crs: Optional[Dict] = None
-    resolution: Optional[Dict] = None
-
-    def __init__(self, client: APIClient, **kwargs):
-        self.client = client
-        # data product attributes returned from API
-        self.__dict__.update(kwargs)
+    bbox: Optional[List[float]]
+    crs: Optional[Dict]
+    resolution: Optional[Dict]
+
+    __slots__ = (
+        "id",
+        "data_type",
+        "filepath",
+        "original_filename",
+        "is_active",
+        "flight_id",
+        "deactivated_at",
+        "public",
+        "stac_properties",
+        "status",
+        "url",
+        "bbox",
+        "crs",
+        "resolution",
+    )
+
+    _defaults = {
+        "bbox": None,
+        "crs": None,
+        "deactivated_at": None,
+        "resolution": None,
+    }
 
     def __repr__(self):
         return (
@@ -89,8 +110,37 @@ class DataProduct:
             logger.error("Not available for point clouds")
             return False
 
+        start = time.perf_counter()
+        clipped = self._clip(geojson_feature, out_raster, export_vrt)
+
+        if self.client.hooks:
+            self.client.emit(
+                RequestEvent(
+                    method="GET",
+                    endpoint=endpoint_template(urlparse(self.url).path),
+                    status=None,
+                    elapsed=time.perf_counter() - start,
+                    response_bytes=(
+                        os.path.getsize(out_raster)
+                        if clipped and os.path.exists(out_raster)
+                        else 0
+                    ),
+                    kind="clip",
+                    error=None if clipped else "clip failed",
+                )
+            )
+
+        return clipped
+
+    def _clip(
+        self, geojson_feature: Dict[Any, Any], out_raster: str, export_vrt: bool
+    ) -> bool:
+        """Clips data product with clip_by_mask, retrying with the API key from
+        the D2S_API_KEY environment variable if access is denied.
+        """
         # Lazy import to avoid requiring geo extras for core functionality
         clip_by_mask = _lazy_import_clip_by_mask()
+        from rasterio.errors import RasterioIOError
 
         try:
             clip_by_mask(self.url, geojson_feature, out_raster, export_vrt)
@@ -229,6 +279,26 @@ class DataProduct:
             "zonal_layer_id": "",
         }
 
+    def submit_tools(
+        self, tools: Sequence["Tool"], skip_existing: bool = True
+    ) -> List["ToolResult"]:
+        """Request processing tools for the data product, combined into as few
+        requests as the tools payload allows.
+
+        Args:
+            tools (Sequence[Tool]): Tools from `d2spy.tools` (e.g.,
+                `[NDVI(red=1, nir=4), ExG(red=1, green=2, blue=3)]`).
+            skip_existing (bool, optional): Skip tools whose output data type
+                already exists in the flight, whatever options or source it
+                was made with. Defaults to True.
+
+        Returns:
+            List[ToolResult]: Outcome of each tool.
+        """
+        from d2spy.tools import submit_tools
+
+        return submit_tools([self], tools, skip_existing=skip_existing)
+
     def derive_ndvi(self, red_band_idx: int, nir_band_idx: int) -> bool:
         """Use data product's bands to derive a new NDVI data product. Must provide
         the red and NIR band indexes.
@@ -1,7 +1,15 @@
-from typing import List
+from typing import TYPE_CHECKING, List, Sequence
 
+from d2spy.api_client import APIClient
 from d2spy.models.data_product import DataProduct
 
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from d2spy.models.query import Query
+    from d2spy.tools import Tool, ToolResult
+
 
 class DataProductCollection:
     """Collection of Data to Science data products associated with a flight."""
@@ -33,3 +41,96 @@ class DataProductCollection:
             if data_product.data_type.lower() == data_type.lower()
         ]
         return DataProductCollection(collection=filtered_collection)
+
+    def query(self) -> "Query":
+        """Returns lazy query over the data products in this collection. Filters
+        added to the query are combined and evaluated in a single pass when the
+        query is executed.
+
+        Returns:
+            Query: Query over this collection.
+        """
+        from d2spy.models.query import Query
+
+        return Query("data_product", self)
+
+    def submit_tools(
+        self, tools: Sequence["Tool"], skip_existing: bool = True, workers: int = 4
+    ) -> List["ToolResult"]:
+        """Request processing tools for every data product in the collection.
+        Tools that do not apply to a data product fail without a request, the
+        tools of each data product are combined into as few requests as the
+        payload allows, and data products are submitted concurrently.
+
+        Args:
+            tools (Sequence[Tool]): Tools from `d2spy.tools` (e.g.,
+                `[Hillshade(), ZonalStatistics(layer_id)]`).
+            skip_existing (bool, optional): Skip tools whose output already
+                exists: a data product of the output data type in the flight,
+                whatever options or source it was made with, or zonal
+                statistics for the layer. Defaults to True.
+            workers (int, optional): Number of data products submitted at a
+                time. Defaults to 4.
+
+        Returns:
+            List[ToolResult]: Outcome of each tool for each data product.
+        """
+        from d2spy.tools import submit_tools
+
+        return submit_tools(
+            self.collection, tools, skip_existing=skip_existing, workers=workers
+        )
+
+    def to_arrow(self) -> "pa.Table":
+        """Returns data products as an Apache Arrow table with one row per data
+        product. Dates are parsed once, IDs are stored as 16-byte binary UUIDs, and
+        nested attributes are stored as JSON strings. STAC raster statistics are
+        flattened into `band_count` and `b{band}_{statistic}` columns.
+
+        Requires: pip install d2spy[arrow]
+
+        Returns:
+            pa.Table: Table of data products.
+        """
+        from d2spy.extras.columnar import (
+            DATA_PRODUCT_COLUMNS,
+            flatten_stac_stats,
+            models_to_arrow,
+        )
+
+        table = models_to_arrow(self.collection, DATA_PRODUCT_COLUMNS)
+        return flatten_stac_stats(table, self.collection)
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Returns data products as a pandas DataFrame built from `to_arrow`.
+
+        Requires: pip install d2spy[arrow]
+
+        Returns:
+            pd.DataFrame: DataFrame of data products.
+        """
+        return self.to_arrow().to_pandas()
+
+    @classmethod
+    def from_arrow(
+        cls, table: "pa.Table", client: APIClient
+    ) -> "DataProductCollection":
+        """Returns collection of data products rebuilt from a table created by
+        `to_arrow`.
+
+        Requires: pip install d2spy[arrow]
+
+        Args:
+            table (pa.Table): Table of data products.
+            client (APIClient): Client used by the data products.
+
+        Returns:
+            DataProductCollection: Collection of data products.
+        """
+        from d2spy.extras.columnar import DATA_PRODUCT_COLUMNS, models_from_arrow
+
+        return cls(
+            collection=models_from_arrow(
+                table, DataProduct, client, DATA_PRODUCT_COLUMNS
+            )
+        )
@@ -1,19 +1,21 @@
 import json
 import os
+import time
 from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from d2spy import models, schemas
-from d2spy.api_client import APIClient
-from d2spy.extras.third_party.tusclient import client as tusc
 from d2spy.extras.utils import ensure_dict
+from d2spy.identity_map import build_model, build_models, get_cached
+from d2spy.instrumentation import RequestEvent
+from d2spy.models.base import Model
 from d2spy.models.data_product import DataProduct
 from d2spy.models.data_product_collection import DataProductCollection
 
 
-class Flight:
+class Flight(Model):
     id: UUID
     name: Optional[str]
     acquisition_date: date
@@ -28,10 +30,25 @@ class Flight:
     pilot_id: UUID
     data_products: List[DataProduct]
 
-    def __init__(self, client: APIClient, **kwargs):
-        self.client = client
-        # Flight attributes returned from API
-        self.__dict__.update(kwargs)
+    __slots__ = (
+        "id",
+        "name",
+        "acquisition_date",
+        "altitude",
+        "side_overlap",
+        "forward_overlap",
+        "sensor",
+        "platform",
+        "is_active",
+        "deactivated_at",
+        "project_id",
+        "pilot_id",
+        # Rows of the flight's data products as returned from the API. Kept as
+        # dicts, not decoded into models, since callers (including sync
+        # fingerprints and Query.data_type) read them as dicts. Models are
+        # returned by get_data_products.
+        "data_products",
+    )
 
     def __repr__(self):
         return (
@@ -78,7 +95,10 @@ class Flight:
             "relativePath": "null",
             "type": get_metadata_filetype(filepath),
         }
-        # create tus client and set headers and cookies
+        # create tus client and set headers and cookies (tus client and its
+        # asyncio dependency are only imported when uploading)
+        from d2spy.extras.third_party.tusclient import client as tusc
+
         tus_client = tusc.TusClient(endpoint)
         tus_client.set_headers(headers)
         tus_client.set_cookies(cookies)
@@ -88,11 +108,7 @@ class Flight:
             filepath, chunk_size=chunk_size, metadata=metadata
         )
         # upload in chunks and print progress
-        file_size = tus_uploader.get_file_size()
-        while tus_uploader.offset < file_size:
-            tus_uploader.upload_chunk()
-            progress = (tus_uploader.offset / file_size) * 100
-            print(f"Upload progress: {progress:.2f}%", end="\r")
+        self._upload_chunks(tus_uploader)
 
     def add_raw_data(self, filepath: str) -> None:
         """Uploads zipped raw data to D2S. After the upload finishes, the raw data may
@@ -129,7 +145,10 @@ class Flight:
             "relativePath": "null",
             "type": "application/zip",
         }
-        # create tus client and set headers and cookies
+        # create tus client and set headers and cookies (tus client and its
+        # asyncio dependency are only imported when uploading)
+        from d2spy.extras.third_party.tusclient import client as tusc
+
         tus_client = tusc.TusClient(endpoint)
         tus_client.set_headers(headers)
         tus_client.set_cookies(cookies)
@@ -139,9 +158,31 @@ class Flight:
             filepath, chunk_size=chunk_size, metadata=metadata
         )
         # upload in chunks and print progress
+        self._upload_chunks(tus_uploader)
+
+    def _upload_chunks(self, tus_uploader) -> None:
+        """Upload file in chunks, print progress, and report each chunk to
+        request hooks registered with the client.
+
+        Args:
+            tus_uploader (Uploader): tus uploader for file.
+        """
         file_size = tus_uploader.get_file_size()
         while tus_uploader.offset < file_size:
+            offset = tus_uploader.offset
+            start = time.perf_counter()
             tus_uploader.upload_chunk()
+            if self.client.hooks:
+                self.client.emit(
+                    RequestEvent(
+                        method="PATCH",
+                        endpoint="/files/{id}",
+                        status=getattr(tus_uploader.request, "status_code", None),
+                        elapsed=time.perf_counter() - start,
+                        request_bytes=tus_uploader.offset - offset,
+                        kind="upload",
+                    )
+                )
             progress = (tus_uploader.offset / file_size) * 100
             print(f"Upload progress: {progress:.2f}%", end="\r")
 
@@ -155,12 +196,18 @@ class Flight:
         Returns:
             Optional[models.DataProduct]: Data product ID or None.
         """
+        cached_data_product = get_cached(self.client, "DataProduct", data_product_id)
+        if cached_data_product is not None and str(
+            cached_data_product.flight_id
+        ) == str(self.id):
+            return cached_data_product
+
         endpoint = f"/api/v1/projects/{self.project_id}/flights/{self.id}"
         endpoint += f"/data_products/{data_product_id}"
         response_data = self.client.make_get_request(endpoint)
         response_data = ensure_dict(response_data)
         data_product = schemas.DataProduct.from_dict(response_data)
-        return models.DataProduct(self.client, **data_product.__dict__)
+        return build_model(models.DataProduct, self.client, data_product.__dict__)
 
     def get_data_products(self) -> DataProductCollection:
         """Return list of all active data products in a flight.
@@ -171,15 +218,20 @@ class Flight:
         endpoint = f"/api/v1/projects/{self.project_id}/flights/{self.id}/data_products"
         response_data = self.client.make_get_request(endpoint)
 
-        data_products = [
-            models.DataProduct(
-                self.client,
-                **schemas.DataProduct.from_dict(data_product).__dict__,
-            )
-            for data_product in response_data
-        ]
+        data_products = build_models(
+            models.DataProduct, self.client, response_data, schemas.DataProduct
+        )
         return DataProductCollection(collection=data_products)
 
+    def query_data_products(self) -> "models.Query":
+        """Returns lazy query over active data products in flight. Data products
+        are requested when the query is executed.
+
+        Returns:
+            Query: Query over data products.
+        """
+        return models.Query("data_product", self.get_data_products)
+
     def get_raw_data(self) -> List[models.RawData]:
         """Return list of all active raw data in a flight.
 
@@ -189,13 +241,9 @@ class Flight:
         endpoint = f"/api/v1/projects/{self.project_id}/flights/{self.id}/raw_data"
         response_data = self.client.make_get_request(endpoint)
 
-        all_raw_data = [
-            models.RawData(
-                self.client,
-                **schemas.RawData.from_dict(raw_data).__dict__,
-            )
-            for raw_data in response_data
-        ]
+        all_raw_data = build_models(
+            models.RawData, self.client, response_data, schemas.RawData
+        )
         return all_raw_data
 
     def move_to_project(self, destination_project_id: UUID) -> None:
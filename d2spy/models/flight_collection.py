@@ -1,8 +1,34 @@
-from datetime import date, datetime
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
 from difflib import SequenceMatcher
-from typing import List, Union
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+from d2spy.api_client import APIClient
 from d2spy.models.flight import Flight
+from d2spy.models.index_cache import IndexCache
+from d2spy.utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from d2spy.extras.raster import RasterCube
+    from d2spy.models.data_product import DataProduct
+    from d2spy.models.query import Query
+
+logger = get_logger(__name__)
 
 
 class FlightCollection:
@@ -10,6 +36,7 @@ class FlightCollection:
 
     def __init__(self, collection: List[Flight] = []):
         self.collection = collection
+        self._indexes = IndexCache()
 
     def __getitem__(self, index: int) -> Flight:
         return self.collection[int(index)]
@@ -20,6 +47,45 @@ class FlightCollection:
     def __repr__(self) -> str:
         return f"FlightCollection({self.collection})"
 
+    def invalidate_indexes(self) -> None:
+        """Rebuild indexes on next use. Only needed after flights in the collection
+        were replaced in place or their attributes were updated.
+        """
+        self._indexes.clear()
+
+    def _date_index(self) -> Tuple[List[date], List[int]]:
+        """Returns acquisition dates sorted in ascending order and the position
+        of each date's flight in the collection. Dates are parsed once per index.
+        """
+
+        def build() -> Tuple[List[date], List[int]]:
+            dates = [
+                convert_from_str_to_date(flight.acquisition_date)
+                for flight in self.collection
+            ]
+            positions = sorted(range(len(dates)), key=dates.__getitem__)
+            return [dates[position] for position in positions], positions
+
+        return self._indexes.get(self.collection, "date", build)
+
+    def _slice_by_date(
+        self, start_date: date, end_date: date, inclusive_end: bool = True
+    ) -> List[int]:
+        """Returns positions of flights with acquisition dates in range."""
+        dates, positions = self._date_index()
+        low = bisect_left(dates, start_date)
+        if inclusive_end:
+            high = bisect_right(dates, end_date)
+        else:
+            high = bisect_left(dates, end_date)
+        return positions[low:high]
+
+    def _subset(self, positions: List[int]) -> "FlightCollection":
+        """Returns collection of flights at positions, in collection order."""
+        return FlightCollection(
+            collection=[self.collection[position] for position in sorted(positions)]
+        )
+
     def filter_by_date(self, start_date: date, end_date: date) -> "FlightCollection":
         """Returns collection of flights within the acquisition date range.
 
@@ -30,13 +96,77 @@ class FlightCollection:
         Returns:
             FlightCollection: Collection of flights within the acquisition date range.
         """
-        filtered_collection = [
-            flight
-            for flight in self.collection
-            if convert_from_str_to_date(flight.acquisition_date) >= start_date
-            and convert_from_str_to_date(flight.acquisition_date) <= end_date
-        ]
-        return FlightCollection(collection=filtered_collection)
+        return self._subset(self._slice_by_date(start_date, end_date))
+
+    def group_by_week(self) -> Dict[date, "FlightCollection"]:
+        """Returns flights grouped by ISO week (Monday through Sunday) of their
+        acquisition dates.
+
+        Returns:
+            Dict[date, FlightCollection]: Flights keyed by the Monday of each week,
+                in chronological order.
+        """
+        return self._group_by(lambda day: day - timedelta(days=day.weekday()))
+
+    def group_by_month(self) -> Dict[date, "FlightCollection"]:
+        """Returns flights grouped by month of their acquisition dates.
+
+        Returns:
+            Dict[date, FlightCollection]: Flights keyed by the first day of each
+                month, in chronological order.
+        """
+        return self._group_by(lambda day: day.replace(day=1))
+
+    def _group_by(self, period_start) -> Dict[date, "FlightCollection"]:
+        """Returns flights grouped by the start date of their period."""
+        dates, positions = self._date_index()
+        groups: Dict[date, List[int]] = {}
+        for day, position in zip(dates, positions):
+            groups.setdefault(period_start(day), []).append(position)
+        return {key: self._subset(group) for key, group in groups.items()}
+
+    def iter_windows(
+        self,
+        size: timedelta,
+        step: Optional[timedelta] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Iterator[Tuple[date, date, "FlightCollection"]]:
+        """Iterates over sliding windows of acquisition dates. Each window
+        includes its start date and excludes its end date.
+
+        Args:
+            size (timedelta): Length of each window.
+            step (Optional[timedelta], optional): Distance between window starts.
+                Defaults to `size` (non-overlapping windows).
+            start_date (Optional[date], optional): Start of first window. Defaults
+                to the earliest acquisition date.
+            end_date (Optional[date], optional): Windows start before this date.
+                Defaults to the day after the latest acquisition date, so that
+                the last window includes it.
+
+        Yields:
+            Tuple[date, date, FlightCollection]: Window start, window end, and
+                flights acquired within the window.
+        """
+        step = step or size
+        if size <= timedelta(0) or step <= timedelta(0):
+            raise ValueError("Window size and step must be positive")
+
+        dates, _ = self._date_index()
+        if not dates:
+            return
+
+        window_start = start_date or dates[0]
+        stop = end_date or dates[-1] + timedelta(days=1)
+
+        while window_start < stop:
+            window_end = window_start + size
+            positions = self._slice_by_date(
+                window_start, window_end, inclusive_end=False
+            )
+            yield window_start, window_end, self._subset(positions)
+            window_start += step
 
     def filter_by_sensor(self, sensor: str, exact: bool = False) -> "FlightCollection":
         """Returns collection of flights with specified sensor.
@@ -48,12 +178,218 @@ class FlightCollection:
         Returns:
             FlightCollection: Collection of flights with matching sensor.
         """
-        filtered_collection = [
-            flight
-            for flight in self.collection
-            if is_match(sensor, flight.sensor, exact)
+        return self._subset(self._match_sensor(sensor, exact))
+
+    def _match_sensor(self, sensor: str, exact: bool = False) -> List[int]:
+        """Returns positions of flights with matching sensor."""
+        sensor_index = self._sensor_index()
+        query = sensor.lower()
+
+        if exact:
+            return sensor_index.get(query, [])
+
+        # Compare query against each distinct sensor instead of each flight
+        return [
+            position
+            for value, value_positions in sensor_index.items()
+            if similarity(query, value) >= 0.8
+            for position in value_positions
         ]
-        return FlightCollection(collection=filtered_collection)
+
+    def _sensor_index(self) -> Dict[str, List[int]]:
+        """Returns positions of flights in the collection keyed by lowercase
+        sensor.
+        """
+
+        def build() -> Dict[str, List[int]]:
+            index: Dict[str, List[int]] = {}
+            for position, flight in enumerate(self.collection):
+                index.setdefault(flight.sensor.lower(), []).append(position)
+            return index
+
+        return self._indexes.get(self.collection, "sensor", build)
+
+    def query(self) -> "Query":
+        """Returns lazy query over the flights in this collection. Filters
+        added to the query are combined and evaluated in a single pass when the
+        query is executed.
+
+        Returns:
+            Query: Query over this collection.
+        """
+        from d2spy.models.query import Query
+
+        return Query("flight", self)
+
+    def data_products_by_date(self, data_type: str) -> List[Tuple[date, "DataProduct"]]:
+        """Returns the active data product of a data type from each flight, in
+        order of acquisition date. Data products are requested once per flight,
+        and flights without a matching data product are skipped.
+
+        Args:
+            data_type (str): Data type (e.g., "dsm" or "ortho").
+
+        Returns:
+            List[Tuple[date, DataProduct]]: Acquisition date and data product of
+                each flight.
+        """
+        dates, positions = self._date_index()
+        matches = []
+        for day, position in zip(dates, positions):
+            flight = self.collection[position]
+            data_products = flight.get_data_products().filter_by_data_type(data_type)
+            if len(data_products) == 0:
+                logger.warning(f"Flight {flight.id} has no {data_type} data product")
+                continue
+            matches.append((day, data_products[0]))
+        return matches
+
+    def to_cube(
+        self,
+        data_type: str,
+        geometry: Any,
+        resolution: float,
+        crs: Optional[Any] = None,
+        resampling: str = "bilinear",
+        filename: Optional[str] = None,
+        workers: Optional[int] = None,
+    ) -> "RasterCube":
+        """Returns time × band × y × x cube of a data type across the flights,
+        aligned to a common grid covering the geometry. Data products are read
+        lazily, on first access of their time steps, with windowed warped reads
+        that run in parallel across data products.
+
+        Requires: pip install d2spy[geo]
+
+        Args:
+            data_type (str): Data type to stack (e.g., "dsm" or "ndvi").
+            geometry (Any): Area of interest as a GeoJSON Feature or geometry,
+                shapely geometry, or bounding box in WGS84.
+            resolution (float): Pixel size in units of `crs` (meters by default).
+            crs (Optional[Any], optional): Coordinate reference system of the
+                cube. Defaults to the UTM zone of the geometry.
+            resampling (str, optional): rasterio resampling method. Defaults to
+                "bilinear".
+            filename (Optional[str], optional): File backing the memory-mapped
+                array. Defaults to a temporary file.
+            workers (Optional[int], optional): Number of data products read at a
+                time. Defaults to the thread pool default.
+
+        Returns:
+            RasterCube: Cube with acquisition dates as time coordinates.
+        """
+        from d2spy.extras.raster import Grid, RasterCube, band_count, band_names
+
+        grid = Grid.from_geometry(geometry, resolution, crs)
+        matches = self.data_products_by_date(data_type)
+        data_products = [data_product for _, data_product in matches]
+        bands = max((band_count(dp) for dp in data_products), default=1)
+        return RasterCube(
+            data_products,
+            [day for day, _ in matches],
+            grid,
+            bands,
+            band_names=band_names(data_products, bands),
+            resampling=resampling,
+            filename=filename,
+            workers=workers,
+        )
+
+    def extract_plot_series(
+        self,
+        layer_features: Iterable[Dict[str, Any]],
+        data_type: str,
+        stats: Sequence[str] = ("mean",),
+        band: int = 1,
+        id_property: Optional[str] = None,
+        resolution: Optional[float] = None,
+        all_touched: bool = False,
+        workers: Optional[int] = None,
+    ) -> "pd.DataFrame":
+        """Returns statistics of every plot for the data product of a data type in
+        each flight, computed locally. Each data product is read once with a
+        windowed read covering the plots, in parallel across data products, and
+        plots are rasterized once per distinct grid.
+
+        Requires: pip install d2spy[geo]
+
+        Args:
+            layer_features (Iterable[Dict[str, Any]]): GeoJSON Polygon Features of
+                plots in WGS84 (e.g., from `Project.iter_map_layer_features`).
+            data_type (str): Data type (e.g., "ndvi" or "chm").
+            stats (Sequence[str], optional): Statistics to compute: "count",
+                "sum", "mean", "std", "min", "max", "median", or percentiles
+                such as "p95". Defaults to ("mean",).
+            band (int, optional): 1-based index of band. Defaults to 1.
+            id_property (Optional[str], optional): Feature property holding the
+                plot ID. Defaults to the D2S feature ID.
+            resolution (Optional[float], optional): Resample every data product
+                to a common grid with this pixel size in meters, so that plots
+                are rasterized once. Defaults to the native grid of each data
+                product.
+            all_touched (bool, optional): Include every pixel touched by a plot.
+                Defaults to False (pixels whose center is within the plot).
+            workers (Optional[int], optional): Number of data products read at a
+                time. Defaults to the thread pool default.
+
+        Returns:
+            pd.DataFrame: Long table with columns plot_id, acquisition_date,
+                stat, and value.
+        """
+        from d2spy.extras.zonal import extract_plot_series
+
+        return extract_plot_series(
+            self.data_products_by_date(data_type),
+            layer_features,
+            stats=stats,
+            band=band,
+            id_property=id_property,
+            resolution=resolution,
+            all_touched=all_touched,
+            workers=workers,
+        )
+
+    def to_arrow(self) -> "pa.Table":
+        """Returns flights as an Apache Arrow table with one row per flight.
+        Dates are parsed once, IDs are stored as 16-byte binary UUIDs, and nested
+        attributes are stored as JSON strings.
+
+        Requires: pip install d2spy[arrow]
+
+        Returns:
+            pa.Table: Table of flights.
+        """
+        from d2spy.extras.columnar import FLIGHT_COLUMNS, models_to_arrow
+
+        return models_to_arrow(self.collection, FLIGHT_COLUMNS)
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Returns flights as a pandas DataFrame built from `to_arrow`.
+
+        Requires: pip install d2spy[arrow]
+
+        Returns:
+            pd.DataFrame: DataFrame of flights.
+        """
+        return self.to_arrow().to_pandas()
+
+    @classmethod
+    def from_arrow(cls, table: "pa.Table", client: APIClient) -> "FlightCollection":
+        """Returns collection of flights rebuilt from a table created by
+        `to_arrow`.
+
+        Requires: pip install d2spy[arrow]
+
+        Args:
+            table (pa.Table): Table of flights.
+            client (APIClient): Client used by the flights.
+
+        Returns:
+            FlightCollection: Collection of flights.
+        """
+        from d2spy.extras.columnar import FLIGHT_COLUMNS, models_from_arrow
+
+        return cls(collection=models_from_arrow(table, Flight, client, FLIGHT_COLUMNS))
 
 
 def convert_from_str_to_date(date_str: Union[date, str]) -> date:
@@ -95,4 +431,19 @@ def is_match(a: str, b: str, exact: bool = False) -> bool:
     if exact:
         return a.lower() == b.lower()
     else:
-        return SequenceMatcher(None, a.lower(), b.lower()).ratio() >= 0.8
+        return similarity(a.lower(), b.lower()) >= 0.8
+
+
+@lru_cache(maxsize=1024)
+def similarity(a: str, b: str) -> float:
+    """Returns similarity ratio between two strings. Results are cached since
+    the same few sensor values are compared repeatedly.
+
+    Args:
+        a (str): First string.
+        b (str): Second string.
+
+    Returns:
+        float: Similarity ratio between 0 and 1.
+    """
+    return SequenceMatcher(None, a, b).ratio()
@@ -0,0 +1,42 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+
+T = TypeVar("T")
+
+
+class IndexCache:
+    """Lazily built indexes over the list backing a model collection.
+
+    Indexes are rebuilt when the backing list is replaced or its length changes.
+    Changes that keep the length the same (e.g., replacing an item in place or
+    updating an item's attributes) are not detected and require a call to
+    `clear`.
+    """
+
+    def __init__(self):
+        self._key: Optional[Tuple[int, int]] = None
+        self._indexes: Dict[str, Any] = {}
+
+    def get(self, collection: List[Any], name: str, build: Callable[[], T]) -> T:
+        """Return index by name, building it first if missing or stale.
+
+        Args:
+            collection (List[Any]): List the index is built over.
+            name (str): Name of index.
+            build (Callable[[], T]): Function that builds the index.
+
+        Returns:
+            T: Index.
+        """
+        key = (id(collection), len(collection))
+        if key != self._key:
+            self._indexes.clear()
+            self._key = key
+        if name not in self._indexes:
+            self._indexes[name] = build()
+        return self._indexes[name]
+
+    def clear(self) -> None:
+        """Remove all indexes so they are rebuilt on next use."""
+        self._indexes.clear()
+        self._key = None
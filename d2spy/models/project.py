@@ -1,16 +1,31 @@
 import json
 from datetime import date, datetime
-from typing import Any, cast, Dict, List, Literal, Optional, Union
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    cast,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 from uuid import UUID
 
 from d2spy import models, schemas
-from d2spy.api_client import APIClient
+from d2spy.compression import compress_stream
 from d2spy.extras.utils import ensure_dict, ensure_list_of_dict
+from d2spy.identity_map import build_model, build_models, get_cached
+from d2spy.models.base import Model
+from d2spy.utils.dates import parse_date
 from d2spy.models.flight_collection import FlightCollection
 from d2spy.schemas.geojson import MapLayerFeatureCollection, ProjectBoundaryGeoJSON
 
 
-class Project:
+class Project(Model):
     id: UUID
     deactivated_at: Optional[datetime]
     description: str
@@ -24,10 +39,28 @@ class Project:
     team_id: Optional[UUID]
     title: str
 
-    def __init__(self, client: APIClient, **kwargs):
-        self.client = client
-        # project attributes returned from API
-        self.__dict__.update(kwargs)
+    __slots__ = (
+        "id",
+        "centroid",
+        "deactivated_at",
+        "description",
+        "field",
+        "flight_count",
+        "is_active",
+        "location_id",
+        "role",
+        "team_id",
+        "title",
+    )
+
+    _decoders = {
+        "start_date": lambda project: parse_date(
+            project._get("start_date") or project._get("planting_date")
+        ),
+        "end_date": lambda project: parse_date(
+            project._get("end_date") or project._get("harvest_date")
+        ),
+    }
 
     def __repr__(self):
         repr_str = f"Project(title={self.title!r}, description={self.description!r}"
@@ -92,8 +125,10 @@ class Project:
         response_data = self.client.make_post_request(endpoint, json=data)
 
         # return flight model
-        flight = models.Flight(
-            self.client, **schemas.Flight.from_dict(response_data).__dict__
+        flight = build_model(
+            models.Flight,
+            self.client,
+            schemas.Flight.from_dict(response_data).__dict__,
         )
         return flight
 
@@ -120,8 +155,86 @@ class Project:
         # return feature collection of vector layer
         return cast(MapLayerFeatureCollection, response_data)
 
+    def upload_map_layer(
+        self,
+        source: Union[str, Path, Iterable[Dict[str, Any]]],
+        layer_name: Optional[str] = None,
+        batch_size: int = 1000,
+        progress: Union[bool, Callable[[int, Optional[int]], None]] = True,
+    ) -> MapLayerFeatureCollection:
+        """Add large vector map layer to a project. Unlike `add_map_layer`, the
+        features are read in batches from a vector file or an iterator and
+        streamed to D2S as they are encoded, so the layer is never held in
+        memory as a whole. The streamed body is compressed if the client's
+        `request_compression` is set.
+
+        Args:
+            source (Union[str, Path, Iterable[Dict[str, Any]]]): Path to GeoJSON,
+                GeoPackage, Shapefile, or GeoParquet file, or iterable of GeoJSON
+                Features in WGS84. Formats other than GeoJSON require d2spy[geo],
+                and GeoParquet also requires d2spy[arrow].
+            layer_name (Optional[str], optional): Name of map layer. Defaults to
+                the file name without extension, required for iterables.
+            batch_size (int, optional): Features read from the file at a time.
+                Defaults to 1000.
+            progress (Union[bool, Callable[[int, Optional[int]], None]], optional):
+                Print upload progress, or function called with the number of
+                features sent and the total number of features (None if
+                unknown). Defaults to True.
+
+        Raises:
+            FileNotFoundError: Raised if the vector file does not exist.
+            ValueError: Raised if the file format is not supported or if
+                `layer_name` is missing for an iterable.
+
+        Returns:
+            MapLayerFeatureCollection: GeoJSON Feature Collection with D2S metadata.
+        """
+        # vector file readers (and their optional dependencies) are only
+        # imported when uploading files
+        from d2spy.extras import vector
+
+        total: Optional[int] = None
+        if isinstance(source, (str, Path)):
+            filepath = str(source)
+            features = vector.iter_features(filepath, batch_size=batch_size)
+            total = vector.count_features(filepath)
+            layer_name = layer_name or Path(filepath).stem
+        elif layer_name:
+            features = iter(source)
+        else:
+            raise ValueError("layer_name is required when uploading an iterable")
+
+        if progress is True:
+            report: Optional[Callable[[int, Optional[int]], None]] = print_progress
+        else:
+            report = progress or None
+
+        # Ensure we have a fresh access token, since a streamed body can not be
+        # sent again after a token refresh
+        self.client.make_get_request("/api/v1/users/current")
+
+        endpoint = f"/api/v1/projects/{self.id}/vector_layers/geojson"
+        chunks = map_layer_chunks(layer_name, features, total, report)
+        headers = {"Content-Type": "application/json"}
+        if self.client.request_compression:
+            chunks = compress_stream(chunks, self.client.request_compression)
+            headers["Content-Encoding"] = self.client.request_compression
+
+        # post vector layer data with chunked transfer encoding
+        response_data = self.client.make_post_request(
+            endpoint, data=SingleUseBody(chunks), headers=headers
+        )
+        if report is print_progress:
+            print()
+
+        # return feature collection of vector layer
+        return cast(MapLayerFeatureCollection, response_data)
+
     def get_flight(self, flight_id: str) -> Optional[models.Flight]:
         """Request single flight by ID. Flight must be active and viewable by user.
+        If the workspace has an identity map and the flight was already loaded,
+        the cached flight is returned without a request.
 
         Args:
             flight_id (str): Flight ID.
@@ -129,11 +242,15 @@ class Project:
         Returns:
             Optional[models.Flight]: Flight matching ID or None.
         """
+        cached_flight = get_cached(self.client, "Flight", flight_id)
+        if cached_flight is not None and str(cached_flight.project_id) == str(self.id):
+            return cached_flight
+
         endpoint = f"/api/v1/projects/{self.id}/flights/{flight_id}"
         response_data = self.client.make_get_request(endpoint)
         response_data = ensure_dict(response_data)
         flight = schemas.Flight.from_dict(response_data)
-        return models.Flight(self.client, **flight.__dict__)
+        return build_model(models.Flight, self.client, flight.__dict__)
 
     def get_flights(self, has_raster: Optional[bool] = False) -> FlightCollection:
         """Return list of all active flights in project.
@@ -149,12 +266,21 @@ class Project:
             endpoint, params={"has_raster": has_raster}
         )
         response_data = ensure_list_of_dict(response_data)
-        flights = [
-            models.Flight(self.client, **schemas.Flight.from_dict(flight).__dict__)
-            for flight in response_data
-        ]
+        flights = build_models(
+            models.Flight, self.client, response_data, schemas.Flight
+        )
         return FlightCollection(collection=flights)
 
+    def query_flights(self) -> "models.Query":
+        """Returns lazy query over active flights in project. Flights are
+        requested when the query is executed, with server-side filters
+        (e.g., `has_raster`) sent as request parameters.
+
+        Returns:
+            Query: Query over flights.
+        """
+        return models.Query("flight", self.get_flights)
+
     def get_project_boundary(self) -> Optional[ProjectBoundaryGeoJSON]:
         """Return project boundary in GeoJSON format.
 
@@ -184,6 +310,30 @@ class Project:
         response_data = ensure_list_of_dict(response_data)
         return response_data
 
+    def iter_map_layers(self) -> Iterator[Dict[Any, Any]]:
+        """Yield GeoJSON FeatureCollections for map layers associated with this
+        project one at a time as they are received.
+
+        Yields:
+            Dict[Any, Any]: GeoJSON FeatureCollection.
+        """
+        endpoint = f"/api/v1/projects/{self.id}/vector_layers"
+        yield from self.client.iter_get(endpoint, params={"format": "json"})
+
+    def iter_map_layer_features(self) -> Iterator[Dict[Any, Any]]:
+        """Yield GeoJSON Features from all map layers associated with this project
+        one at a time as they are received. Memory use does not depend on the
+        size of the layers. The layer of each feature is given by its
+        `layer_id` and `layer_name` properties.
+
+        Yields:
+            Dict[Any, Any]: GeoJSON Feature.
+        """
+        endpoint = f"/api/v1/projects/{self.id}/vector_layers"
+        yield from self.client.iter_get(
+            endpoint, path="item.features.item", params={"format": "json"}
+        )
+
     def update(self, **kwargs) -> None:
         """Update project attributes."""
         endpoint = f"/api/v1/projects/{self.id}"
@@ -198,3 +348,78 @@ class Project:
             else:
                 print(f"Warning: Attribute '{key}' not found in Project class.")
         return None
+
+
+# Encoded map layer features are sent in chunks of about this many bytes
+MAP_LAYER_CHUNK_SIZE = 1024 * 1024
+
+
+class SingleUseBody:
+    """Streamed request body that raises an error instead of sending an empty
+    body if the request is sent again (e.g., retried after a token refresh)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self.chunks = chunks
+        self.used = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.used:
+            raise RuntimeError("Streamed request body can only be sent once")
+        self.used = True
+        return self.chunks
+
+
+def map_layer_chunks(
+    layer_name: str,
+    features: Iterator[Dict[str, Any]],
+    total: Optional[int] = None,
+    report: Optional[Callable[[int, Optional[int]], None]] = None,
+) -> Iterator[bytes]:
+    """Encode vector layer request body in chunks.
+
+    Args:
+        layer_name (str): Name of map layer.
+        features (Iterator[Dict[str, Any]]): GeoJSON Features.
+        total (Optional[int], optional): Total number of features, if known.
+        report (Optional[Callable[[int, Optional[int]], None]], optional):
+            Called with the number of features encoded after each chunk.
+
+    Yields:
+        bytes: Request body in chunks.
+    """
+    head = {"layer_name": layer_name, "geojson": {"type": "FeatureCollection"}}
+    # Open the features array inside the geojson object
+    parts = [json.dumps(head, separators=(",", ":"))[:-2], ',"features":[']
+    size = 0
+    count = 0
+    for feature in features:
+        if count:
+            parts.append(",")
+        encoded = json.dumps(
+            feature, separators=(",", ":"), allow_nan=False, default=str
+        )
+        parts.append(encoded)
+        size += len(encoded)
+        count += 1
+        if size >= MAP_LAYER_CHUNK_SIZE:
+            yield "".join(parts).encode()
+            parts, size = [], 0
+            if report:
+                report(count, total)
+    parts.append("]}}")
+    yield "".join(parts).encode()
+    if report:
+        report(count, total)
+
+
+def print_progress(count: int, total: Optional[int]) -> None:
+    """Print number of map layer features uploaded.
+
+    Args:
+        count (int): Features uploaded.
+        total (Optional[int]): Total number of features, if known.
+    """
+    if total:
+        print(f"Upload progress: {count / total * 100:.2f}%", end="\r")
+    else:
+        print(f"Uploaded features: {count}", end="\r")
@@ -1,6 +1,15 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional, Sequence
 
+from d2spy.api_client import APIClient
+from d2spy.models.index_cache import IndexCache
 from d2spy.models.project import Project
+from d2spy.models.text_index import TOKEN_PATTERN, TextIndex
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from d2spy.models.query import Query
 
 
 class ProjectCollection:
@@ -8,6 +17,7 @@ class ProjectCollection:
 
     def __init__(self, collection: List[Project] = []):
         self.collection = collection
+        self._indexes = IndexCache()
 
     def __getitem__(self, index: int) -> Project:
         return self.collection[int(index)]
@@ -28,12 +38,7 @@ class ProjectCollection:
         Returns:
             ProjectCollection: Collection of projects with keyword matches.
         """
-        filtered_collection = [
-            project
-            for project in self.collection
-            if keyword.lower() in project.description.lower()
-        ]
-        return ProjectCollection(collection=filtered_collection)
+        return self._subset(self._text_index("description").substring(keyword))
 
     def filter_by_title(self, keyword: str) -> "ProjectCollection":
         """Returns list of projects with titles containing text that matches
@@ -45,9 +50,149 @@ class ProjectCollection:
         Returns:
             List[Project]: List of projects with keyword matches.
         """
-        filtered_collection = [
-            project
-            for project in self.collection
-            if keyword.lower() in project.title.lower()
-        ]
-        return ProjectCollection(collection=filtered_collection)
+        return self._subset(self._text_index("title").substring(keyword))
+
+    def search(
+        self,
+        query: str,
+        fields: Sequence[Literal["title", "description"]] = ("title", "description"),
+        mode: Literal["substring", "prefix"] = "substring",
+        limit: Optional[int] = None,
+    ) -> "ProjectCollection":
+        """Returns projects matching every term in the query, ranked by relevance.
+        A term matches a project if it is found in any of the searched fields.
+        Title matches rank above description matches, and whole-word matches rank
+        above partial matches.
+
+        Args:
+            query (str): Whitespace separated search terms.
+            fields (Sequence[Literal["title", "description"]], optional): Project
+                fields to search. Defaults to ("title", "description").
+            mode (Literal["substring", "prefix"], optional): Match terms anywhere
+                in the text or only at the start of words. Defaults to "substring".
+            limit (Optional[int], optional): Maximum number of projects returned.
+                Defaults to None.
+
+        Returns:
+            ProjectCollection: Collection of matching projects, best match first.
+        """
+        if mode not in ("substring", "prefix"):
+            raise ValueError("mode must be 'substring' or 'prefix'")
+
+        terms = TOKEN_PATTERN.findall(query.lower())
+        if not terms:
+            return ProjectCollection(collection=list(self.collection)[:limit])
+
+        # Title matches weigh more than description matches
+        weights = {"title": 2.0, "description": 1.0}
+        scores: Optional[Dict[int, float]] = None
+
+        for term in terms:
+            term_scores: Dict[int, float] = {}
+            for field in fields:
+                index = self._text_index(field)
+                matches = (
+                    index.substring(term) if mode == "substring" else index.prefix(term)
+                )
+                whole_words = index.token(term)
+                for position in matches:
+                    score = weights[field] * (2.0 if position in whole_words else 1.0)
+                    term_scores[position] = term_scores.get(position, 0.0) + score
+
+            # Every term must match
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {
+                    position: score + term_scores[position]
+                    for position, score in scores.items()
+                    if position in term_scores
+                }
+            if not scores:
+                break
+
+        final_scores = scores or {}
+        ranked = sorted(
+            final_scores, key=lambda position: (-final_scores[position], position)
+        )
+        return ProjectCollection(
+            collection=[self.collection[position] for position in ranked[:limit]]
+        )
+
+    def invalidate_indexes(self) -> None:
+        """Rebuild search indexes on next use. Only needed after projects in the
+        collection were replaced in place or their attributes were updated.
+        """
+        self._indexes.clear()
+
+    def _text_index(self, field: str) -> TextIndex:
+        """Returns text index for project field, building it on first use."""
+        return self._indexes.get(
+            self.collection,
+            field,
+            lambda: TextIndex(
+                [getattr(project, field, "") for project in self.collection]
+            ),
+        )
+
+    def _subset(self, positions: Iterable[int]) -> "ProjectCollection":
+        """Returns collection of projects at positions, in collection order."""
+        return ProjectCollection(
+            collection=[self.collection[position] for position in sorted(positions)]
+        )
+
+    def query(self) -> "Query":
+        """Returns lazy query over the projects in this collection. Filters
+        added to the query are combined and evaluated in a single pass when the
+        query is executed.
+
+        Returns:
+            Query: Query over this collection.
+        """
+        from d2spy.models.query import Query
+
+        return Query("project", self)
+
+    def to_arrow(self) -> "pa.Table":
+        """Returns projects as an Apache Arrow table with one row per project.
+        Dates are parsed once, IDs are stored as 16-byte binary UUIDs, and nested
+        attributes are stored as JSON strings.
+
+        Requires: pip install d2spy[arrow]
+
+        Returns:
+            pa.Table: Table of projects.
+        """
+        from d2spy.extras.columnar import PROJECT_COLUMNS, models_to_arrow
+
+        return models_to_arrow(self.collection, PROJECT_COLUMNS)
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """Returns projects as a pandas DataFrame built from `to_arrow`.
+
+        Requires: pip install d2spy[arrow]
+
+        Returns:
+            pd.DataFrame: DataFrame of projects.
+        """
+        return self.to_arrow().to_pandas()
+
+    @classmethod
+    def from_arrow(cls, table: "pa.Table", client: APIClient) -> "ProjectCollection":
+        """Returns collection of projects rebuilt from a table created by
+        `to_arrow`.
+
+        Requires: pip install d2spy[arrow]
+
+        Args:
+            table (pa.Table): Table of projects.
+            client (APIClient): Client used by the projects.
+
+        Returns:
+            ProjectCollection: Collection of projects.
+        """
+        from d2spy.extras.columnar import PROJECT_COLUMNS, models_from_arrow
+
+        return cls(
+            collection=models_from_arrow(table, Project, client, PROJECT_COLUMNS)
+        )
@@ -0,0 +1,427 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from d2spy.models.flight_collection import is_match
+from d2spy.utils.dates import parse_date
+
+
+Kind = Literal["project", "flight", "data_product"]
+BBox = Tuple[float, float, float, float]
+
+# Cost of evaluating a predicate, cheapest predicates are evaluated first
+INDEXED = 0
+ATTRIBUTE = 1
+NESTED = 2
+GEOMETRY = 3
+CUSTOM = 4
+
+
+@dataclass(frozen=True)
+class Predicate:
+    """Single condition of a query."""
+
+    name: str
+    cost: int
+    # Local test applied to each model instance
+    test: Optional[Callable[[Any], bool]] = None
+    # Returns matching positions using one of the collection's indexes
+    lookup: Optional[Callable[[Any], List[int]]] = None
+    # Request parameter that lets the D2S server evaluate the predicate
+    server_param: Optional[Tuple[str, Any]] = None
+
+
+class Query:
+    """Lazy, composable query over projects, flights, or data products.
+
+    Each method returns a new query with an added predicate and nothing is
+    evaluated until `execute` is called. Predicates the D2S server supports are
+    sent as request parameters, indexed predicates (acquisition date, sensor)
+    select the first candidates, and the remaining predicates are applied
+    cheapest first in a single pass over the candidates.
+
+    Queries are usually created with `collection.query()` for data that was
+    already requested, or with `Workspace.query_projects()`,
+    `Project.query_flights()`, and `Flight.query_data_products()` to request the
+    data when the query is executed.
+    """
+
+    def __init__(
+        self,
+        kind: Kind,
+        source: Union[Any, Callable[..., Any]],
+        predicates: Tuple[Predicate, ...] = (),
+    ):
+        """Constructor for Query class.
+
+        Args:
+            kind (Kind): Type of model queried.
+            source (Union[Any, Callable[..., Any]]): Collection to query, or a
+                function that requests the collection and accepts server-side
+                filters as keyword arguments.
+            predicates (Tuple[Predicate, ...], optional): Query conditions.
+        """
+        self.kind = kind
+        self.source = source
+        self.predicates = predicates
+
+    def __repr__(self) -> str:
+        try:
+            return f"Query(kind={self.kind!r}, plan={self.plan()!r})"
+        except ValueError:
+            # Query cannot be executed (e.g., server-side filter on a collection)
+            names = [predicate.name for predicate in self.predicates]
+            return f"Query(kind={self.kind!r}, predicates={names!r})"
+
+    def _add(self, predicate: Predicate, *kinds: Kind) -> "Query":
+        if self.kind not in kinds:
+            raise ValueError(
+                f"'{predicate.name}' filter is not available for {self.kind} queries"
+            )
+        return Query(self.kind, self.source, self.predicates + (predicate,))
+
+    def date_range(self, start_date: date, end_date: date) -> "Query":
+        """Match flights acquired within the date range, or projects whose start
+        and end dates overlap it.
+
+        Args:
+            start_date (date): Start of date range (inclusive).
+            end_date (date): End of date range (inclusive).
+
+        Returns:
+            Query: New query with date range filter.
+        """
+        if self.kind == "project":
+
+            def overlaps(project) -> bool:
+                start = getattr(project, "start_date", None)
+                end = getattr(project, "end_date", None)
+                if start is None and end is None:
+                    return False
+                # Open-ended projects overlap every range on their open side
+                return (start is None or start <= end_date) and (
+                    end is None or end >= start_date
+                )
+
+            return self._add(
+                Predicate("date_range", ATTRIBUTE, test=overlaps), "project"
+            )
+
+        def acquired_within(flight) -> bool:
+            acquisition_date = parse_date(flight.acquisition_date)
+            return (
+                acquisition_date is not None
+                and start_date <= acquisition_date <= end_date
+            )
+
+        return self._add(
+            Predicate(
+                "date_range",
+                INDEXED,
+                test=acquired_within,
+                lookup=lambda collection: collection._slice_by_date(
+                    start_date, end_date
+                ),
+            ),
+            "flight",
+        )
+
+    def sensor(self, sensor: str, exact: bool = False) -> "Query":
+        """Match flights with sensor, using the same similarity rules as
+        `FlightCollection.filter_by_sensor`.
+
+        Args:
+            sensor (str): Sensor of interest.
+            exact (bool, optional): Must be exact match. Defaults to False.
+
+        Returns:
+            Query: New query with sensor filter.
+        """
+        return self._add(
+            Predicate(
+                "sensor",
+                INDEXED,
+                test=lambda flight: is_match(sensor, flight.sensor, exact),
+                lookup=lambda collection: collection._match_sensor(sensor, exact),
+            ),
+            "flight",
+        )
+
+    def title(self, keyword: str) -> "Query":
+        """Match projects with titles containing keyword (case insensitive),
+        using the same title index as `ProjectCollection.filter_by_title`.
+
+        Args:
+            keyword (str): Keyword text that will be matched with project titles.
+
+        Returns:
+            Query: New query with title filter.
+        """
+        value = keyword.lower()
+        return self._add(
+            Predicate(
+                "title",
+                INDEXED,
+                test=lambda project: value in (project.title or "").lower(),
+                lookup=lambda collection: list(
+                    collection._text_index("title").substring(keyword)
+                ),
+            ),
+            "project",
+        )
+
+    def platform(self, platform: str) -> "Query":
+        """Match flights with platform (case insensitive).
+
+        Args:
+            platform (str): Platform of interest.
+
+        Returns:
+            Query: New query with platform filter.
+        """
+        value = platform.lower()
+        return self._add(
+            Predicate(
+                "platform",
+                ATTRIBUTE,
+                test=lambda flight: (flight.platform or "").lower() == value,
+            ),
+            "flight",
+        )
+
+    def data_type(self, data_type: str) -> "Query":
+        """Match data products with data type, or flights with at least one data
+        product of the data type (case insensitive).
+
+        Args:
+            data_type (str): Data type of interest.
+
+        Returns:
+            Query: New query with data type filter.
+        """
+        value = data_type.lower()
+        if self.kind == "flight":
+            return self._add(
+                Predicate(
+                    "data_type",
+                    NESTED,
+                    test=lambda flight: any(
+                        (data_product.get("data_type") or "").lower() == value
+                        for data_product in getattr(flight, "data_products", None) or []
+                    ),
+                ),
+                "flight",
+            )
+        return self._add(
+            Predicate(
+                "data_type",
+                ATTRIBUTE,
+                test=lambda data_product: data_product.data_type.lower() == value,
+            ),
+            "data_product",
+        )
+
+    def band_names(self, names: Iterable[str]) -> "Query":
+        """Match data products with every band name or description listed
+        (case insensitive).
+
+        Args:
+            names (Iterable[str]): Band names (e.g., "b1") or descriptions
+                (e.g., "NIR").
+
+        Returns:
+            Query: New query with band filter.
+        """
+        required = {name.lower() for name in names}
+
+        def has_bands(data_product) -> bool:
+            stac_properties = getattr(data_product, "stac_properties", None) or {}
+            bands = set()
+            for band in stac_properties.get("eo") or []:
+                bands.add(str(band.get("name", "")).lower())
+                bands.add(str(band.get("description", "")).lower())
+            return required <= bands
+
+        return self._add(
+            Predicate("band_names", NESTED, test=has_bands), "data_product"
+        )
+
+    def intersects(self, bbox: Sequence[float]) -> "Query":
+        """Match data products whose bounding box, or projects whose boundary
+        (or centroid if the boundary is not loaded), intersects the bounding box.
+
+        Args:
+            bbox (Sequence[float]): Bounding box (min x, min y, max x, max y) in
+                the same coordinate system as the models (EPSG:4326).
+
+        Returns:
+            Query: New query with bounding box filter.
+        """
+        if len(bbox) != 4:
+            raise ValueError("bbox must be (min x, min y, max x, max y)")
+        query_bbox: BBox = (bbox[0], bbox[1], bbox[2], bbox[3])
+
+        def test(instance) -> bool:
+            instance_bbox = model_bbox(instance)
+            return instance_bbox is not None and bboxes_intersect(
+                instance_bbox, query_bbox
+            )
+
+        return self._add(
+            Predicate("intersects", GEOMETRY, test=test), "project", "data_product"
+        )
+
+    def has_raster(self, has_raster: bool = True) -> "Query":
+        """Match projects or flights with raster data products. Evaluated by the
+        D2S server, so the query must request its data when executed.
+
+        Args:
+            has_raster (bool, optional): Only return models with rasters.
+                Defaults to True.
+
+        Returns:
+            Query: New query with raster filter.
+        """
+        return self._add(
+            Predicate("has_raster", INDEXED, server_param=("has_raster", has_raster)),
+            "project",
+            "flight",
+        )
+
+    def where(self, test: Callable[[Any], bool], name: str = "where") -> "Query":
+        """Match models for which `test` returns True.
+
+        Args:
+            test (Callable[[Any], bool]): Custom condition.
+            name (str, optional): Name shown in the query plan. Defaults to "where".
+
+        Returns:
+            Query: New query with custom filter.
+        """
+        return Query(
+            self.kind,
+            self.source,
+            self.predicates + (Predicate(name, CUSTOM, test=test),),
+        )
+
+    def plan(self) -> List[str]:
+        """Returns the order in which predicates will be evaluated.
+
+        Returns:
+            List[str]: Predicate names prefixed with where they are evaluated
+                ("server", "index", or "scan").
+        """
+        server, indexed, scanned = self._plan()
+        return (
+            [f"server:{predicate.name}" for predicate in server]
+            + [f"index:{predicate.name}" for predicate in indexed]
+            + [f"scan:{predicate.name}" for predicate in scanned]
+        )
+
+    def _plan(self) -> Tuple[List[Predicate], List[Predicate], List[Predicate]]:
+        """Split predicates into server-side, indexed, and scanned predicates."""
+        fetches = callable(self.source)
+        server = [predicate for predicate in self.predicates if predicate.server_param]
+        if server and not fetches:
+            raise ValueError(
+                "Server-side filters (e.g., has_raster) require a query that "
+                "requests its data, such as Project.query_flights()"
+            )
+
+        local = sorted(
+            (predicate for predicate in self.predicates if not predicate.server_param),
+            key=lambda predicate: predicate.cost,
+        )
+        # Only the cheapest indexed predicate selects candidates
+        indexed = [predicate for predicate in local[:1] if predicate.lookup]
+        scanned = [predicate for predicate in local if predicate not in indexed]
+        return server, indexed, scanned
+
+    def execute(self):
+        """Evaluate query.
+
+        Returns:
+            Union[ProjectCollection, FlightCollection, DataProductCollection]:
+                Collection of matching models in collection order.
+        """
+        server, indexed, scanned = self._plan()
+
+        if callable(self.source):
+            params: Dict[str, Any] = dict(
+                predicate.server_param for predicate in server  # type: ignore
+            )
+            collection = self.source(**params)
+        else:
+            collection = self.source
+
+        if indexed and indexed[0].lookup is not None:
+            candidates = sorted(indexed[0].lookup(collection))
+        else:
+            candidates = range(len(collection.collection))
+
+        tests = [predicate.test for predicate in scanned if predicate.test]
+        matches = [
+            collection.collection[position]
+            for position in candidates
+            if all(test(collection.collection[position]) for test in tests)
+        ]
+
+        return type(collection)(collection=matches)
+
+    def __iter__(self):
+        return iter(self.execute())
+
+
+def model_bbox(instance) -> Optional[BBox]:
+    """Returns bounding box of a data product or project if available.
+
+    Args:
+        instance (Any): Data product or project.
+
+    Returns:
+        Optional[BBox]: Bounding box (min x, min y, max x, max y) or None.
+    """
+    bbox = getattr(instance, "bbox", None)
+    if bbox and len(bbox) == 4:
+        return (bbox[0], bbox[1], bbox[2], bbox[3])
+
+    field = getattr(instance, "field", None)
+    if field and field.get("geometry"):
+        xs: List[float] = []
+        ys: List[float] = []
+        for ring in field["geometry"]["coordinates"]:
+            for x, y in ring:
+                xs.append(x)
+                ys.append(y)
+        if xs:
+            return (min(xs), min(ys), max(xs), max(ys))
+
+    centroid = getattr(instance, "centroid", None)
+    if centroid:
+        return (centroid["x"], centroid["y"], centroid["x"], centroid["y"])
+
+    return None
+
+
+def bboxes_intersect(a: BBox, b: BBox) -> bool:
+    """Returns True if two bounding boxes intersect.
+
+    Args:
+        a (BBox): First bounding box.
+        b (BBox): Second bounding box.
+
+    Returns:
+        bool: True if bounding boxes intersect.
+    """
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
@@ -1,11 +1,17 @@
-from d2spy.api_client import APIClient
+from d2spy.models.base import Model
 
 
-class RawData:
-    def __init__(self, client: APIClient, **kwargs):
-        self.client = client
-        # raw data attributes returned from API
-        self.__dict__.update(kwargs)
+class RawData(Model):
+    __slots__ = (
+        "id",
+        "filepath",
+        "original_filename",
+        "is_active",
+        "flight_id",
+        "deactivated_at",
+        "status",
+        "url",
+    )
 
     def __repr__(self):
         return (
@@ -0,0 +1,376 @@
+import json
+from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence
+
+from d2spy import models
+from d2spy.api_client import APIClient
+from d2spy.extras.geo import require_geo
+from d2spy.identity_map import build_model
+from d2spy.models.data_product_collection import DataProductCollection
+from d2spy.models.project_collection import ProjectCollection
+from d2spy.utils.logging_config import get_logger
+
+
+Kind = Literal["project", "data_product", "feature"]
+KINDS = ("project", "data_product", "feature")
+Predicate = Literal[
+    "intersects", "within", "contains", "overlaps", "crosses", "touches", "covers"
+]
+
+# Version of the file format written by SpatialIndex.save
+FORMAT_VERSION = 1
+
+logger = get_logger(__name__)
+
+
+class SpatialIndex:
+    """STRtree index over project boundaries, data product bounding boxes, and
+    map layer features.
+
+    Each kind of geometry has its own tree, so that a query only visits the
+    entries of the kind it asks for and, like an R-tree, only the tree nodes
+    whose extent intersects the query geometry. Trees are built on the first
+    query after entries are added. Geometries are in the coordinate system of
+    the D2S API (EPSG:4326).
+
+    Requires: pip install d2spy[geo]
+    """
+
+    def __init__(self):
+        """Constructor for SpatialIndex class."""
+        require_geo()
+
+        self._geometries: Dict[str, List[Any]] = {kind: [] for kind in KINDS}
+        self._items: Dict[str, List[Any]] = {kind: [] for kind in KINDS}
+        self._project_ids: Dict[str, List[Optional[str]]] = {kind: [] for kind in KINDS}
+        # Boundaries passed to add_project, saved with projects that have none
+        self._boundaries: Dict[str, Dict[str, Any]] = {}
+        self._trees: Dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._items.values())
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{kind}s={len(self._items[kind])}" for kind in KINDS)
+        return f"SpatialIndex({counts})"
+
+    @classmethod
+    def from_workspace(
+        cls,
+        workspace,
+        boundaries: bool = True,
+        map_layers: bool = True,
+        has_raster: Optional[bool] = False,
+    ) -> "SpatialIndex":
+        """Build index over every project, data product, and map layer feature of
+        a workspace.
+
+        Args:
+            workspace (Workspace): Workspace to index.
+            boundaries (bool, optional): Request project boundaries (one request
+                per project). Projects are indexed by their centroid otherwise.
+                Defaults to True.
+            map_layers (bool, optional): Index map layer features (one streamed
+                request per project). Defaults to True.
+            has_raster (Optional[bool], optional): Only index projects and
+                flights with rasters. Defaults to False.
+
+        Returns:
+            SpatialIndex: Index over the workspace.
+        """
+        index = cls()
+        for project in workspace.get_projects(has_raster=has_raster):
+            project_id = str(project.id)
+            boundary = project.get_project_boundary() if boundaries else None
+            index.add_project(project, boundary=boundary)
+            for flight in project.get_flights(has_raster=has_raster):
+                index.add_data_products(
+                    flight.get_data_products(), project_id=project_id
+                )
+            if map_layers:
+                index.add_features(
+                    project.iter_map_layer_features(), project_id=project_id
+                )
+        return index
+
+    def add_project(
+        self, project: "models.Project", boundary: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Add project by its boundary, or by its centroid if the boundary is not
+        given or loaded.
+
+        Args:
+            project (models.Project): Project to add.
+            boundary (Optional[Dict[str, Any]], optional): Project boundary
+                GeoJSON Feature (e.g., from `Project.get_project_boundary`).
+        """
+        from shapely.geometry import Point, shape
+
+        if boundary:
+            self._boundaries[str(project.id)] = boundary
+        else:
+            boundary = getattr(project, "field", None)
+        centroid = getattr(project, "centroid", None)
+        if boundary and boundary.get("geometry"):
+            geometry = shape(boundary["geometry"])
+        elif centroid:
+            geometry = Point(centroid["x"], centroid["y"])
+        else:
+            logger.warning(f"Project {project.id} has no boundary or centroid")
+            return
+        self._add("project", geometry, project, str(project.id))
+
+    def add_projects(self, projects: Iterable["models.Project"]) -> None:
+        """Add projects by their boundaries or centroids.
+
+        Args:
+            projects (Iterable[models.Project]): Projects to add.
+        """
+        for project in projects:
+            self.add_project(project)
+
+    def add_data_products(
+        self,
+        data_products: Iterable["models.DataProduct"],
+        project_id: Optional[str] = None,
+    ) -> None:
+        """Add data products by their bounding boxes. Data products without a
+        bounding box are skipped.
+
+        Args:
+            data_products (Iterable[models.DataProduct]): Data products to add.
+            project_id (Optional[str], optional): ID of project the data products
+                belong to.
+        """
+        from shapely.geometry import box
+
+        for data_product in data_products:
+            bbox = getattr(data_product, "bbox", None)
+            if bbox and len(bbox) == 4:
+                self._add("data_product", box(*bbox), data_product, project_id)
+
+    def add_features(
+        self, features: Iterable[Dict[str, Any]], project_id: Optional[str] = None
+    ) -> None:
+        """Add GeoJSON Features (e.g., from `Project.iter_map_layer_features`).
+        Features without a geometry are skipped.
+
+        Args:
+            features (Iterable[Dict[str, Any]]): GeoJSON Features to add.
+            project_id (Optional[str], optional): ID of project the features
+                belong to.
+        """
+        from shapely.geometry import shape
+
+        for feature in features:
+            if feature.get("geometry"):
+                self._add("feature", shape(feature["geometry"]), feature, project_id)
+
+    def _add(
+        self, kind: str, geometry: Any, item: Any, project_id: Optional[str]
+    ) -> None:
+        self._geometries[kind].append(geometry)
+        self._items[kind].append(item)
+        self._project_ids[kind].append(project_id)
+        # Trees can not be extended, rebuild on next query
+        self._trees.pop(kind, None)
+
+    def _tree(self, kind: str):
+        """Return STRtree for kind, building it first if missing or stale."""
+        if kind not in self._trees:
+            from shapely import STRtree
+
+            self._trees[kind] = STRtree(self._geometries[kind])
+        return self._trees[kind]
+
+    def query(
+        self,
+        geometry: Any,
+        kind: Kind,
+        predicate: Predicate = "intersects",
+        project_id: Optional[str] = None,
+    ) -> List[Any]:
+        """Returns indexed items of kind for which `predicate(geometry, item)` is
+        true, in the order they were added.
+
+        Args:
+            geometry (Any): Shapely geometry, GeoJSON geometry or Feature,
+                bounding box (min x, min y, max x, max y), or a project or data
+                product.
+            kind (Kind): Kind of items to return ("project", "data_product", or
+                "feature").
+            predicate (Predicate, optional): Spatial relationship between the
+                query geometry and the items, e.g., "contains" returns items
+                within the query geometry. Defaults to "intersects".
+            project_id (Optional[str], optional): Only return items of project.
+
+        Returns:
+            List[Any]: Matching projects, data products, or GeoJSON Features.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of: {', '.join(KINDS)}")
+        if not self._items[kind]:
+            return []
+
+        positions = sorted(
+            self._tree(kind).query(to_geometry(geometry), predicate=predicate)
+        )
+        items = self._items[kind]
+        if project_id is None:
+            return [items[position] for position in positions]
+        project_ids = self._project_ids[kind]
+        return [
+            items[position]
+            for position in positions
+            if project_ids[position] == str(project_id)
+        ]
+
+    def data_products_intersecting(self, geometry: Any) -> DataProductCollection:
+        """Returns data products whose bounding box intersects the geometry.
+
+        Args:
+            geometry (Any): Shapely geometry, GeoJSON geometry or Feature, or
+                bounding box (min x, min y, max x, max y).
+
+        Returns:
+            DataProductCollection: Matching data products.
+        """
+        return DataProductCollection(
+            collection=self.query(geometry, "data_product", "intersects")
+        )
+
+    def projects_intersecting(self, geometry: Any) -> ProjectCollection:
+        """Returns projects whose boundary (or centroid) intersects the geometry.
+
+        Args:
+            geometry (Any): Shapely geometry, GeoJSON geometry or Feature, or
+                bounding box (min x, min y, max x, max y).
+
+        Returns:
+            ProjectCollection: Matching projects.
+        """
+        return ProjectCollection(
+            collection=self.query(geometry, "project", "intersects")
+        )
+
+    def features_within(
+        self, geometry: Any, project_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Returns map layer features that lie within the geometry, such as the
+        plots covered by a data product.
+
+        Args:
+            geometry (Any): Data product, project, shapely geometry, GeoJSON
+                geometry or Feature, or bounding box.
+            project_id (Optional[str], optional): Only return features of project.
+
+        Returns:
+            List[Dict[str, Any]]: Matching GeoJSON Features.
+        """
+        return self.query(geometry, "feature", "contains", project_id=project_id)
+
+    def save(self, filepath: str) -> None:
+        """Save indexed geometries and items to a JSON file, e.g., next to a local
+        cache of the workspace. Trees are rebuilt when the file is loaded.
+
+        Args:
+            filepath (str): Path of file to write.
+        """
+        import shapely
+
+        kinds = {}
+        for kind in KINDS:
+            items = self._items[kind]
+            rows = [item.to_dict() if kind != "feature" else item for item in items]
+            if kind == "project":
+                for row in rows:
+                    boundary = self._boundaries.get(str(row.get("id")))
+                    if boundary and row.get("field") is None:
+                        row["field"] = boundary
+            kinds[kind] = {
+                "geometries": list(
+                    shapely.to_wkb(self._geometries[kind], hex=True) if items else []
+                ),
+                "items": rows,
+                "project_ids": self._project_ids[kind],
+            }
+
+        with open(filepath, "w") as index_file:
+            json.dump(
+                {"version": FORMAT_VERSION, "kinds": kinds}, index_file, default=str
+            )
+
+    @classmethod
+    def load(cls, filepath: str, client: APIClient) -> "SpatialIndex":
+        """Load index saved with `save`.
+
+        Args:
+            filepath (str): Path of saved index.
+            client (APIClient): Client for the loaded projects and data products
+                (e.g., `workspace.client`).
+
+        Raises:
+            ValueError: Raised if the file was written by an unsupported version.
+
+        Returns:
+            SpatialIndex: Loaded index.
+        """
+        import shapely
+
+        with open(filepath) as index_file:
+            data = json.load(index_file)
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported spatial index version: {data.get('version')!r}"
+            )
+
+        index = cls()
+        model_classes = {"project": models.Project, "data_product": models.DataProduct}
+        for kind in KINDS:
+            saved = data["kinds"].get(kind)
+            if not saved or not saved["items"]:
+                continue
+            model_class = model_classes.get(kind)
+            index._geometries[kind] = list(shapely.from_wkb(saved["geometries"]))
+            index._items[kind] = [
+                build_model(model_class, client, item) if model_class else item
+                for item in saved["items"]
+            ]
+            index._project_ids[kind] = saved["project_ids"]
+        return index
+
+
+def to_geometry(value: Any):
+    """Convert query argument to a shapely geometry.
+
+    Args:
+        value (Any): Shapely geometry, GeoJSON geometry or Feature, bounding box
+            (min x, min y, max x, max y), or a project or data product.
+
+    Raises:
+        ValueError: Raised if the value can not be converted.
+
+    Returns:
+        shapely.Geometry: Geometry.
+    """
+    import shapely
+    from shapely.geometry import box, shape
+
+    if isinstance(value, shapely.Geometry):
+        return value
+    if isinstance(value, dict):
+        if value.get("type") == "Feature":
+            return shape(value["geometry"])
+        return shape(value)
+    if isinstance(value, Sequence) and len(value) == 4:
+        return box(*value)
+
+    bbox = getattr(value, "bbox", None)
+    if bbox and len(bbox) == 4:
+        return box(*bbox)
+    field = getattr(value, "field", None)
+    if field and field.get("geometry"):
+        return shape(field["geometry"])
+
+    raise ValueError(
+        "Expected a geometry, GeoJSON, bounding box, project, or data product"
+    )
@@ -0,0 +1,118 @@
+import re
+from bisect import bisect_left
+from typing import Dict, Iterator, Sequence, Set
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class TextIndex:
+    """Inverted index over a list of texts that answers case-insensitive
+    substring and token prefix queries without scanning every text.
+
+    Substring queries intersect the postings of the query's n-grams and verify
+    the remaining candidates. Prefix queries find matching tokens with a binary
+    search over the sorted token vocabulary.
+    """
+
+    def __init__(self, texts: Sequence[str], n: int = 3):
+        """Constructor for TextIndex class.
+
+        Args:
+            texts (Sequence[str]): Texts to index. Missing texts are indexed as "".
+            n (int, optional): Length of n-grams. Defaults to 3.
+        """
+        self.n = n
+        self.texts = [(text or "").lower() for text in texts]
+
+        self._ngrams: Dict[str, Set[int]] = {}
+        self._tokens: Dict[str, Set[int]] = {}
+        for position, text in enumerate(self.texts):
+            for ngram in iter_ngrams(text, n):
+                self._ngrams.setdefault(ngram, set()).add(position)
+            for token in TOKEN_PATTERN.findall(text):
+                self._tokens.setdefault(token, set()).add(position)
+
+        self._vocabulary = sorted(self._tokens)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def substring(self, query: str) -> Set[int]:
+        """Returns positions of texts containing query.
+
+        Args:
+            query (str): Case-insensitive text to find.
+
+        Returns:
+            Set[int]: Positions of matching texts.
+        """
+        query = query.lower()
+        if not query:
+            return set(range(len(self.texts)))
+
+        if len(query) < self.n:
+            # Short queries match most texts, scanning is as fast as the index
+            return {
+                position for position, text in enumerate(self.texts) if query in text
+            }
+
+        postings = []
+        for ngram in iter_ngrams(query, self.n):
+            posting = self._ngrams.get(ngram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = postings[0].intersection(*postings[1:])
+
+        if len(query) == self.n:
+            # Single n-gram postings are exact
+            return candidates
+
+        return {position for position in candidates if query in self.texts[position]}
+
+    def prefix(self, query: str) -> Set[int]:
+        """Returns positions of texts with a token that starts with query.
+
+        Args:
+            query (str): Case-insensitive token prefix.
+
+        Returns:
+            Set[int]: Positions of matching texts.
+        """
+        query = query.lower()
+        positions: Set[int] = set()
+        index = bisect_left(self._vocabulary, query)
+        while index < len(self._vocabulary) and self._vocabulary[index].startswith(
+            query
+        ):
+            positions.update(self._tokens[self._vocabulary[index]])
+            index += 1
+        return positions
+
+    def token(self, query: str) -> Set[int]:
+        """Returns positions of texts containing query as a whole token.
+
+        Args:
+            query (str): Case-insensitive token.
+
+        Returns:
+            Set[int]: Positions of matching texts.
+        """
+        return set(self._tokens.get(query.lower(), ()))
+
+
+def iter_ngrams(text: str, n: int) -> Iterator[str]:
+    """Yields every substring of length n in text.
+
+    Args:
+        text (str): Text to split.
+        n (int): Length of n-grams.
+
+    Yields:
+        str: N-gram.
+    """
+    for start in range(len(text) - n + 1):
+        stop = start + n
+        yield text[start:stop]
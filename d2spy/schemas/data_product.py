@@ -1,6 +1,6 @@
 from datetime import datetime
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 from uuid import UUID
 
 from d2spy.schemas.stac_properties import STACProperties
@@ -24,6 +24,9 @@ class DataProduct:
     crs: Optional[Dict] = None
     resolution: Optional[Dict] = None
 
+    # Fields that may be missing from API rows
+    optional_fields: ClassVar[Tuple[str, ...]] = ("deactivated_at",)
+
     @classmethod
     def from_dict(cls, data: Dict) -> "DataProduct":
         return cls(
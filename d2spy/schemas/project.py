@@ -1,9 +1,10 @@
 from datetime import date, datetime
 from dataclasses import dataclass
-from typing import Any, Dict, Literal, Optional, TypedDict
+from typing import Any, ClassVar, Dict, Literal, Optional, Tuple, TypedDict
 from uuid import UUID
 
 from d2spy.schemas.geojson import ProjectBoundaryGeoJSON
+from d2spy.utils.dates import parse_date
 
 
 @dataclass
@@ -21,20 +22,20 @@ class Project:
     team_id: Optional[UUID]
     title: str
 
+    # Fields that may be missing from API rows (older rows use planting_date and
+    # harvest_date)
+    optional_fields: ClassVar[Tuple[str, ...]] = ("start_date", "end_date")
+
     @classmethod
     def from_dict(cls, data: Dict[Any, Any]) -> "Project":
         start_date = data.get("start_date") or data.get("planting_date")
         start_date_deserialized = (
-            datetime.strptime(start_date, "%Y-%m-%d").date()
-            if isinstance(start_date, str)
-            else None
+            parse_date(start_date) if isinstance(start_date, str) else None
         )
 
         end_date = data.get("end_date") or data.get("harvest_date")
         end_date_deserialized = (
-            datetime.strptime(end_date, "%Y-%m-%d").date()
-            if isinstance(end_date, str)
-            else None
+            parse_date(end_date) if isinstance(end_date, str) else None
         )
 
         return cls(
@@ -69,20 +70,20 @@ class MultiProject:
     start_date: Optional[date]
     title: str
 
+    # Fields that may be missing from API rows (older rows use planting_date and
+    # harvest_date)
+    optional_fields: ClassVar[Tuple[str, ...]] = ("start_date", "end_date")
+
     @classmethod
     def from_dict(cls, data: dict) -> "MultiProject":
         start_date = data.get("start_date") or data.get("planting_date")
         start_date_deserialized = (
-            datetime.strptime(start_date, "%Y-%m-%d").date()
-            if isinstance(start_date, str)
-            else None
+            parse_date(start_date) if isinstance(start_date, str) else None
         )
 
         end_date = data.get("end_date") or data.get("harvest_date")
         end_date_deserialized = (
-            datetime.strptime(end_date, "%Y-%m-%d").date()
-            if isinstance(end_date, str)
-            else None
+            parse_date(end_date) if isinstance(end_date, str) else None
         )
 
         return cls(
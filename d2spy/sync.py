@@ -0,0 +1,325 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Literal, Optional, Set, Tuple
+
+from d2spy import models
+from d2spy.utils.logging_config import get_logger
+
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SyncEvent:
+    """Change detected between two synchronizations of a workspace."""
+
+    action: Literal["added", "removed", "changed"]
+    kind: Literal["project", "flight", "data_product"]
+    id: str
+    # Model instance for added/changed entities, last known instance for removed
+    obj: Optional[Any] = None
+
+
+class WorkspaceSync:
+    """Incrementally synchronizes the projects, flights, and data products of a
+    workspace. Per-project and per-flight fingerprints are kept between calls to
+    `sync` so that only the subtrees that changed on the D2S instance are
+    requested again.
+
+    A sync always requests the list of projects. Flights are only requested for
+    projects that are new or whose fingerprint (flight count, deactivation time)
+    changed, and data products are only requested for flights that are new or
+    whose fingerprint (data product IDs and statuses, deactivation time) changed.
+    Because adding a data product does not change a project's flight count, pass
+    `deep=True` to also request the flights of unchanged projects (one request
+    per project) when data product changes must be detected.
+    """
+
+    def __init__(self, workspace, deep: bool = False):
+        """Constructor for WorkspaceSync class.
+
+        Args:
+            workspace (Workspace): Workspace that will be synchronized.
+            deep (bool, optional): Check flights of unchanged projects for data
+                product changes. Defaults to False.
+        """
+        self.workspace = workspace
+        self.deep = deep
+
+        # Last known model instances keyed by ID
+        self.projects: Dict[str, models.Project] = {}
+        self.flights: Dict[str, models.Flight] = {}
+        self.data_products: Dict[str, models.DataProduct] = {}
+
+        # Fingerprints from previous sync
+        self._project_fingerprints: Dict[str, Hashable] = {}
+        self._project_snapshots: Dict[str, Hashable] = {}
+        self._flight_fingerprints: Dict[str, Hashable] = {}
+        # Statuses are stored separately because an identity map refreshes the
+        # last known instances in place
+        self._data_product_statuses: Dict[str, Optional[str]] = {}
+
+        # Tree structure from previous sync
+        self._project_flights: Dict[str, Set[str]] = {}
+        self._flight_data_products: Dict[str, Set[str]] = {}
+
+        # Number of requests made during the most recent sync
+        self.request_count = 0
+
+    def sync(self, has_raster: Optional[bool] = False) -> List[SyncEvent]:
+        """Synchronize with the D2S instance and return the detected changes. The
+        first call reports every project, flight, and data product as added.
+
+        Args:
+            has_raster (Optional[bool], optional): Only sync projects and flights
+                with rasters. Defaults to False.
+
+        Returns:
+            List[SyncEvent]: Added, removed, and changed entities.
+        """
+        events: List[SyncEvent] = []
+        self.request_count = 1
+
+        projects = self.workspace.get_projects(has_raster=has_raster)
+        seen_projects = set()
+
+        for project in projects:
+            project_id = str(project.id)
+            seen_projects.add(project_id)
+
+            fingerprint = project_fingerprint(project)
+            snapshot = project_snapshot(project)
+
+            if project_id not in self.projects:
+                events.append(SyncEvent("added", "project", project_id, project))
+                refresh = True
+            else:
+                refresh = self._project_fingerprints[project_id] != fingerprint
+                if refresh or self._project_snapshots[project_id] != snapshot:
+                    events.append(SyncEvent("changed", "project", project_id, project))
+
+            self.projects[project_id] = project
+            self._project_fingerprints[project_id] = fingerprint
+            self._project_snapshots[project_id] = snapshot
+
+            if refresh or self.deep:
+                events.extend(self._sync_flights(project, has_raster))
+
+        for project_id in list(self.projects.keys() - seen_projects):
+            events.extend(self._remove_project(project_id))
+
+        logger.debug(
+            f"Sync finished with {len(events)} events and "
+            f"{self.request_count} requests"
+        )
+
+        return events
+
+    def _sync_flights(
+        self, project: models.Project, has_raster: Optional[bool]
+    ) -> List[SyncEvent]:
+        """Request flights for a project and diff them against the last sync.
+
+        Args:
+            project (models.Project): Project with new or changed fingerprint.
+            has_raster (Optional[bool]): Only return flights with rasters.
+
+        Returns:
+            List[SyncEvent]: Flight and data product events.
+        """
+        events: List[SyncEvent] = []
+        project_id = str(project.id)
+
+        flights = project.get_flights(has_raster=has_raster)
+        self.request_count += 1
+
+        previous_flights = self._project_flights.get(project_id, set())
+        seen_flights = set()
+
+        for flight in flights.collection:
+            flight_id = str(flight.id)
+            seen_flights.add(flight_id)
+
+            fingerprint = flight_fingerprint(flight)
+
+            if flight_id not in self.flights:
+                events.append(SyncEvent("added", "flight", flight_id, flight))
+                refresh = True
+            else:
+                refresh = self._flight_fingerprints[flight_id] != fingerprint
+                if refresh:
+                    events.append(SyncEvent("changed", "flight", flight_id, flight))
+
+            self.flights[flight_id] = flight
+            self._flight_fingerprints[flight_id] = fingerprint
+
+            if refresh:
+                events.extend(self._sync_data_products(flight, fingerprint))
+
+        for flight_id in previous_flights - seen_flights:
+            events.extend(self._remove_flight(flight_id))
+
+        self._project_flights[project_id] = seen_flights
+
+        return events
+
+    def _sync_data_products(
+        self, flight: models.Flight, fingerprint: Tuple
+    ) -> List[SyncEvent]:
+        """Request data products for a flight and diff them against the last sync.
+
+        Args:
+            flight (models.Flight): Flight with new or changed fingerprint.
+            fingerprint (Tuple): Current fingerprint of the flight.
+
+        Returns:
+            List[SyncEvent]: Data product events.
+        """
+        events: List[SyncEvent] = []
+        flight_id = str(flight.id)
+        previous_data_products = self._flight_data_products.get(flight_id, set())
+
+        # Skip request if the flight has never had any data products
+        if not fingerprint[1] and not previous_data_products:
+            self._flight_data_products[flight_id] = set()
+            return events
+
+        data_products = flight.get_data_products()
+        self.request_count += 1
+
+        seen_data_products = set()
+
+        for data_product in data_products.collection:
+            data_product_id = str(data_product.id)
+            seen_data_products.add(data_product_id)
+
+            if data_product_id not in self.data_products:
+                events.append(
+                    SyncEvent("added", "data_product", data_product_id, data_product)
+                )
+            elif self._data_product_statuses[data_product_id] != data_product.status:
+                events.append(
+                    SyncEvent("changed", "data_product", data_product_id, data_product)
+                )
+
+            self.data_products[data_product_id] = data_product
+            self._data_product_statuses[data_product_id] = data_product.status
+
+        for data_product_id in previous_data_products - seen_data_products:
+            events.append(
+                SyncEvent(
+                    "removed",
+                    "data_product",
+                    data_product_id,
+                    self._forget_data_product(data_product_id),
+                )
+            )
+
+        self._flight_data_products[flight_id] = seen_data_products
+
+        return events
+
+    def _forget_data_product(self, data_product_id: str) -> Optional[Any]:
+        """Forget a data product and return its last known instance."""
+        self._data_product_statuses.pop(data_product_id, None)
+        return self.data_products.pop(data_product_id, None)
+
+    def _remove_flight(self, flight_id: str) -> List[SyncEvent]:
+        """Forget a flight and its data products.
+
+        Args:
+            flight_id (str): ID of removed flight.
+
+        Returns:
+            List[SyncEvent]: Removal events for the flight and its data products.
+        """
+        events = [
+            SyncEvent(
+                "removed",
+                "data_product",
+                data_product_id,
+                self._forget_data_product(data_product_id),
+            )
+            for data_product_id in self._flight_data_products.pop(flight_id, set())
+        ]
+        self._flight_fingerprints.pop(flight_id, None)
+        events.append(
+            SyncEvent("removed", "flight", flight_id, self.flights.pop(flight_id, None))
+        )
+        return events
+
+    def _remove_project(self, project_id: str) -> List[SyncEvent]:
+        """Forget a project and all of its flights and data products.
+
+        Args:
+            project_id (str): ID of removed project.
+
+        Returns:
+            List[SyncEvent]: Removal events for the project subtree.
+        """
+        events: List[SyncEvent] = []
+        for flight_id in self._project_flights.pop(project_id, set()):
+            events.extend(self._remove_flight(flight_id))
+
+        self._project_fingerprints.pop(project_id, None)
+        self._project_snapshots.pop(project_id, None)
+        events.append(
+            SyncEvent(
+                "removed", "project", project_id, self.projects.pop(project_id, None)
+            )
+        )
+        return events
+
+
+def project_fingerprint(project: models.Project) -> Tuple:
+    """Returns fingerprint that changes when a project's flights change.
+
+    Args:
+        project (models.Project): Project returned by the projects endpoint.
+
+    Returns:
+        Tuple: Flight count and deactivation time.
+    """
+    return (
+        getattr(project, "flight_count", None),
+        str(getattr(project, "deactivated_at", None)),
+    )
+
+
+def project_snapshot(project: models.Project) -> Tuple:
+    """Returns project attributes that are reported as changes without requesting
+    the project's flights again.
+
+    Args:
+        project (models.Project): Project returned by the projects endpoint.
+
+    Returns:
+        Tuple: Title, description, role, and date range.
+    """
+    return (
+        getattr(project, "title", None),
+        getattr(project, "description", None),
+        getattr(project, "role", None),
+        str(getattr(project, "start_date", None)),
+        str(getattr(project, "end_date", None)),
+    )
+
+
+def flight_fingerprint(flight: models.Flight) -> Tuple:
+    """Returns fingerprint that changes when a flight's data products change.
+
+    Args:
+        flight (models.Flight): Flight returned by the flights endpoint.
+
+    Returns:
+        Tuple: Deactivation time and sorted data product IDs and statuses.
+    """
+    data_products = getattr(flight, "data_products", None) or []
+    return (
+        str(getattr(flight, "deactivated_at", None)),
+        tuple(
+            sorted(
+                (str(data_product["id"]), data_product.get("status"))
+                for data_product in data_products
+            )
+        ),
+    )
@@ -0,0 +1,129 @@
+"""
+Synthetic geotagged images for benchmarks and tests.
+
+Images are minimal JPEG files that contain only an EXIF segment with GPS
+latitude and longitude, so thousands of them can be written in seconds.
+"""
+
+import os
+import random
+import struct
+from typing import List, Optional, Sequence, Tuple
+
+
+def dms(value: float) -> Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]:
+    """Convert decimal degrees to degrees, minutes, and seconds EXIF rationals.
+
+    Args:
+        value (float): Decimal degrees.
+
+    Returns:
+        Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]: Degrees,
+            minutes, and seconds as (numerator, denominator) pairs.
+    """
+    value = abs(value)
+    degrees = int(value)
+    minutes = int((value - degrees) * 60)
+    seconds = round(((value - degrees) * 60 - minutes) * 60 * 10000)
+    return (degrees, 1), (minutes, 1), (seconds, 10000)
+
+
+def jpeg_with_gps(
+    lat: float, lon: float, padding: int = 0, maker_note: int = 0
+) -> bytes:
+    """Returns bytes of a minimal JPEG with GPS coordinates in its EXIF data.
+
+    Args:
+        lat (float): Latitude in decimal degrees.
+        lon (float): Longitude in decimal degrees.
+        padding (int, optional): Bytes of filler image data appended after the
+            EXIF segment to mimic image size. Defaults to 0.
+        maker_note (int, optional): Size of a MakerNote tag added in an EXIF
+            IFD to mimic camera metadata (e.g., DJI cameras write several KiB).
+            Defaults to 0 (no EXIF IFD).
+
+    Returns:
+        bytes: JPEG file contents.
+    """
+    # TIFF header, IFD0 with a GPS IFD pointer (and EXIF IFD pointer), GPS IFD
+    # with four tags, and an optional EXIF IFD with a MakerNote
+    entries = 2 if maker_note else 1
+    ifd0_offset = 8
+    gps_offset = ifd0_offset + 2 + entries * 12 + 4
+    rationals_offset = gps_offset + 2 + 4 * 12 + 4
+    exif_offset = rationals_offset + 48
+
+    tiff = bytearray(b"II*\x00" + struct.pack("<I", ifd0_offset))
+    tiff += struct.pack("<H", entries)
+    if maker_note:
+        tiff += struct.pack("<HHII", 0x8769, 4, 1, exif_offset)
+    tiff += struct.pack("<HHII", 0x8825, 4, 1, gps_offset)
+    tiff += struct.pack("<I", 0)
+
+    lat_ref = b"N\x00\x00\x00" if lat >= 0 else b"S\x00\x00\x00"
+    lon_ref = b"E\x00\x00\x00" if lon >= 0 else b"W\x00\x00\x00"
+    tiff += struct.pack("<H", 4)
+    tiff += struct.pack("<HHI", 1, 2, 2) + lat_ref
+    tiff += struct.pack("<HHII", 2, 5, 3, rationals_offset)
+    tiff += struct.pack("<HHI", 3, 2, 2) + lon_ref
+    tiff += struct.pack("<HHII", 4, 5, 3, rationals_offset + 24)
+    tiff += struct.pack("<I", 0)
+
+    for value in (lat, lon):
+        for numerator, denominator in dms(value):
+            tiff += struct.pack("<II", numerator, denominator)
+
+    if maker_note:
+        tiff += struct.pack("<H", 1)
+        tiff += struct.pack("<HHII", 0x927C, 7, maker_note, exif_offset + 18)
+        tiff += struct.pack("<I", 0)
+        tiff += bytes(range(256)) * (maker_note // 256) + bytes(maker_note % 256)
+
+    exif = b"Exif\x00\x00" + bytes(tiff)
+    app1 = b"\xff\xe1" + struct.pack(">H", len(exif) + 2) + exif
+    filler = b"\xff\xfe" + struct.pack(">H", 2) if not padding else b""
+    body = b"\x00" * padding
+    return b"\xff\xd8" + app1 + filler + body + b"\xff\xd9"
+
+
+def write_geotagged_images(
+    folder: str,
+    count: int,
+    bbox: Sequence[float] = (-86.95, 40.40, -86.94, 40.41),
+    padding: int = 0,
+    seed: int = 0,
+    coordinates: Optional[List[Tuple[float, float]]] = None,
+    maker_note: int = 0,
+) -> List[str]:
+    """Write synthetic geotagged JPEG images to folder.
+
+    Args:
+        folder (str): Output folder.
+        count (int): Number of images.
+        bbox (Sequence[float], optional): Bounding box (min lon, min lat,
+            max lon, max lat) for random image locations.
+        padding (int, optional): Filler bytes per image. Defaults to 0.
+        seed (int, optional): Seed for image locations. Defaults to 0.
+        coordinates (Optional[List[Tuple[float, float]]], optional): Latitude
+            and longitude of each image. Overrides random locations.
+        maker_note (int, optional): Size of MakerNote tag per image. Defaults
+            to 0.
+
+    Returns:
+        List[str]: Paths of written images.
+    """
+    os.makedirs(folder, exist_ok=True)
+    rng = random.Random(seed)
+    if coordinates is None:
+        coordinates = [
+            (rng.uniform(bbox[1], bbox[3]), rng.uniform(bbox[0], bbox[2]))
+            for _ in range(count)
+        ]
+
+    paths = []
+    for index, (lat, lon) in enumerate(coordinates):
+        path = os.path.join(folder, f"IMG_{index:05d}.JPG")
+        with open(path, "wb") as image_file:
+            image_file.write(jpeg_with_gps(lat, lon, padding, maker_note))
+        paths.append(path)
+    return paths
@@ -0,0 +1,74 @@
+"""
+Synthetic rasters for benchmarks and tests.
+
+Rasters are tiled, compressed GeoTIFFs (with overviews if requested) so that
+windowed reads behave like reads of Cloud Optimized GeoTIFFs served by D2S.
+
+Requires: pip install d2spy[geo]
+"""
+
+from typing import Optional, Sequence
+
+from d2spy.extras.geo import require_geo
+
+# UTM zone 16N, which covers the default location of FakeD2SServer projects
+DEFAULT_CRS = "EPSG:32616"
+
+
+def write_raster(
+    filepath: str,
+    data,
+    origin: Sequence[float] = (504000.0, 4588000.0),
+    resolution: float = 0.1,
+    crs: str = DEFAULT_CRS,
+    nodata: Optional[float] = None,
+    overviews: bool = False,
+) -> str:
+    """Write array to a tiled GeoTIFF.
+
+    Args:
+        filepath (str): Output GeoTIFF.
+        data (np.ndarray): Values with shape (bands, height, width) or
+            (height, width).
+        origin (Sequence[float], optional): Coordinates of the upper left corner
+            in `crs`. Defaults to (504000.0, 4588000.0).
+        resolution (float, optional): Pixel size in units of `crs`. Defaults to
+            0.1.
+        crs (str, optional): Coordinate reference system. Defaults to EPSG:32616.
+        nodata (Optional[float], optional): Nodata value. Defaults to None.
+        overviews (bool, optional): Build overviews. Defaults to False.
+
+    Returns:
+        str: Path of written raster.
+    """
+    require_geo()
+
+    import numpy as np
+    import rasterio
+    from rasterio.enums import Resampling
+    from rasterio.transform import from_origin
+
+    data = np.asarray(data)
+    if data.ndim == 2:
+        data = data[np.newaxis]
+    bands, height, width = data.shape
+
+    profile = {
+        "driver": "GTiff",
+        "dtype": data.dtype.name,
+        "count": bands,
+        "height": height,
+        "width": width,
+        "crs": crs,
+        "transform": from_origin(origin[0], origin[1], resolution, resolution),
+        "nodata": nodata,
+        "tiled": True,
+        "blockxsize": 256,
+        "blockysize": 256,
+        "compress": "deflate",
+    }
+    with rasterio.open(filepath, "w", **profile) as dataset:
+        dataset.write(data)
+        if overviews:
+            dataset.build_overviews([2, 4, 8], Resampling.average)
+    return filepath
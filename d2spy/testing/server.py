@@ -0,0 +1,1027 @@
+"""
+Local stand-in for a Data to Science (D2S) instance.
+
+Serves the D2S API endpoints used by d2spy from an in-memory, generated dataset
+so that d2spy can be exercised over real HTTP connections in benchmarks and load
+tests. Latency, errors, and access token expiration can be injected.
+
+Usage:
+    python -m d2spy.testing.server --port 8000 --projects 100
+"""
+
+import argparse
+import base64
+import json
+import random
+import re
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Pattern, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+from uuid import UUID
+
+from d2spy.compression import HAS_ZSTD, RequestCompression, compress, decompress
+from d2spy.utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+ID = r"([0-9a-fA-F-]+)"
+PROJECT = rf"/api/v1/projects/{ID}"
+FLIGHT = rf"{PROJECT}/flights/{ID}"
+DATA_PRODUCT = rf"{FLIGHT}/data_products/{ID}"
+ROUTE_GROUP = re.compile(r"\([^)]*\)")
+
+EMAIL = "user@example.com"
+PASSWORD = "password"
+
+SENSORS = ["RGB", "Multispectral", "LiDAR", "Thermal"]
+PLATFORMS = ["M350", "Phantom 4", "M300", "Other"]
+DATA_TYPES = ["dsm", "ortho", "point_cloud"]
+CROPS = ["corn", "soybean", "wheat", "sorghum", "cotton"]
+# Smallest response body compressed when compress_responses is enabled
+COMPRESS_SIZE = 1024
+
+
+@dataclass
+class Response:
+    """Response returned by a route handler."""
+
+    status: int = 200
+    body: Any = None
+    headers: Optional[List[Tuple[str, str]]] = None
+
+
+@dataclass
+class InjectedError:
+    """Error returned for the next `count` requests matching `pattern`."""
+
+    pattern: Pattern[str]
+    status: int
+    count: int
+
+
+Handler = Callable[..., Response]
+
+
+class FakeD2SServer:
+    """In-memory D2S instance served over HTTP on localhost.
+
+    Implements sign in, token refresh, projects, flights, data products, raw data,
+    vector layers, processing tools, zonal statistics, and the tus `/files`
+    upload endpoint. Uploaded chunks are counted, not stored.
+
+    Example:
+        with FakeD2SServer(projects=10, latency=0.01) as server:
+            workspace = server.connect()
+            projects = workspace.get_projects()
+    """
+
+    def __init__(
+        self,
+        projects: int = 3,
+        flights_per_project: int = 4,
+        data_products_per_flight: int = 3,
+        raw_data_per_flight: int = 1,
+        layers_per_project: int = 1,
+        features_per_layer: int = 10,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        token_ttl: Optional[float] = None,
+        compress_responses: bool = False,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Constructor for FakeD2SServer class.
+
+        Args:
+            projects (int, optional): Number of projects. Defaults to 3.
+            flights_per_project (int, optional): Flights in each project.
+                Defaults to 4.
+            data_products_per_flight (int, optional): Data products in each
+                flight. Defaults to 3.
+            raw_data_per_flight (int, optional): Raw data in each flight.
+                Defaults to 1.
+            layers_per_project (int, optional): Vector layers in each project.
+                Defaults to 1.
+            features_per_layer (int, optional): Features in each vector layer.
+                Defaults to 10.
+            latency (Union[float, Tuple[float, float]], optional): Seconds added
+                to every response, or (min, max) range for random latency.
+                Defaults to 0.0.
+            error_rate (float, optional): Fraction of authenticated API requests
+                that fail with `error_status`. Defaults to 0.0.
+            error_status (int, optional): Status of random errors. Defaults to 500.
+            token_ttl (Optional[float], optional): Seconds before access tokens
+                expire. Defaults to None (tokens never expire).
+            compress_responses (bool, optional): Compress JSON responses of at
+                least 1 KiB with zstd or gzip when the client accepts them.
+                Defaults to False.
+            seed (int, optional): Seed for generated data, latency, and errors.
+                Defaults to 0.
+            host (str, optional): Host to bind. Defaults to "127.0.0.1".
+            port (int, optional): Port to bind, 0 picks a free port. Defaults to 0.
+        """
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_ttl = token_ttl
+        self.compress_responses = compress_responses
+        self.host = host
+        self.port = port
+
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # access token -> time issued
+        self._access_tokens: Dict[str, float] = {}
+        self._refresh_tokens: Dict[str, float] = {}
+        self._injected: List[InjectedError] = []
+        # (method, route template) -> request count
+        self.request_counts: Dict[Tuple[str, str], int] = {}
+        self.uploaded_bytes = 0
+
+        self.user: Dict[str, Any] = {
+            "id": str(self._uuid()),
+            "email": EMAIL,
+            "first_name": "Test",
+            "last_name": "User",
+            "is_email_confirmed": True,
+            "is_approved": True,
+            "profile_url": None,
+            "api_access_token": None,
+            "exts": [],
+        }
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.flights: Dict[str, Dict[str, Any]] = {}
+        self.data_products: Dict[str, Dict[str, Any]] = {}
+        self.raw_data: Dict[str, Dict[str, Any]] = {}
+        self.layers: Dict[str, List[Dict[str, Any]]] = {}
+        self.zonal_statistics: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.jobs: List[Dict[str, Any]] = []
+        # tus upload ID -> upload state
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+
+        for _ in range(projects):
+            project = self._create_project({})
+            for _ in range(layers_per_project):
+                self._create_layer(project["id"], features_per_layer)
+            for _ in range(flights_per_project):
+                flight = self._create_flight(project["id"], {})
+                for index in range(data_products_per_flight):
+                    self._create_data_product(
+                        flight, DATA_TYPES[index % len(DATA_TYPES)]
+                    )
+                for _ in range(raw_data_per_flight):
+                    self._create_raw_data(flight)
+
+        self._routes: List[Tuple[str, Pattern[str], str, Handler]] = []
+        self._add_routes()
+
+    # Server lifecycle
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        if self._httpd is None:
+            raise RuntimeError("Server is not running")
+        return f"http://{self.host}:{self._httpd.server_address[1]}"
+
+    def start(self) -> "FakeD2SServer":
+        """Start serving requests in a background thread.
+
+        Returns:
+            FakeD2SServer: This server.
+        """
+        server = self
+
+        class RequestHandler(_RequestHandler):
+            fake = server
+
+        self._httpd = ThreadingHTTPServer((self.host, self.port), RequestHandler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving requests."""
+        if self._httpd is not None:
+            self._httpd.shutdown()
+            self._httpd.server_close()
+            self._httpd = None
+
+    def __enter__(self) -> "FakeD2SServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def connect(self, identity_map=None):
+        """Sign in to the running server and return a workspace.
+
+        Args:
+            identity_map (Optional[IdentityMap], optional): Identity map passed
+                to the workspace. Defaults to None.
+
+        Returns:
+            Workspace: Workspace connected to this server.
+        """
+        from d2spy.auth import Auth
+        from d2spy.workspace import Workspace
+
+        auth = Auth(self.url)
+        session = auth.login(email=EMAIL, password=PASSWORD)
+        if session is None:
+            raise RuntimeError("Unable to sign in to fake D2S server")
+        return Workspace(self.url, session, identity_map=identity_map)
+
+    # Fault injection
+
+    def inject_error(self, pattern: str, status: int = 500, count: int = 1) -> None:
+        """Fail the next `count` requests whose path matches `pattern`.
+
+        Args:
+            pattern (str): Regular expression searched in the request path.
+            status (int, optional): Response status. Defaults to 500.
+            count (int, optional): Number of requests to fail. Defaults to 1.
+        """
+        with self._lock:
+            self._injected.append(InjectedError(re.compile(pattern), status, count))
+
+    def expire_tokens(self) -> None:
+        """Expire every access token so the next request from each client
+        receives a 401 response and refreshes its token.
+        """
+        with self._lock:
+            self._access_tokens.clear()
+
+    def reset_counts(self) -> None:
+        """Reset request counts and uploaded bytes."""
+        with self._lock:
+            self.request_counts.clear()
+            self.uploaded_bytes = 0
+
+    # Dataset
+
+    def _uuid(self) -> UUID:
+        return UUID(int=self._rng.getrandbits(128), version=4)
+
+    def _point(self) -> Tuple[float, float]:
+        return (self._rng.uniform(-100.0, -80.0), self._rng.uniform(30.0, 45.0))
+
+    def _create_project(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        x, y = self._point()
+        start_date = date(2024, 1, 1) + timedelta(days=self._rng.randrange(365))
+        project = {
+            "id": str(self._uuid()),
+            "title": f"{self._rng.choice(CROPS).title()} trial {len(self.projects)}",
+            "description": f"Field trial {len(self.projects)}.",
+            "deactivated_at": None,
+            "field": {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [
+                            [x, y],
+                            [x + 0.01, y],
+                            [x + 0.01, y + 0.01],
+                            [x, y + 0.01],
+                            [x, y],
+                        ]
+                    ],
+                },
+                "properties": {},
+            },
+            "centroid": {"x": x + 0.005, "y": y + 0.005},
+            "flight_count": 0,
+            "start_date": str(start_date),
+            "end_date": str(start_date + timedelta(days=120)),
+            "is_active": True,
+            "location_id": str(self._uuid()),
+            "role": "owner",
+            "team_id": None,
+        }
+        project.update(attrs)
+        self.projects[str(project["id"])] = project
+        return project
+
+    def _create_flight(self, project_id: str, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        project = self.projects[project_id]
+        acquisition_date = date.fromisoformat(project["start_date"]) + timedelta(
+            days=self._rng.randrange(120)
+        )
+        flight = {
+            "id": str(self._uuid()),
+            "name": f"Flight {len(self.flights)}",
+            "acquisition_date": str(acquisition_date),
+            "altitude": 40,
+            "side_overlap": 80,
+            "forward_overlap": 80,
+            "sensor": self._rng.choice(SENSORS),
+            "platform": self._rng.choice(PLATFORMS),
+            "is_active": True,
+            "deactivated_at": None,
+            "read_only": False,
+            "project_id": project_id,
+            "pilot_id": self.user["id"],
+            "data_products": [],
+        }
+        flight.update(attrs)
+        self.flights[flight["id"]] = flight
+        project["flight_count"] += 1
+        return flight
+
+    def _create_data_product(
+        self, flight: Dict[str, Any], data_type: str, filename: Optional[str] = None
+    ) -> Dict[str, Any]:
+        data_product_id = str(self._uuid())
+        extension = "las" if data_type == "point_cloud" else "tif"
+        filename = filename or f"{data_type}.{extension}"
+        path = (
+            f"projects/{flight['project_id']}/flights/{flight['id']}"
+            f"/data_products/{data_product_id}/{filename}"
+        )
+        x, y = self.projects[flight["project_id"]]["centroid"].values()
+        bands = 3 if data_type == "ortho" else 1
+        data_product = {
+            "id": data_product_id,
+            "data_type": data_type,
+            "filepath": f"/static/{path}",
+            "original_filename": filename,
+            "stac_properties": {
+                "raster": [
+                    {
+                        "data_type": "float32",
+                        "stats": {
+                            "minimum": 0.0,
+                            "maximum": 255.0,
+                            "mean": self._rng.uniform(50, 200),
+                            "stddev": self._rng.uniform(1, 20),
+                        },
+                        "nodata": None,
+                    }
+                    for _ in range(bands)
+                ],
+                "eo": [
+                    {"name": f"b{band + 1}", "description": desc}
+                    for band, desc in enumerate(
+                        ["Red", "Green", "Blue"] if bands == 3 else ["Gray"]
+                    )
+                ],
+            },
+            "is_active": True,
+            "is_initial_processing_completed": True,
+            "flight_id": flight["id"],
+            "user_style": {},
+            "deactivated_at": None,
+            "public": False,
+            "status": "SUCCESS",
+            # Relative until served, see _absolute_url
+            "url": f"/static/{path}",
+            "bbox": [x - 0.005, y - 0.005, x + 0.005, y + 0.005],
+            "crs": {"epsg": 4326},
+            "resolution": {"x": 0.01, "y": 0.01, "unit": "m"},
+        }
+        self.data_products[data_product_id] = data_product
+        flight["data_products"].append(data_product)
+        return data_product
+
+    def _create_raw_data(
+        self, flight: Dict[str, Any], filename: str = "images.zip"
+    ) -> Dict[str, Any]:
+        raw_data_id = str(self._uuid())
+        path = (
+            f"projects/{flight['project_id']}/flights/{flight['id']}"
+            f"/raw_data/{raw_data_id}/{filename}"
+        )
+        raw_data = {
+            "id": raw_data_id,
+            "filepath": f"/static/{path}",
+            "original_filename": filename,
+            "is_active": True,
+            "flight_id": flight["id"],
+            "deactivated_at": None,
+            "status": "SUCCESS",
+            "url": f"/static/{path}",
+        }
+        self.raw_data[raw_data_id] = raw_data
+        return raw_data
+
+    def _create_layer(
+        self,
+        project_id: str,
+        feature_count: int,
+        layer_name: Optional[str] = None,
+        geojson: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        layer_id = secrets.token_urlsafe(8)[:11]
+        layer_name = layer_name or f"plots_{len(self.layers.get(project_id, []))}"
+        if geojson is not None:
+            geometries = [feature["geometry"] for feature in geojson["features"]]
+            attributes = [
+                feature.get("properties") or {} for feature in geojson["features"]
+            ]
+        else:
+            x, y = self.projects[project_id]["field"]["geometry"]["coordinates"][0][0]
+            size = 0.01 / max(feature_count, 1)
+            geometries = [
+                {
+                    "type": "Polygon",
+                    "coordinates": [
+                        [
+                            [x + index * size, y],
+                            [x + (index + 1) * size, y],
+                            [x + (index + 1) * size, y + size],
+                            [x + index * size, y + size],
+                            [x + index * size, y],
+                        ]
+                    ],
+                }
+                for index in range(feature_count)
+            ]
+            attributes = [
+                {"col": index + 1, "row": 1} for index in range(feature_count)
+            ]
+
+        layer = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": geometry,
+                    "properties": {
+                        "id": str(self._uuid()),
+                        "layer_name": layer_name,
+                        "layer_id": layer_id,
+                        "properties": properties,
+                        "is_active": True,
+                        "project_id": project_id,
+                        "flight_id": None,
+                        "data_product_id": None,
+                    },
+                }
+                for geometry, properties in zip(geometries, attributes)
+            ],
+            "metadata": {
+                "preview_url": (
+                    f"/static/projects/{project_id}/vector/{layer_id}/preview.png"
+                )
+            },
+        }
+        self.layers.setdefault(project_id, []).append(layer)
+        return layer
+
+    # Routes
+
+    def _add_routes(self) -> None:
+        routes: List[Tuple[str, str, Handler]] = [
+            ("GET", r"/api/v1/health", self._health),
+            ("POST", r"/api/v1/auth/access-token", self._access_token),
+            ("POST", r"/api/v1/auth/refresh-token", self._refresh_token),
+            ("GET", r"/api/v1/users/current", self._current_user),
+            ("GET", r"/api/v1/projects", self._list_projects),
+            ("POST", r"/api/v1/projects", self._add_project),
+            ("GET", PROJECT, self._get_project),
+            ("PUT", PROJECT, self._update_project),
+            ("GET", rf"{PROJECT}/flights", self._list_flights),
+            ("POST", rf"{PROJECT}/flights", self._add_flight),
+            ("GET", FLIGHT, self._get_flight),
+            ("PUT", FLIGHT, self._update_flight),
+            ("PUT", rf"{FLIGHT}/move_to_project/{ID}", self._move_flight),
+            ("GET", rf"{FLIGHT}/data_products", self._list_data_products),
+            ("GET", DATA_PRODUCT, self._get_data_product),
+            ("PUT", rf"{DATA_PRODUCT}/bands", self._update_bands),
+            ("POST", rf"{DATA_PRODUCT}/tools", self._tools),
+            ("GET", rf"{DATA_PRODUCT}/zonal_statistics", self._zonal_statistics),
+            ("GET", rf"{FLIGHT}/raw_data", self._list_raw_data),
+            ("GET", rf"{PROJECT}/vector_layers", self._list_layers),
+            ("POST", rf"{PROJECT}/vector_layers/geojson", self._add_layer),
+            ("POST", r"/files/?", self._create_upload),
+            ("HEAD", r"/files/([0-9a-f]+)", self._upload_offset),
+            ("PATCH", r"/files/([0-9a-f]+)", self._upload_chunk),
+        ]
+        for method, pattern, handler in routes:
+            # Route templates (e.g., "/api/v1/projects/{id}") key request counts
+            template = ROUTE_GROUP.sub("{id}", pattern).replace("/?", "")
+            self._routes.append((method, re.compile(pattern + "$"), template, handler))
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        query: Dict[str, List[str]],
+        headers: Dict[str, str],
+        cookies: Dict[str, str],
+        body: bytes,
+    ) -> Response:
+        """Route request to handler, applying latency, injected errors, and
+        authentication.
+        """
+        self._sleep()
+
+        for route_method, regex, template, handler in self._routes:
+            match = regex.match(path)
+            if match and route_method == method:
+                break
+        else:
+            return Response(404, {"detail": "Not Found"})
+
+        with self._lock:
+            key = (method, template)
+            self.request_counts[key] = self.request_counts.get(key, 0) + 1
+
+            error = self._injected_error(path)
+            if error:
+                return Response(error, {"detail": "Injected error"})
+
+            public = template in ("/api/v1/health", "/api/v1/auth/access-token")
+            if template == "/api/v1/auth/refresh-token":
+                if not self._valid_token(
+                    self._refresh_tokens, cookies.get("refresh_token")
+                ):
+                    return Response(401, {"detail": "Invalid refresh token"})
+            elif not public:
+                if not self._valid_token(
+                    self._access_tokens, cookies.get("access_token")
+                ):
+                    return Response(401, {"detail": "Could not validate credentials"})
+                if self.error_rate and self._rng.random() < self.error_rate:
+                    return Response(self.error_status, {"detail": "Random error"})
+
+            return handler(*match.groups(), query=query, headers=headers, body=body)
+
+    def _sleep(self) -> None:
+        latency = self.latency
+        if isinstance(latency, tuple):
+            with self._lock:
+                latency = self._rng.uniform(*latency)
+        if latency:
+            time.sleep(latency)
+
+    def _injected_error(self, path: str) -> Optional[int]:
+        for injected in self._injected:
+            if injected.count > 0 and injected.pattern.search(path):
+                injected.count -= 1
+                if injected.count == 0:
+                    self._injected.remove(injected)
+                return injected.status
+        return None
+
+    def _valid_token(self, tokens: Dict[str, float], token: Optional[str]) -> bool:
+        issued = tokens.get(token or "")
+        if issued is None:
+            return False
+        if self.token_ttl is not None and time.monotonic() - issued > self.token_ttl:
+            del tokens[token or ""]
+            return False
+        return True
+
+    def _issue_tokens(self) -> List[Tuple[str, str]]:
+        access_token = secrets.token_hex(16)
+        refresh_token = secrets.token_hex(16)
+        self._access_tokens[access_token] = time.monotonic()
+        # Refresh tokens do not expire
+        self._refresh_tokens[refresh_token] = float("inf")
+        return [
+            ("Set-Cookie", f"access_token={access_token}; Path=/; HttpOnly"),
+            ("Set-Cookie", f"refresh_token={refresh_token}; Path=/; HttpOnly"),
+        ]
+
+    # Handlers
+
+    def _health(self, **kwargs) -> Response:
+        return Response(200, {"status": "ok"})
+
+    def _access_token(self, body: bytes, **kwargs) -> Response:
+        form = parse_qs(body.decode())
+        if form.get("username") != [EMAIL] or form.get("password") != [PASSWORD]:
+            return Response(401, {"detail": "Incorrect email or password"})
+        return Response(200, {"status": "ok"}, self._issue_tokens())
+
+    def _refresh_token(self, **kwargs) -> Response:
+        return Response(200, {"status": "ok"}, self._issue_tokens())
+
+    def _current_user(self, **kwargs) -> Response:
+        return Response(200, self.user)
+
+    def _list_projects(self, **kwargs) -> Response:
+        keys = ("id", "title", "description", "centroid", "flight_count", "role")
+        projects = [
+            {
+                **{key: project[key] for key in keys},
+                "start_date": project["start_date"],
+                "end_date": project["end_date"],
+            }
+            for project in self.projects.values()
+        ]
+        return Response(200, projects)
+
+    def _add_project(self, body: bytes, **kwargs) -> Response:
+        data = json.loads(body or b"{}")
+        project = self._create_project(
+            {
+                "title": data.get("title", "Untitled"),
+                "description": data.get("description", ""),
+                "start_date": data.get("start_date") or data.get("planting_date"),
+                "end_date": data.get("end_date") or data.get("harvest_date"),
+            }
+        )
+        return Response(201, project)
+
+    def _get_project(self, project_id: str, **kwargs) -> Response:
+        project = self.projects.get(project_id)
+        if project is None:
+            return Response(404, {"detail": "Project not found"})
+        return Response(200, project)
+
+    def _update_project(self, project_id: str, body: bytes, **kwargs) -> Response:
+        project = self.projects.get(project_id)
+        if project is None:
+            return Response(404, {"detail": "Project not found"})
+        project.update(json.loads(body or b"{}"))
+        return Response(200, project)
+
+    def _flights_in(self, project_id: str) -> List[Dict[str, Any]]:
+        return [
+            self._with_urls(flight)
+            for flight in self.flights.values()
+            if flight["project_id"] == project_id
+        ]
+
+    def _list_flights(
+        self, project_id: str, query: Dict[str, List[str]], **kwargs
+    ) -> Response:
+        if project_id not in self.projects:
+            return Response(404, {"detail": "Project not found"})
+        flights = self._flights_in(project_id)
+        if query.get("has_raster", ["False"])[0].lower() in ("true", "1"):
+            flights = [
+                flight
+                for flight in flights
+                if any(
+                    data_product["data_type"] != "point_cloud"
+                    for data_product in flight["data_products"]
+                )
+            ]
+        return Response(200, flights)
+
+    def _add_flight(self, project_id: str, body: bytes, **kwargs) -> Response:
+        if project_id not in self.projects:
+            return Response(404, {"detail": "Project not found"})
+        flight = self._create_flight(project_id, json.loads(body or b"{}"))
+        return Response(201, self._with_urls(flight))
+
+    def _get_flight(self, project_id: str, flight_id: str, **kwargs) -> Response:
+        flight = self.flights.get(flight_id)
+        if flight is None or flight["project_id"] != project_id:
+            return Response(404, {"detail": "Flight not found"})
+        return Response(200, self._with_urls(flight))
+
+    def _update_flight(
+        self, project_id: str, flight_id: str, body: bytes, **kwargs
+    ) -> Response:
+        flight = self.flights.get(flight_id)
+        if flight is None or flight["project_id"] != project_id:
+            return Response(404, {"detail": "Flight not found"})
+        flight.update(json.loads(body or b"{}"))
+        return Response(200, self._with_urls(flight))
+
+    def _move_flight(
+        self, project_id: str, flight_id: str, destination_id: str, **kwargs
+    ) -> Response:
+        flight = self.flights.get(flight_id)
+        if flight is None or destination_id not in self.projects:
+            return Response(404, {"detail": "Flight not found"})
+        self.projects[flight["project_id"]]["flight_count"] -= 1
+        self.projects[destination_id]["flight_count"] += 1
+        flight["project_id"] = destination_id
+        return Response(200, self._with_urls(flight))
+
+    def _list_data_products(
+        self, project_id: str, flight_id: str, **kwargs
+    ) -> Response:
+        flight = self.flights.get(flight_id)
+        if flight is None or flight["project_id"] != project_id:
+            return Response(404, {"detail": "Flight not found"})
+        return Response(200, self._with_urls(flight)["data_products"])
+
+    def _get_data_product(
+        self, project_id: str, flight_id: str, data_product_id: str, **kwargs
+    ) -> Response:
+        data_product = self.data_products.get(data_product_id)
+        if data_product is None or data_product["flight_id"] != flight_id:
+            return Response(404, {"detail": "Data product not found"})
+        return Response(200, self._absolute_url(data_product))
+
+    def _update_bands(
+        self,
+        project_id: str,
+        flight_id: str,
+        data_product_id: str,
+        body: bytes,
+        **kwargs,
+    ) -> Response:
+        data_product = self.data_products.get(data_product_id)
+        if data_product is None:
+            return Response(404, {"detail": "Data product not found"})
+        descriptions = {
+            band["name"]: band["description"]
+            for band in json.loads(body or b"{}").get("bands", [])
+        }
+        for band in data_product["stac_properties"]["eo"]:
+            band["description"] = descriptions.get(band["name"], band["description"])
+        return Response(200, self._absolute_url(data_product))
+
+    def _tools(
+        self,
+        project_id: str,
+        flight_id: str,
+        data_product_id: str,
+        body: bytes,
+        **kwargs,
+    ) -> Response:
+        data_product = self.data_products.get(data_product_id)
+        if data_product is None:
+            return Response(404, {"detail": "Data product not found"})
+        data = json.loads(body or b"{}")
+        self.jobs.append({"data_product_id": data_product_id, **data})
+
+        # Zonal statistics jobs complete immediately
+        layer_id = data.get("zonal_layer_id")
+        if layer_id:
+            layer = next(
+                (
+                    layer
+                    for layer in self.layers.get(project_id, [])
+                    if layer["features"]
+                    and layer["features"][0]["properties"]["layer_id"] == layer_id
+                ),
+                None,
+            )
+            if layer is not None:
+                self.zonal_statistics[(data_product_id, layer_id)] = {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {
+                            **feature,
+                            "properties": {
+                                **feature["properties"],
+                                "min": 0.0,
+                                "max": 255.0,
+                                "mean": self._rng.uniform(50, 200),
+                                "median": self._rng.uniform(50, 200),
+                                "std": self._rng.uniform(1, 20),
+                                "count": 100,
+                            },
+                        }
+                        for feature in layer["features"]
+                    ],
+                }
+        return Response(202)
+
+    def _zonal_statistics(
+        self,
+        project_id: str,
+        flight_id: str,
+        data_product_id: str,
+        query: Dict[str, List[str]],
+        **kwargs,
+    ) -> Response:
+        layer_id = query.get("layer_id", [""])[0]
+        statistics = self.zonal_statistics.get((data_product_id, layer_id))
+        return Response(200, statistics or [])
+
+    def _list_raw_data(self, project_id: str, flight_id: str, **kwargs) -> Response:
+        return Response(
+            200,
+            [
+                self._absolute_url(raw_data)
+                for raw_data in self.raw_data.values()
+                if raw_data["flight_id"] == flight_id
+            ],
+        )
+
+    def _list_layers(self, project_id: str, **kwargs) -> Response:
+        return Response(200, self.layers.get(project_id, []))
+
+    def _add_layer(self, project_id: str, body: bytes, **kwargs) -> Response:
+        if project_id not in self.projects:
+            return Response(404, {"detail": "Project not found"})
+        data = json.loads(body or b"{}")
+        layer = self._create_layer(
+            project_id, 0, layer_name=data.get("layer_name"), geojson=data["geojson"]
+        )
+        return Response(201, layer)
+
+    def _create_upload(self, headers: Dict[str, str], **kwargs) -> Response:
+        upload_id = secrets.token_hex(16)
+        metadata = {}
+        for item in headers.get("upload-metadata", "").split(","):
+            if " " in item:
+                key, value = item.split(" ", 1)
+                metadata[key] = base64.b64decode(value).decode()
+        self.uploads[upload_id] = {
+            "length": int(headers.get("upload-length", 0)),
+            "offset": 0,
+            "flight_id": headers.get("x-flight-id"),
+            "data_type": headers.get("x-data-type"),
+            "filename": metadata.get("filename", "upload"),
+        }
+        return Response(201, headers=[("Location", f"/files/{upload_id}")])
+
+    def _upload_offset(self, upload_id: str, **kwargs) -> Response:
+        upload = self.uploads.get(upload_id)
+        if upload is None:
+            return Response(404)
+        return Response(
+            200,
+            headers=[
+                ("Upload-Offset", str(upload["offset"])),
+                ("Upload-Length", str(upload["length"])),
+            ],
+        )
+
+    def _upload_chunk(
+        self, upload_id: str, headers: Dict[str, str], body: bytes, **kwargs
+    ) -> Response:
+        upload = self.uploads.get(upload_id)
+        if upload is None:
+            return Response(404)
+        if int(headers.get("upload-offset", -1)) != upload["offset"]:
+            return Response(409, {"detail": "Offset mismatch"})
+
+        upload["offset"] += len(body)
+        self.uploaded_bytes += len(body)
+
+        # Completed uploads are added to their flight
+        flight = self.flights.get(upload["flight_id"] or "")
+        if upload["offset"] >= upload["length"] and flight is not None:
+            if upload["data_type"] == "raw":
+                self._create_raw_data(flight, upload["filename"])
+            elif upload["data_type"]:
+                self._create_data_product(
+                    flight, upload["data_type"], upload["filename"]
+                )
+
+        return Response(204, headers=[("Upload-Offset", str(upload["offset"]))])
+
+    # Serialization
+
+    def _absolute_url(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        return {**item, "url": self.url + item["url"]}
+
+    def _with_urls(self, flight: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            **flight,
+            "data_products": [
+                self._absolute_url(data_product)
+                for data_product in flight["data_products"]
+            ],
+        }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Translates HTTP requests into FakeD2SServer.handle calls."""
+
+    # Keep connections open so clients can reuse them
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately, so Nagle's algorithm would delay
+    # every response on a kept-alive connection until the client's delayed ACK
+    disable_nagle_algorithm = True
+    fake: FakeD2SServer
+
+    def _dispatch(self) -> None:
+        url = urlparse(self.path)
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            body = self._read_chunked()
+        else:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else b""
+        encoding = self.headers.get("Content-Encoding")
+        if encoding and body:
+            try:
+                body = decompress(body, encoding)
+            except Exception as e:
+                self._reply(Response(400, {"detail": f"Invalid body: {e}"}))
+                return
+
+        cookies: Dict[str, str] = {}
+        if self.headers.get("Cookie"):
+            parsed = SimpleCookie()
+            parsed.load(self.headers["Cookie"])
+            cookies = {name: morsel.value for name, morsel in parsed.items()}
+
+        try:
+            response = self.fake.handle(
+                self.command,
+                url.path,
+                parse_qs(url.query),
+                {key.lower(): value for key, value in self.headers.items()},
+                cookies,
+                body,
+            )
+        except Exception as e:
+            logger.error(f"Fake D2S server error: {e}")
+            response = Response(500, {"detail": str(e)})
+
+        self._reply(response)
+
+    def _read_chunked(self) -> bytes:
+        """Read request body sent with chunked transfer encoding."""
+        chunks: List[bytes] = []
+        while True:
+            size = int(self.rfile.readline().split(b";")[0], 16)
+            if size == 0:
+                # Skip trailers up to the blank line ending the body
+                while self.rfile.readline().strip():
+                    pass
+                return b"".join(chunks)
+            chunks.append(self.rfile.read(size))
+            self.rfile.readline()
+
+    def _reply(self, response: Response) -> None:
+        payload = b"" if response.body is None else json.dumps(response.body).encode()
+        headers = list(response.headers or [])
+        if payload:
+            headers.append(("Content-Type", "application/json"))
+
+        encoding = self._response_encoding()
+        if encoding and len(payload) >= COMPRESS_SIZE:
+            payload = compress(payload, encoding)
+            headers.append(("Content-Encoding", encoding))
+
+        self.send_response(response.status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    def _response_encoding(self) -> Optional[RequestCompression]:
+        if not self.fake.compress_responses:
+            return None
+        accepted = {
+            coding.split(";")[0].strip()
+            for coding in self.headers.get("Accept-Encoding", "").split(",")
+        }
+        if "zstd" in accepted and HAS_ZSTD:
+            return "zstd"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = _dispatch
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug(format % args)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a local fake D2S server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--flights-per-project", type=int, default=4)
+    parser.add_argument("--data-products-per-flight", type=int, default=3)
+    parser.add_argument("--features-per-layer", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--token-ttl", type=float, default=None)
+    parser.add_argument("--compress-responses", action="store_true")
+    args = parser.parse_args()
+
+    server = FakeD2SServer(
+        projects=args.projects,
+        flights_per_project=args.flights_per_project,
+        data_products_per_flight=args.data_products_per_flight,
+        features_per_layer=args.features_per_layer,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        token_ttl=args.token_ttl,
+        compress_responses=args.compress_responses,
+        host=args.host,
+        port=args.port,
+    ).start()
+    print(
+        f"Fake D2S server running at {server.url} (email {EMAIL}, password {PASSWORD})",
+        flush=True,
+    )
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
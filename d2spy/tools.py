@@ -0,0 +1,444 @@
+"""
+Typed requests for the data product processing tools of a D2S instance.
+
+Each tool is a small frozen dataclass holding the options of one job (e.g.,
+`NDVI(red=1, nir=4)`). Tools for the same data product are combined into as
+few requests to the tools endpoint as the payload allows: every payload has one
+set of options per tool type, so only tools of the same type with different
+options (e.g., NDVI from two band pairs) need separate requests.
+
+Example:
+    from d2spy.tools import NDVI, VARI, ZonalStatistics
+
+    results = data_products.submit_tools(
+        [NDVI(red=1, nir=4), VARI(red=1, green=2, blue=3)]
+    )
+"""
+
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
+
+from d2spy.utils.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from d2spy.models.data_product import DataProduct
+
+
+logger = get_logger(__name__)
+
+# Data types without raster bands
+NON_RASTER_TYPES = ("point_cloud", "panoramic", "3dgs")
+
+# Default number of data products submitted at a time
+WORKERS = 4
+
+
+def _band_count(data_product: "DataProduct") -> int:
+    eo_properties = data_product.stac_properties.get("eo")
+    return len(eo_properties) if isinstance(eo_properties, list) else 0
+
+
+def _check_raster(data_product: "DataProduct", min_bands: int) -> Optional[str]:
+    if data_product.data_type in NON_RASTER_TYPES:
+        return "Not available for point clouds, panoramic, or 3dgs"
+    if _band_count(data_product) < min_bands:
+        return f"Data product must have at least {min_bands} bands"
+    return None
+
+
+def _check_bands(data_product: "DataProduct", **bands: int) -> Optional[str]:
+    error = _check_raster(data_product, len(bands))
+    if error:
+        return error
+    if len(set(bands.values())) < len(bands):
+        return "Each band index must be unique"
+    count = _band_count(data_product)
+    for name, index in bands.items():
+        if not 1 <= index <= count:
+            label = "NIR" if name == "nir" else name.capitalize()
+            return f"{label} band index outside the range of available bands"
+    return None
+
+
+def _check_single_band(data_product: "DataProduct") -> Optional[str]:
+    error = _check_raster(data_product, 1)
+    if error:
+        return error
+    if _band_count(data_product) > 1:
+        return "Data product must have a single band"
+    return None
+
+
+def _check_point_cloud(data_product: "DataProduct") -> Optional[str]:
+    if data_product.data_type != "point_cloud":
+        return "Only available for point clouds"
+    return None
+
+
+@dataclass(frozen=True)
+class NDVI:
+    """Normalized Difference Vegetation Index from a multispectral raster.
+    Band indexes start at 1.
+    """
+
+    red: int
+    nir: int
+
+    data_type: ClassVar[Optional[str]] = "ndvi"
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {"ndvi": True, "ndviRed": self.red, "ndviNIR": self.nir}
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_bands(data_product, red=self.red, nir=self.nir)
+
+
+@dataclass(frozen=True)
+class ExG:
+    """Excess Green Index from an RGB raster. Band indexes start at 1."""
+
+    red: int
+    green: int
+    blue: int
+
+    data_type: ClassVar[Optional[str]] = "exg"
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {
+            "exg": True,
+            "exgRed": self.red,
+            "exgGreen": self.green,
+            "exgBlue": self.blue,
+        }
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_bands(
+            data_product, red=self.red, green=self.green, blue=self.blue
+        )
+
+
+@dataclass(frozen=True)
+class VARI:
+    """Visible Atmospherically Resistant Index from an RGB raster. Band indexes
+    start at 1.
+    """
+
+    red: int
+    green: int
+    blue: int
+
+    data_type: ClassVar[Optional[str]] = "vari"
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {
+            "vari": True,
+            "variRed": self.red,
+            "variGreen": self.green,
+            "variBlue": self.blue,
+        }
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_bands(
+            data_product, red=self.red, green=self.green, blue=self.blue
+        )
+
+
+@dataclass(frozen=True)
+class CHM:
+    """Canopy height model from a point cloud.
+
+    Attributes:
+        resolution (float): Pixel size in meters. Defaults to 0.1.
+        percentile (float): Percentile of point heights in each pixel.
+            Defaults to 100.
+    """
+
+    resolution: float = 0.1
+    percentile: float = 100
+
+    data_type: ClassVar[Optional[str]] = "chm"
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {
+            "chm": True,
+            "chmResolution": self.resolution,
+            "chmPercentile": self.percentile,
+        }
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_point_cloud(data_product)
+
+
+@dataclass(frozen=True)
+class DTM:
+    """Digital terrain model from the ground points of a point cloud.
+
+    Attributes:
+        resolution (float): Pixel size in meters. Defaults to 0.1.
+        rigidness (int): Rigidness of the cloth used to classify ground points,
+            1 for steep slopes to 3 for flat terrain. Defaults to 1.
+    """
+
+    resolution: float = 0.1
+    rigidness: int = 1
+
+    data_type: ClassVar[Optional[str]] = "dtm"
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {
+            "dtm": True,
+            "dtmResolution": self.resolution,
+            "dtmRigidness": self.rigidness,
+        }
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_point_cloud(data_product)
+
+
+@dataclass(frozen=True)
+class Hillshade:
+    """Hillshade from a single band elevation raster (e.g., DSM)."""
+
+    data_type: ClassVar[Optional[str]] = "hillshade"
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {"hillshade": True}
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_single_band(data_product)
+
+
+@dataclass(frozen=True)
+class ZonalStatistics:
+    """Zonal statistics of a single band raster for the features of a map layer.
+
+    Attributes:
+        layer_id (str): ID of map layer with zones.
+    """
+
+    layer_id: str
+
+    # Results are zonal statistics, not a data product
+    data_type: ClassVar[Optional[str]] = None
+
+    def payload(self, data_product: "DataProduct") -> Dict[str, Any]:
+        return {
+            "zonal": True,
+            "dem_id": str(data_product.id),
+            "zonal_layer_id": self.layer_id,
+        }
+
+    def validate(self, data_product: "DataProduct") -> Optional[str]:
+        return _check_single_band(data_product)
+
+
+Tool = Union[NDVI, ExG, VARI, CHM, DTM, Hillshade, ZonalStatistics]
+
+
+@dataclass
+class ToolResult:
+    """Outcome of a tool requested for a data product."""
+
+    data_product: "DataProduct"
+    tool: Tool
+    status: Literal["submitted", "skipped", "failed"]
+    # Reason a tool was skipped or failed
+    detail: Optional[str] = None
+
+
+def batch_tools(tools: Sequence[Tool]) -> List[List[Tool]]:
+    """Returns tools grouped into as few tools requests as possible. Duplicate
+    tools are dropped, and tools of the same type with different options are
+    placed in separate requests.
+
+    Args:
+        tools (Sequence[Tool]): Tools to request.
+
+    Returns:
+        List[List[Tool]]: Tools of each request.
+    """
+    batches: List[List[Tool]] = []
+    for tool in dict.fromkeys(tools):
+        for batch in batches:
+            if not any(type(other) is type(tool) for other in batch):
+                batch.append(tool)
+                break
+        else:
+            batches.append([tool])
+    return batches
+
+
+def tools_payload(data_product: "DataProduct", tools: Sequence[Tool]) -> Dict[str, Any]:
+    """Returns payload requesting tools for a data product.
+
+    Args:
+        data_product (DataProduct): Data product to process.
+        tools (Sequence[Tool]): Tools with distinct types.
+
+    Returns:
+        Dict[str, Any]: Payload for the tools endpoint.
+    """
+    data = data_product._get_default_tools_payload()
+    # Default payload requests zonal statistics, which ZonalStatistics enables
+    data["zonal"] = False
+    for tool in tools:
+        data.update(tool.payload(data_product))
+    return data
+
+
+def _project_id(data_product: "DataProduct") -> Optional[str]:
+    # Match project ID from data product's URL
+    match = re.search(r"/projects/([a-f0-9\-]+)/", data_product.url)
+    return match.group(1) if match else None
+
+
+def _flight_data_types(data_product: "DataProduct", project_id: str) -> Set[str]:
+    """Returns data types of the active data products in the flight of a data
+    product.
+    """
+    endpoint = f"/api/v1/projects/{project_id}/flights/{data_product.flight_id}"
+    endpoint += "/data_products"
+    response_data = data_product.client.make_get_request(endpoint)
+    return {item["data_type"].lower() for item in response_data}
+
+
+def submit_tools(
+    data_products: Sequence["DataProduct"],
+    tools: Sequence[Tool],
+    skip_existing: bool = True,
+    workers: int = WORKERS,
+) -> List[ToolResult]:
+    """Request processing tools for data products. Tools that do not apply to a
+    data product (e.g., NDVI for a point cloud) fail without a request, and
+    the remaining tools of each data product are combined into as few requests
+    as the payload allows. Data products are submitted concurrently.
+
+    Args:
+        data_products (Sequence[DataProduct]): Data products to process.
+        tools (Sequence[Tool]): Tools to request for every data product.
+        skip_existing (bool, optional): Skip tools whose output already exists:
+            a data product of the output data type in the flight (requested
+            once per flight), or zonal statistics for the layer. The check is
+            coarse, as data products do not record the options or source they
+            were made with: e.g., `NDVI(red=2, nir=3)` is skipped if the flight
+            has an NDVI from any bands or any other data product. Set to False
+            to request such tools. Defaults to True.
+        workers (int, optional): Number of data products submitted at a time.
+            Defaults to 4.
+
+    Returns:
+        List[ToolResult]: Outcome of each tool for each data product, in order.
+    """
+    tools = list(dict.fromkeys(tools))
+    # Data types in each flight, requested once per flight
+    flight_data_types: Dict[Any, Set[str]] = {}
+    flight_locks: Dict[Any, threading.Lock] = {}
+    lock = threading.Lock()
+
+    def existing_data_types(data_product: "DataProduct", project_id: str) -> Set[str]:
+        with lock:
+            flight_lock = flight_locks.setdefault(
+                data_product.flight_id, threading.Lock()
+            )
+        with flight_lock:
+            if data_product.flight_id not in flight_data_types:
+                flight_data_types[data_product.flight_id] = _flight_data_types(
+                    data_product, project_id
+                )
+            return flight_data_types[data_product.flight_id]
+
+    def existing_outputs(
+        data_product: "DataProduct", project_id: str, pending: List[Tool]
+    ) -> List[Tool]:
+        data_types = (
+            existing_data_types(data_product, project_id)
+            if any(tool.data_type for tool in pending)
+            else set()
+        )
+        existing = []
+        for tool in pending:
+            if isinstance(tool, ZonalStatistics):
+                exists = bool(
+                    data_product._fetch_zonal_statistics(tool.layer_id, project_id)
+                )
+            else:
+                exists = tool.data_type in data_types
+            if exists:
+                existing.append(tool)
+        return existing
+
+    def submit(data_product: "DataProduct") -> List[ToolResult]:
+        results: Dict[Tool, ToolResult] = {}
+        pending: List[Tool] = []
+        project_id = _project_id(data_product)
+        for tool in tools:
+            error = tool.validate(data_product)
+            if error is None and project_id is None:
+                error = "Unable to find project ID associated with data product"
+            if error is not None:
+                logger.error(f"{type(tool).__name__} for {data_product.id}: {error}")
+                results[tool] = ToolResult(data_product, tool, "failed", error)
+            else:
+                pending.append(tool)
+
+        if skip_existing and pending:
+            try:
+                existing = existing_outputs(data_product, str(project_id), pending)
+            except Exception as e:
+                logger.error(f"Failed to find outputs of {data_product.id}: {e}")
+                for tool in pending:
+                    results[tool] = ToolResult(data_product, tool, "failed", str(e))
+                pending = []
+            else:
+                for tool in existing:
+                    results[tool] = ToolResult(
+                        data_product, tool, "skipped", "Output already exists"
+                    )
+                    pending.remove(tool)
+
+        endpoint = f"/api/v1/projects/{project_id}/flights/{data_product.flight_id}"
+        endpoint += f"/data_products/{data_product.id}/tools"
+        for batch in batch_tools(pending):
+            try:
+                data_product.client.make_post_request(
+                    endpoint, json=tools_payload(data_product, batch)
+                )
+            except Exception as e:
+                logger.error(f"Failed to submit tools for {data_product.id}: {e}")
+                for tool in batch:
+                    results[tool] = ToolResult(data_product, tool, "failed", str(e))
+            else:
+                for tool in batch:
+                    results[tool] = ToolResult(data_product, tool, "submitted")
+        return [results[tool] for tool in tools]
+
+    # Each data product is submitted once
+    unique = list(
+        {data_product.id: data_product for data_product in data_products}.values()
+    )
+    if workers <= 1 or len(unique) <= 1:
+        submitted = [submit(data_product) for data_product in unique]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            submitted = list(pool.map(submit, unique))
+
+    count = sum(
+        result.status == "submitted" for results in submitted for result in results
+    )
+    if count:
+        logger.info(f"{count} job requests have been added to the queue")
+    return [result for results in submitted for result in results]
@@ -0,0 +1,26 @@
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, Optional
+
+
+@lru_cache(maxsize=4096)
+def _parse_date_str(value: str) -> date:
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def parse_date(value: Any) -> Optional[date]:
+    """Convert %Y-%m-%d string to date. Dates are returned as-is and any other
+    value is returned as None. Parsed strings are cached since the same dates
+    repeat across many rows.
+
+    Args:
+        value (Any): Date string or date.
+
+    Returns:
+        Optional[date]: Parsed date or None.
+    """
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return _parse_date_str(value)
+    return None
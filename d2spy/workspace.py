@@ -7,6 +7,7 @@ from d2spy import models, schemas
 from d2spy.api_client import APIClient
 from d2spy.auth import Auth
 from d2spy.extras.utils import ensure_dict, ensure_list_of_dict
+from d2spy.identity_map import IdentityMap, build_model, build_models
 from d2spy.models.project_collection import ProjectCollection
 from d2spy.schemas.session import D2SpySession
 
@@ -14,15 +15,28 @@ from d2spy.schemas.session import D2SpySession
 class Workspace:
     """Create and view projects on D2S instance."""
 
-    def __init__(self, base_url: str, session: D2SpySession, api_key: str = ""):
+    def __init__(
+        self,
+        base_url: str,
+        session: D2SpySession,
+        api_key: str = "",
+        identity_map: Optional[IdentityMap] = None,
+    ):
         self.api_key = api_key
         self.base_url = base_url
         self.session = session
 
         self.client = APIClient(self.base_url, self.session)
+        # Optional cache that makes repeated lookups return the same instances
+        self.client.identity_map = identity_map
 
     @classmethod
-    def connect(cls, base_url: str, email: Optional[str] = None) -> "Workspace":
+    def connect(
+        cls,
+        base_url: str,
+        email: Optional[str] = None,
+        identity_map: Optional[IdentityMap] = None,
+    ) -> "Workspace":
         """Login and create workspace. If the email argument is not provided, the
         method will use the value of the D2S_EMAIL environment variable. If neither is
         available, an exception will be thrown.
@@ -30,6 +44,9 @@ class Workspace:
         Args:
             base_url (str): Base URL for D2S instance.
             email Optional[str]: Email address used to sign in to D2S.
+            identity_map Optional[IdentityMap]: Cache that makes repeated lookups
+                of the same project, flight, or data product return the same
+                instance. Defaults to None.
 
         Returns:
             Workspace: D2S workspace for creating and viewing data.
@@ -53,7 +70,7 @@ class Workspace:
         else:
             api_key = ""
 
-        return cls(base_url, auth.session, api_key)
+        return cls(base_url, auth.session, api_key, identity_map)
 
     def logout(self) -> None:
         """Logout of D2S platform."""
@@ -125,7 +142,7 @@ class Workspace:
 
         response_data = self.client.make_post_request(endpoint, json=data)
         project = schemas.Project.from_dict(response_data)
-        return models.Project(self.client, **project.__dict__)
+        return build_model(models.Project, self.client, project.__dict__)
 
     def get_project(self, project_id: str) -> Optional[models.Project]:
         """Request single project by ID. Project must be active and viewable by user.
@@ -140,7 +157,7 @@ class Workspace:
         response_data = self.client.make_get_request(endpoint)
         response_data = ensure_dict(response_data)
         project = schemas.Project.from_dict(response_data)
-        return models.Project(self.client, **project.__dict__)
+        return build_model(models.Project, self.client, project.__dict__)
 
     def get_projects(self, has_raster: Optional[bool] = False) -> ProjectCollection:
         """Request multiple projects. Only active projects viewable by
@@ -157,10 +174,17 @@ class Workspace:
             endpoint, params={"has_raster": has_raster}
         )
         response_data = ensure_list_of_dict(response_data)
-        projects = [
-            models.Project(
-                self.client, **schemas.MultiProject.from_dict(project).__dict__
-            )
-            for project in response_data
-        ]
+        projects = build_models(
+            models.Project, self.client, response_data, schemas.MultiProject
+        )
         return ProjectCollection(collection=projects)
+
+    def query_projects(self) -> "models.Query":
+        """Returns lazy query over projects viewable by user. Projects are
+        requested when the query is executed, with server-side filters
+        (e.g., `has_raster`) sent as request parameters.
+
+        Returns:
+            Query: Query over projects.
+        """
+        return models.Query("project", self.get_projects)
@@ -3,7 +3,10 @@ from unittest.mock import patch, Mock
 import threading
 from http.cookiejar import Cookie
 
-from d2spy.api_client import APIClient
+from requests import Response
+from requests.exceptions import JSONDecodeError
+
+from d2spy.api_client import APIClient, decode_json
 
 
 def create_mock_cookie(name, value):
@@ -46,7 +49,24 @@ class MockCookieJar:
         return self.cookies_dict.get(key, default)
 
 
+def create_response(content):
+    """Helper to create a response with the given body."""
+    response = Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
 class TestAPIClient(TestCase):
+    def test_decode_json(self):
+        for has_orjson in (True, False):
+            with patch("d2spy.api_client.HAS_ORJSON", has_orjson):
+                self.assertEqual(
+                    decode_json(create_response(b'[{"id": 1}]')), [{"id": 1}]
+                )
+                with self.assertRaises(JSONDecodeError):
+                    decode_json(create_response(b"<html>"))
+
     @patch("requests.Session")
     def test_make_get_request(self, MockSession):
         # Create a mock JSON response
@@ -382,3 +402,18 @@ class TestAPIClient(TestCase):
 
         # Assert refresh was called only once (thread safety)
         self.assertEqual(mock_session.post.call_count, 1)
+
+    def test_token_refresh_single_cookie(self):
+        """Test that a refresh leaves one access token cookie on localhost."""
+        from d2spy.testing import FakeD2SServer
+
+        server = FakeD2SServer(projects=1).start()
+        self.addCleanup(server.stop)
+        client = server.connect().client
+
+        self.assertTrue(client._refresh_access_token())
+        names = [cookie.name for cookie in client.session.cookies]
+        self.assertEqual(names.count("access_token"), 1)
+        self.assertEqual(names.count("refresh_token"), 1)
+        # Cookies are looked up by name without a CookieConflictError
+        self.assertTrue(client.session.cookies.get("access_token"))
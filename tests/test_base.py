@@ -0,0 +1,60 @@
+import json
+from datetime import date
+from unittest import TestCase
+
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.models.data_product import DataProduct
+from d2spy.models.project import Project
+
+from example_data import TEST_DATA_PRODUCT, TEST_MULTI_PROJECT
+
+
+class TestModel(TestCase):
+    def setUp(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        self.client = APIClient("https://example.com", session)
+
+    def test_slots(self):
+        data_product = DataProduct(self.client, **TEST_DATA_PRODUCT)
+
+        # Attributes are stored in slots, unknown attributes in overflow dict
+        self.assertFalse(hasattr(data_product, "__dict__"))
+        self.assertEqual(data_product.data_type, TEST_DATA_PRODUCT["data_type"])
+        self.assertEqual(data_product.user_style, TEST_DATA_PRODUCT["user_style"])
+        # Optional attributes fall back to defaults
+        self.assertIsNone(data_product.bbox)
+
+        data_product.status = "FAILED"
+        data_product.new_attribute = 1
+        self.assertEqual(data_product.status, "FAILED")
+        self.assertEqual(data_product.new_attribute, 1)
+
+        with self.assertRaises(AttributeError):
+            data_product.missing_attribute
+
+    def test_from_json(self):
+        raw = json.dumps(TEST_DATA_PRODUCT).encode()
+        data_product = DataProduct.from_json(self.client, raw)
+
+        # Row is decoded on first access
+        self.assertIsNotNone(data_product._raw)
+        self.assertEqual(data_product.id, TEST_DATA_PRODUCT["id"])
+        self.assertIsNone(data_product._raw)
+        self.assertEqual(data_product.to_dict()["url"], TEST_DATA_PRODUCT["url"])
+
+    def test_decoders(self):
+        project = Project.from_row(
+            self.client,
+            {
+                **TEST_MULTI_PROJECT,
+                "start_date": "2024-05-01",
+                "end_date": None,
+            },
+        )
+
+        self.assertEqual(project.start_date, date(2024, 5, 1))
+        self.assertIsNone(project.end_date)
+        self.assertFalse(hasattr(project, "field"))
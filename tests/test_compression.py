@@ -0,0 +1,79 @@
+import gzip
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests_mock
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.compression import (
+    HAS_ZSTD,
+    accept_encoding,
+    compress,
+    compress_stream,
+    decompress,
+)
+
+from example_data import TEST_MAP_LAYER
+
+
+class TestCompression(TestCase):
+    def setUp(self):
+        self.base_url = "https://example.com"
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        self.client = APIClient(self.base_url, session)
+
+    def test_accept_encoding(self):
+        with patch("d2spy.compression.ACCEPT_ENCODING", "gzip,deflate,br"):
+            self.assertEqual(accept_encoding(), "br, gzip, deflate")
+        # Sessions ask for every coding that urllib3 can decode
+        self.assertEqual(
+            self.client.session.headers["Accept-Encoding"], accept_encoding()
+        )
+
+    def test_compress(self):
+        data = json.dumps(TEST_MAP_LAYER).encode()
+        self.assertEqual(decompress(compress(data, "gzip"), "gzip"), data)
+
+        with patch("d2spy.compression.ZSTD_MODULE", None):
+            with self.assertRaisesRegex(ImportError, r"d2spy\[compression\]"):
+                compress(data, "zstd")
+        with self.assertRaises(ValueError):
+            compress(data, "br")  # type: ignore
+
+    def test_compress_stream(self):
+        data = json.dumps(TEST_MAP_LAYER).encode()
+        chunks = []
+        for start in range(0, len(data), 100):
+            stop = start + 100
+            chunks.append(data[start:stop])
+        encodings = ["gzip", "zstd"] if HAS_ZSTD else ["gzip"]
+        for encoding in encodings:
+            compressed = b"".join(compress_stream(chunks, encoding))  # type: ignore
+            self.assertEqual(decompress(compressed, encoding), data)
+
+        # Unsupported encodings fail before any chunk is read
+        with self.assertRaises(ValueError):
+            compress_stream(chunks, "br")  # type: ignore
+
+    @requests_mock.Mocker()
+    def test_request_compression(self, m):
+        endpoint = "/api/v1/projects/1/vector_layers/geojson"
+        m.post(self.base_url + endpoint, status_code=201, json={})
+        data = {"layer_name": "plots", "geojson": TEST_MAP_LAYER}
+
+        self.client.request_compression = "gzip"
+        self.client.compression_threshold = 0
+        self.client.make_post_request(endpoint, json=data)
+        request = m.last_request
+        self.assertEqual(request.headers["Content-Encoding"], "gzip")
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        self.assertEqual(json.loads(gzip.decompress(request.body)), data)
+
+        # Bodies below the threshold are sent uncompressed
+        self.client.compression_threshold = 10**6
+        self.client.make_post_request(endpoint, json=data)
+        self.assertNotIn("Content-Encoding", m.last_request.headers)
+        self.assertEqual(m.last_request.json(), data)
@@ -545,6 +545,14 @@ class TestDataProduct(TestCase):
         # Assert that False is returned for point clouds
         self.assertFalse(result)
 
+    @patch("d2spy.extras.geo.HAS_GEO", False)
+    def test_clip_without_geo(self):
+        """Test that clip asks for the geo extras when they are missing"""
+        data_product = DataProduct(self.client, **TEST_DATA_PRODUCT)
+
+        with self.assertRaisesRegex(ImportError, r"pip install d2spy\[geo\]"):
+            data_product.clip({}, "output.tif")
+
     @patch("d2spy.extras.geo.clip_by_mask")
     def test_clip_with_api_key(self, mock_clip_by_mask):
         """Test clipping with API key when 401 error occurs"""
@@ -1,8 +1,9 @@
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
 from requests import Session
 
 from d2spy.api_client import APIClient
+from d2spy.extras.columnar import HAS_ARROW
 from d2spy.models.data_product import DataProduct
 from d2spy.models.data_product_collection import DataProductCollection
 
@@ -40,3 +41,39 @@ class TestDataProductCollection(TestCase):
         # Each item in returned DataProductCollection should be DataProduct
         for data_product in filtered_collection:
             self.assertIsInstance(data_product, DataProduct)
+
+    @skipUnless(HAS_ARROW, "requires d2spy[arrow]")
+    def test_to_arrow(self):
+        # Setup a test session
+        base_url = "https://example.com"
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+
+        # Instantiate the APIClient with a test URL and the test session
+        client = APIClient(base_url, session)
+
+        # Test data product collection
+        collection = DataProductCollection(
+            collection=[
+                DataProduct(client, **{**TEST_DATA_PRODUCT, "data_type": "dsm"}),
+                DataProduct(client, **{**TEST_DATA_PRODUCT, "data_type": "ortho"}),
+            ]
+        )
+
+        table = collection.to_arrow()
+
+        # One row per data product with UUIDs stored as 16-byte binary
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(str(table.schema.field("id").type), "fixed_size_binary[16]")
+        # STAC raster statistics are flattened into columns
+        self.assertEqual(table.column("band_count").to_pylist(), [1, 1])
+        self.assertEqual(table.column("b1_mean").to_pylist(), [187.959, 187.959])
+
+        # Round trip back to data products
+        round_trip = DataProductCollection.from_arrow(table, client)
+        self.assertEqual(len(round_trip), 2)
+        self.assertEqual(round_trip[1].data_type, "ortho")
+        self.assertEqual(round_trip[0].id, TEST_DATA_PRODUCT["id"])
+        self.assertEqual(
+            round_trip[0].stac_properties, TEST_DATA_PRODUCT["stac_properties"]
+        )
@@ -1,3 +1,4 @@
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -15,10 +16,20 @@ from d2spy.models.flight import Flight
 from d2spy.models.project import Project
 from d2spy.models.raw_data import RawData
 
-from example_data import TEST_FLIGHT, TEST_PROJECT
+from example_data import TEST_DATA_PRODUCT, TEST_FLIGHT, TEST_PROJECT
 
 
 class TestFlight(TestCase):
+    def test_data_products(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        client = APIClient("https://example.com", session)
+        raw = json.dumps({**TEST_FLIGHT, "data_products": [TEST_DATA_PRODUCT]})
+        flight = Flight.from_json(client, raw)
+
+        # Nested data products are decoded with the flight, as plain rows
+        self.assertEqual(flight.data_products, [TEST_DATA_PRODUCT])
+
     @requests_mock.Mocker()
     @patch("d2spy.extras.third_party.tusclient.client.TusClient")
     def test_add_data_product(self, m, MockTusClient):
@@ -1,9 +1,10 @@
-from datetime import date
-from unittest import TestCase
+from datetime import date, timedelta
+from unittest import TestCase, skipUnless
 
 from requests import Session
 
 from d2spy.api_client import APIClient
+from d2spy.extras.columnar import HAS_ARROW
 from d2spy.models.flight import Flight
 from d2spy.models.flight_collection import FlightCollection
 
@@ -92,3 +93,101 @@ class TestFlightCollection(TestCase):
 
         # Should find match even with typo
         self.assertEqual(len(filtered_collection3), 1)
+
+        # Matching is case insensitive and keeps collection order
+        filtered_collection4 = collection.filter_by_sensor("rgb", exact=True)
+        self.assertEqual(
+            [flight for flight in filtered_collection4], collection.collection[:2]
+        )
+
+    @skipUnless(HAS_ARROW, "requires d2spy[arrow]")
+    def test_to_arrow(self):
+        # Setup a test session
+        base_url = "https://example.com"
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+
+        # Instantiate the APIClient with a test URL and the test session
+        client = APIClient(base_url, session)
+
+        # Test flight collection
+        collection = FlightCollection(
+            collection=[
+                Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-05-01"}),
+                Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-06-01"}),
+            ]
+        )
+
+        # Acquisition dates are parsed into date column
+        df = collection.to_pandas()
+        self.assertEqual(
+            list(df["acquisition_date"]), [date(2024, 5, 1), date(2024, 6, 1)]
+        )
+
+        # Round trip back to flights
+        round_trip = FlightCollection.from_arrow(collection.to_arrow(), client)
+        self.assertEqual(round_trip[1].acquisition_date, "2024-06-01")
+        self.assertEqual(round_trip[0].project_id, TEST_FLIGHT["project_id"])
+        self.assertEqual(round_trip[0].sensor, TEST_FLIGHT["sensor"])
+
+    def test_group_by_and_windows(self):
+        # Setup a test session
+        base_url = "https://example.com"
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+
+        # Instantiate the APIClient with a test URL and the test session
+        client = APIClient(base_url, session)
+
+        # Test flight collection (out of chronological order)
+        collection = FlightCollection(
+            collection=[
+                Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-06-03"}),
+                Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-05-01"}),
+                Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-05-05"}),
+                Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-05-06"}),
+            ]
+        )
+
+        # Group by month, keyed by first day of month in chronological order
+        months = collection.group_by_month()
+        self.assertEqual(list(months), [date(2024, 5, 1), date(2024, 6, 1)])
+        self.assertEqual(len(months[date(2024, 5, 1)]), 3)
+
+        # Group by ISO week, keyed by Monday
+        weeks = collection.group_by_week()
+        self.assertEqual(
+            list(weeks), [date(2024, 4, 29), date(2024, 5, 6), date(2024, 6, 3)]
+        )
+        self.assertEqual(len(weeks[date(2024, 4, 29)]), 2)
+
+        # Two week windows stepping one week at a time
+        windows = list(
+            collection.iter_windows(size=timedelta(days=14), step=timedelta(days=7))
+        )
+        self.assertEqual(windows[0][0], date(2024, 5, 1))
+        self.assertEqual([len(window[2]) for window in windows], [3, 0, 0, 1, 1])
+
+        # No window starts on end_date
+        windows = list(
+            collection.iter_windows(
+                size=timedelta(days=7),
+                start_date=date(2024, 5, 1),
+                end_date=date(2024, 5, 15),
+            )
+        )
+        self.assertEqual(
+            [window[0] for window in windows], [date(2024, 5, 1), date(2024, 5, 8)]
+        )
+
+        # Index is rebuilt after the collection changes
+        collection.collection.append(
+            Flight(client, **{**TEST_FLIGHT, "acquisition_date": "2024-05-02"})
+        )
+        filtered_collection = collection.filter_by_date(
+            start_date=date(2024, 5, 1), end_date=date(2024, 5, 2)
+        )
+        self.assertEqual(
+            [flight.acquisition_date for flight in filtered_collection],
+            ["2024-05-01", "2024-05-02"],
+        )
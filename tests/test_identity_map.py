@@ -0,0 +1,105 @@
+import gc
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import Session
+
+from d2spy import schemas
+from d2spy.api_client import APIClient
+from d2spy.identity_map import IdentityMap, build_models
+from d2spy.models.flight import Flight
+from d2spy.models.project import Project
+from d2spy.workspace import Workspace
+
+from example_data import TEST_FLIGHT, TEST_MULTI_PROJECT, TEST_PROJECT
+
+
+class TestIdentityMap(TestCase):
+    def setUp(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        self.workspace = Workspace(
+            "https://example.com", session, identity_map=IdentityMap(max_size=2)
+        )
+        self.client = self.workspace.client
+
+    def test_get_or_create_refreshes_in_place(self):
+        identity_map = IdentityMap()
+
+        flight = identity_map.get_or_create(Flight, self.client, TEST_FLIGHT)
+        same_flight = identity_map.get_or_create(
+            Flight, self.client, {**TEST_FLIGHT, "name": "Renamed"}
+        )
+
+        self.assertIs(flight, same_flight)
+        self.assertEqual(flight.name, "Renamed")
+        self.assertIs(identity_map.get("Flight", TEST_FLIGHT["id"]), flight)
+
+    def test_bounded_strong_references(self):
+        identity_map = IdentityMap(max_size=1)
+
+        for index in range(3):
+            identity_map.get_or_create(
+                Flight, self.client, {**TEST_FLIGHT, "id": str(index)}
+            )
+        gc.collect()
+
+        # Only the most recently used instance is kept alive by the map
+        self.assertEqual(len(identity_map), 1)
+        self.assertIsNotNone(identity_map.get("Flight", "2"))
+        self.assertIsNone(identity_map.get("Flight", "0"))
+
+    @patch("d2spy.api_client.APIClient.make_get_request")
+    def test_get_project_returns_same_instance(self, mock_make_get_request):
+        mock_make_get_request.return_value = {**TEST_PROJECT, "title": "First"}
+        project = self.workspace.get_project(TEST_PROJECT["id"])
+
+        mock_make_get_request.return_value = {**TEST_PROJECT, "title": "Second"}
+        same_project = self.workspace.get_project(TEST_PROJECT["id"])
+
+        self.assertIs(project, same_project)
+        self.assertEqual(project.title, "Second")
+
+    @patch("d2spy.api_client.APIClient.make_get_request")
+    def test_get_flight_served_from_memory(self, mock_make_get_request):
+        project = Project(self.client, **TEST_PROJECT)
+
+        mock_make_get_request.return_value = [TEST_FLIGHT]
+        flights = project.get_flights()
+
+        # Flight was loaded by get_flights, no request needed
+        flight = project.get_flight(TEST_FLIGHT["id"])
+
+        mock_make_get_request.assert_called_once()
+        self.assertIs(flight, flights[0])
+
+    def test_build_models(self):
+        client = APIClient("https://example.com", self.client.session)
+        rows = [
+            {**TEST_MULTI_PROJECT, "start_date": "2024-05-01", "end_date": None},
+            {**TEST_MULTI_PROJECT, "id": "1", "planting_date": "2024-05-02"},
+        ]
+
+        projects = build_models(Project, client, rows, schemas.MultiProject)
+
+        self.assertEqual(projects[0].start_date, date(2024, 5, 1))
+        self.assertIsNone(projects[0].end_date)
+        self.assertEqual(projects[1].start_date, date(2024, 5, 2))
+        self.assertEqual(projects[1].title, TEST_MULTI_PROJECT["title"])
+
+        with self.assertRaisesRegex(KeyError, "centroid, flight_count, role, title"):
+            build_models(
+                Project, client, [{"id": "2", "description": ""}], schemas.MultiProject
+            )
+
+    def test_build_models_with_identity_map(self):
+        flight = Flight(self.client, **TEST_FLIGHT)
+        self.client.identity_map.get_or_create(Flight, self.client, TEST_FLIGHT)
+
+        (same_flight,) = build_models(
+            Flight, self.client, [{**TEST_FLIGHT, "name": "Renamed"}], schemas.Flight
+        )
+
+        self.assertIs(same_flight, self.client.identity_map.get("Flight", flight.id))
+        self.assertEqual(same_flight.name, "Renamed")
@@ -0,0 +1,191 @@
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from d2spy.extras.geo import HAS_GEO
+from d2spy.testing.images import dms, write_geotagged_images
+
+
+class TestImages(TestCase):
+    def test_dms(self):
+        self.assertEqual(dms(-86.5), ((86, 1), (30, 1), (0, 10000)))
+
+    @skipUnless(HAS_GEO, "requires d2spy[geo]")
+    def test_geotagged_images(self):
+        from d2spy.extras.geo import (
+            get_bounding_box_from_exif_data,
+            get_exif_data,
+            get_gps_coordinates,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinates = [(40.41, -86.95), (40.42, -86.94), (-40.43, 86.93)]
+            paths = write_geotagged_images(temp_dir, 3, coordinates=coordinates)
+            self.assertEqual(len(os.listdir(temp_dir)), 3)
+
+            for path, (lat, lon) in zip(paths, coordinates):
+                gps_coords = get_gps_coordinates(get_exif_data(path))
+                self.assertAlmostEqual(gps_coords[0], lat, places=6)
+                self.assertAlmostEqual(gps_coords[1], lon, places=6)
+
+            bounding_box = get_bounding_box_from_exif_data(temp_dir)
+            self.assertEqual(bounding_box[0][0], [-86.95, -40.43])
+
+    @skipUnless(HAS_GEO, "requires d2spy[geo]")
+    def test_read_gps_coordinates(self):
+        from d2spy.extras.geo import (
+            get_exif_data,
+            read_gps_coordinates,
+            read_gps_coordinates_parallel,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinates = [(40.41, -86.95), (40.42, -86.94), (-40.43, 86.93)]
+            paths = write_geotagged_images(
+                temp_dir, 3, coordinates=coordinates, maker_note=1024
+            )
+
+            # Header-only reads skip the MakerNote
+            self.assertIn("EXIF MakerNote", get_exif_data(paths[0]))
+            self.assertNotIn("EXIF MakerNote", get_exif_data(paths[0], details=False))
+            lat, lon = read_gps_coordinates(paths[0])
+            self.assertAlmostEqual(lat, 40.41, places=6)
+            self.assertAlmostEqual(lon, -86.95, places=6)
+
+            for workers, executor in ((1, "thread"), (2, "thread"), (2, "process")):
+                reported = []
+                results = read_gps_coordinates_parallel(
+                    paths,
+                    workers=workers,
+                    executor=executor,  # type: ignore[arg-type]
+                    progress=lambda done, total: reported.append((done, total)),
+                )
+                self.assertEqual(
+                    [(round(lat, 6), round(lon, 6)) for lat, lon in results],
+                    coordinates,
+                )
+                self.assertEqual(reported, [(1, 3), (2, 3), (3, 3)])
+
+            with self.assertRaises(ValueError):
+                read_gps_coordinates_parallel(paths, executor="fork")  # type: ignore
+
+    @skipUnless(HAS_GEO, "requires d2spy[geo]")
+    def test_read_zip_gps_coordinates(self):
+        from d2spy.extras import geo
+        from d2spy.extras.geo import (
+            get_bounding_box_from_exif_data,
+            read_zip_gps_coordinates,
+        )
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinates = [(40.41, -86.95), (40.42, -86.94), (-40.43, 86.93)]
+            paths = write_geotagged_images(
+                os.path.join(temp_dir, "images"),
+                3,
+                coordinates=coordinates,
+                padding=1024,
+            )
+            zip_path = os.path.join(temp_dir, "raw_data.zip")
+            with ZipFile(zip_path, "w", ZIP_DEFLATED) as zip_file:
+                for path in paths:
+                    zip_file.write(path, f"flight/{os.path.basename(path)}")
+                zip_file.writestr("flight/notes.txt", "not an image")
+
+            for workers, executor in ((1, "thread"), (2, "thread"), (2, "process")):
+                results = read_zip_gps_coordinates(
+                    zip_path, workers=workers, executor=executor  # type: ignore
+                )
+                self.assertEqual(
+                    [(round(lat, 6), round(lon, 6)) for lat, lon in results],
+                    coordinates,
+                )
+
+            # Zip file opened for serial reads in this process is closed
+            read_zip_gps_coordinates(zip_path, workers=1, executor="process")
+            self.assertIsNone(geo._worker_zip)
+
+            # EXIF data beyond the header is read from the zip member
+            with patch("d2spy.extras.geo.ZIP_HEADER_SIZE", 16):
+                self.assertTrue(all(read_zip_gps_coordinates(zip_path, workers=1)))
+
+            # Images are not extracted
+            bounding_box = get_bounding_box_from_exif_data(zip_path, progress=False)
+            self.assertEqual(bounding_box[0][0], [-86.95, -40.43])
+            self.assertEqual(os.listdir(temp_dir).count("flight"), 0)
+
+            with self.assertWarns(DeprecationWarning):
+                get_bounding_box_from_exif_data(
+                    zip_path, tmpdir=temp_dir, progress=False
+                )
+            with self.assertWarns(DeprecationWarning):
+                with self.assertRaises(FileNotFoundError):
+                    get_bounding_box_from_exif_data(
+                        zip_path,
+                        tmpdir=os.path.join(temp_dir, "missing"),
+                        progress=False,
+                    )
+
+    @skipUnless(HAS_GEO, "requires d2spy[geo]")
+    def test_footprint(self):
+        from shapely.geometry import box, shape
+
+        from d2spy.extras.geo import get_footprint_from_exif_data, get_image_positions
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Diagonal flight lines with an L-shaped gap in the upper left
+            coordinates = [
+                (40.40 + 0.001 * row, -86.95 + 0.001 * col)
+                for row in range(10)
+                for col in range(10)
+                if row <= col or row < 2
+            ]
+            write_geotagged_images(temp_dir, len(coordinates), coordinates=coordinates)
+            bbox = box(-86.95, 40.40, -86.941, 40.409)
+
+            convex = get_footprint_from_exif_data(temp_dir, progress=False)
+            self.assertEqual(convex["type"], "Feature")
+            self.assertEqual(convex["geometry"]["type"], "Polygon")
+            convex_shape = shape(convex["geometry"])
+            self.assertLess(convex_shape.area, bbox.area)
+
+            concave = shape(
+                get_footprint_from_exif_data(
+                    temp_dir, method="concave", ratio=0.1, progress=False
+                )["geometry"]
+            )
+            self.assertLess(concave.area, convex_shape.area)
+
+            envelope = shape(
+                get_footprint_from_exif_data(temp_dir, method="bbox", progress=False)[
+                    "geometry"
+                ]
+            )
+            self.assertAlmostEqual(envelope.area, bbox.area, places=9)
+
+            # Buffer is in meters
+            buffered = shape(
+                get_footprint_from_exif_data(temp_dir, buffer=50, progress=False)[
+                    "geometry"
+                ]
+            )
+            self.assertTrue(buffered.contains(convex_shape))
+
+            positions = get_image_positions(temp_dir, progress=False)
+            self.assertEqual(len(positions), len(coordinates))
+            self.assertEqual(positions.crs.to_epsg(), 4326)
+            self.assertTrue(positions.geometry.within(buffered).all())
+
+            with self.assertRaises(ValueError):
+                get_footprint_from_exif_data(temp_dir, method="alpha", progress=False)
+
+    @skipUnless(HAS_GEO, "requires d2spy[geo]")
+    def test_footprint_collinear(self):
+        from d2spy.extras.geo import get_footprint_from_exif_data
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            coordinates = [(40.40 + 0.001 * i, -86.95 + 0.001 * i) for i in range(5)]
+            write_geotagged_images(temp_dir, 5, coordinates=coordinates)
+            with self.assertRaises(ValueError):
+                get_footprint_from_exif_data(temp_dir, progress=False)
@@ -0,0 +1,36 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+# Optional dependencies that must only be imported on first use
+HEAVY_MODULES = ("rasterio", "geopandas", "shapely", "numpy", "exifread", "pyarrow")
+
+
+def imported_modules(statement: str):
+    """Run import statement in a fresh interpreter and return heavy modules that
+    were imported."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement}; "
+            f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+class TestImports(TestCase):
+    def test_workspace_does_not_import_geo_stack(self):
+        self.assertEqual(imported_modules("import d2spy.workspace"), [])
+
+    def test_geo_extras_import_lazily(self):
+        # Checking for geo extras must not import them
+        self.assertEqual(
+            imported_modules("from d2spy.extras.geo import HAS_GEO, clip_by_mask"),
+            [],
+        )
@@ -0,0 +1,126 @@
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests_mock
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.instrumentation import (
+    MetricsAggregator,
+    RequestEvent,
+    endpoint_template,
+    percentile,
+)
+from d2spy.models.flight import Flight
+
+from example_data import TEST_FLIGHT, TEST_MULTI_PROJECT, TEST_PROJECT
+
+
+class TestInstrumentation(TestCase):
+    def setUp(self):
+        self.base_url = "https://example.com"
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        session.cookies.set("refresh_token", "fake_refresh_token")
+        self.client = APIClient(self.base_url, session)
+
+    def test_endpoint_template(self):
+        project_id = TEST_PROJECT["id"]
+        self.assertEqual(
+            endpoint_template(f"/api/v1/projects/{project_id}/flights?has_raster=1"),
+            "/api/v1/projects/{id}/flights",
+        )
+        self.assertEqual(
+            endpoint_template("/api/v1/projects/1/vector_layers/42"),
+            "/api/v1/projects/{id}/vector_layers/{id}",
+        )
+        self.assertEqual(endpoint_template("/files/abc123"), "/files/{id}")
+
+    def test_aggregator(self):
+        metrics = MetricsAggregator()
+        for elapsed in range(1, 101):
+            metrics(RequestEvent("GET", "/api/v1/projects", 200, elapsed / 100))
+        metrics(RequestEvent("GET", "/api/v1/projects", 500, 0.5, response_bytes=10))
+
+        (row,) = metrics.summary()
+        self.assertEqual(row["count"], 101)
+        self.assertEqual(row["errors"], 1)
+        self.assertEqual(row["response_bytes"], 10)
+        self.assertEqual(percentile(sorted([3.0, 1.0, 2.0]), 0.5), 2.0)
+        self.assertAlmostEqual(row["p99"], 0.99)
+
+        text = metrics.to_prometheus()
+        self.assertIn(
+            'd2spy_requests_total{kind="api",method="GET",'
+            'endpoint="/api/v1/projects",status="500"} 1',
+            text,
+        )
+        self.assertIn('quantile="0.95"', text)
+        self.assertIn("d2spy_request_duration_seconds_count", text)
+        # Last line ends with a line feed
+        self.assertTrue(text.endswith("\n"))
+        self.assertFalse(text.endswith("\n\n"))
+
+        metrics.reset()
+        self.assertEqual(metrics.summary(), [])
+
+    @requests_mock.Mocker()
+    def test_hooks_report_refresh_and_retry(self, m):
+        events = []
+        self.client.add_hook(events.append)
+        # A failing hook must not break requests
+        self.client.add_hook(lambda event: 1 / 0)
+
+        endpoint = f"/api/v1/projects/{TEST_PROJECT['id']}"
+        m.get(
+            self.base_url + endpoint,
+            [{"status_code": 401}, {"status_code": 200, "json": TEST_MULTI_PROJECT}],
+        )
+        m.post(
+            self.base_url + "/api/v1/auth/refresh-token",
+            status_code=200,
+            cookies={"access_token": "new_token"},
+        )
+
+        self.client.make_get_request(endpoint)
+
+        self.assertEqual(
+            [
+                (event.method, event.status, event.retry, event.refresh)
+                for event in events
+            ],
+            [
+                ("GET", 401, False, False),
+                ("POST", 200, False, True),
+                ("GET", 200, True, False),
+            ],
+        )
+        self.assertEqual(events[-1].endpoint, "/api/v1/projects/{id}")
+        self.assertGreater(events[-1].response_bytes, 0)
+
+    @requests_mock.Mocker()
+    @patch("d2spy.extras.third_party.tusclient.client.TusClient")
+    def test_upload_chunks(self, m, MockTusClient):
+        m.get(f"{self.base_url}/api/v1/users/current", json={})
+        metrics = self.client.add_hook(MetricsAggregator())
+
+        chunk_size = 10 * 1024 * 1024
+        mock_uploader = MockTusClient.return_value.uploader.return_value
+        mock_uploader.get_file_size.return_value = chunk_size * 2
+        mock_uploader.offset = 0
+        mock_uploader.request.status_code = 204
+
+        def upload_chunk_side_effect():
+            mock_uploader.offset += chunk_size
+
+        mock_uploader.upload_chunk.side_effect = upload_chunk_side_effect
+
+        flight = Flight(self.client, **TEST_FLIGHT)
+        with tempfile.NamedTemporaryFile(suffix=".tif") as temp_data_product:
+            flight.add_data_product(temp_data_product.name, "dsm")
+
+        upload = [row for row in metrics.summary() if row["kind"] == "upload"][0]
+        self.assertEqual(upload["endpoint"], "/files/{id}")
+        self.assertEqual(upload["count"], 2)
+        self.assertEqual(upload["request_bytes"], chunk_size * 2)
@@ -0,0 +1,41 @@
+import json
+from unittest import TestCase
+
+from d2spy.json_stream import iter_json
+
+from example_data import TEST_MAP_LAYER
+
+
+def chunked(document, size):
+    """Split encoded JSON document into chunks of `size` bytes."""
+    data = json.dumps(document, ensure_ascii=False).encode()
+    chunks = []
+    for start in range(0, len(data), size):
+        stop = start + size
+        chunks.append(data[start:stop])
+    return chunks
+
+
+class TestJSONStream(TestCase):
+    def test_items(self):
+        document = [1, -2.5e-7, 1500.0, 'é"x', True, None, {"a": [1, 2]}, []]
+        # Tiny chunks split numbers, strings, and multi-byte characters
+        for size in (1, 2, 3, 1024):
+            self.assertEqual(list(iter_json(chunked(document, size))), document)
+
+    def test_paths(self):
+        layers = [TEST_MAP_LAYER, {"features": [], "type": "FeatureCollection"}]
+
+        features = list(iter_json(chunked(layers, 7), "item.features.item"))
+        self.assertEqual(features, TEST_MAP_LAYER["features"])
+
+        features = list(iter_json(chunked(TEST_MAP_LAYER, 7), "features.item"))
+        self.assertEqual(len(features), 2)
+
+        self.assertEqual(list(iter_json(chunked({"a": 1}, 1), "")), [{"a": 1}])
+        self.assertEqual(list(iter_json(chunked([], 1))), [])
+
+    def test_invalid(self):
+        for data in (b"[1, 2", b'{"a": 1}', b"[1 2]", b"[1] 2", b"[1.x]"):
+            with self.assertRaises(ValueError):
+                list(iter_json([data]))
@@ -1,14 +1,16 @@
+import json
 from datetime import date
 from typing import Dict, List
 from unittest import TestCase
 from unittest.mock import patch
 
+import requests_mock
 from requests import Session
 
 from d2spy.api_client import APIClient
 from d2spy.models.flight import Flight
 from d2spy.models.flight_collection import FlightCollection
-from d2spy.models.project import Project
+from d2spy.models.project import map_layer_chunks, Project
 
 from example_data import (
     TEST_FEATURE_COLLECTION,
@@ -385,6 +387,32 @@ class TestProject(TestCase):
         self.assertIn("metadata", response_feature_collection)
         self.assertIn("preview_url", response_feature_collection["metadata"])
 
+    def test_map_layer_chunks(self):
+        features = TEST_MAP_LAYER["features"]
+
+        # Features are split across chunks of about the chunk size
+        with patch("d2spy.models.project.MAP_LAYER_CHUNK_SIZE", 1):
+            chunks = list(map_layer_chunks("plots", iter(features), len(features)))
+        self.assertEqual(len(chunks), len(features) + 1)
+        self.assertEqual(
+            json.loads(b"".join(chunks)),
+            {
+                "layer_name": "plots",
+                "geojson": {"type": "FeatureCollection", "features": features},
+            },
+        )
+
+        empty = json.loads(b"".join(map_layer_chunks("plots", iter([]))))
+        self.assertEqual(empty["geojson"]["features"], [])
+
+    def test_upload_map_layer_requires_layer_name(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        project = Project(APIClient("https://example.com", session), **TEST_PROJECT)
+
+        with self.assertRaises(ValueError):
+            project.upload_map_layer(iter(TEST_MAP_LAYER["features"]))
+
     @patch("d2spy.api_client.APIClient.make_get_request")
     def test_get_map_layers(self, mock_make_get_request):
         # Setup a test session
@@ -422,6 +450,26 @@ class TestProject(TestCase):
             self.assertIsInstance(features, List)
             self.assertEqual(len(features), 2)
 
+    @requests_mock.Mocker()
+    def test_iter_map_layers(self, m):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        client = APIClient("https://example.com", session)
+        project = Project(client, **TEST_PROJECT)
+
+        m.get(
+            f"https://example.com/api/v1/projects/{project.id}/vector_layers",
+            json=TEST_FEATURE_COLLECTION,
+        )
+
+        map_layers = list(project.iter_map_layers())
+        self.assertEqual(map_layers, TEST_FEATURE_COLLECTION)
+        self.assertEqual(m.last_request.qs, {"format": ["json"]})
+
+        features = list(project.iter_map_layer_features())
+        self.assertEqual(len(features), 4)
+        self.assertEqual(features[0], TEST_FEATURE_COLLECTION[0]["features"][0])
+
     @patch("d2spy.api_client.APIClient.make_put_request")
     def test_update(self, mock_make_put_request):
         # Setup a test session
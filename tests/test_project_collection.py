@@ -75,3 +75,63 @@ class TestProjectCollection(TestCase):
         # Each item in returned ProjectCollection should be Project
         for project in filtered_collection:
             self.assertIsInstance(project, Project)
+
+    def test_search(self):
+        # Setup a test session
+        base_url = "https://example.com"
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+
+        # Instantiate the APIClient with a test URL and the test session
+        client = APIClient(base_url, session)
+
+        # Test project collection
+        collection = ProjectCollection(
+            collection=[
+                Project(
+                    client,
+                    **{
+                        **TEST_PROJECT,
+                        "title": "Soybean trial",
+                        "description": "Corn rotation",
+                    },
+                ),
+                Project(
+                    client,
+                    **{
+                        **TEST_PROJECT,
+                        "title": "Corn trial 2024",
+                        "description": "Nitrogen rates",
+                    },
+                ),
+                Project(
+                    client,
+                    **{
+                        **TEST_PROJECT,
+                        "title": "Wheat",
+                        "description": "Popcorn field",
+                    },
+                ),
+            ]
+        )
+
+        # Title matches rank first, substring matches inside words included
+        titles = [project.title for project in collection.search("corn")]
+        self.assertEqual(titles, ["Corn trial 2024", "Soybean trial", "Wheat"])
+
+        # Prefix mode only matches the start of words
+        titles = [project.title for project in collection.search("corn", mode="prefix")]
+        self.assertEqual(titles, ["Corn trial 2024", "Soybean trial"])
+
+        # Every term must match
+        titles = [project.title for project in collection.search("TRIAL nitro")]
+        self.assertEqual(titles, ["Corn trial 2024"])
+
+        # Short queries and limit
+        self.assertEqual(len(collection.search("a", limit=2)), 2)
+
+        # Index is rebuilt after the collection changes
+        collection.collection.append(
+            Project(client, **{**TEST_PROJECT, "title": "Sorghum"})
+        )
+        self.assertEqual(len(collection.filter_by_title("sorghum")), 1)
@@ -0,0 +1,165 @@
+from datetime import date
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.models.data_product import DataProduct
+from d2spy.models.data_product_collection import DataProductCollection
+from d2spy.models.flight import Flight
+from d2spy.models.flight_collection import FlightCollection
+from d2spy.models.project import Project
+from d2spy.models.project_collection import ProjectCollection
+from d2spy.models.query import Query
+
+from example_data import (
+    TEST_DATA_PRODUCT,
+    TEST_FLIGHT,
+    TEST_MULTI_PROJECT,
+    TEST_PROJECT,
+)
+
+
+class TestQuery(TestCase):
+    def setUp(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        self.client = APIClient("https://example.com", session)
+
+    def make_flights(self) -> FlightCollection:
+        flights = [
+            ("2024-04-30", "RGB", "M350", []),
+            ("2024-05-01", "Multispectral", "M350", [{"data_type": "ortho"}]),
+            ("2024-05-15", "RGB", "Phantom 4", [{"data_type": "dsm"}]),
+            ("2024-05-31", "rgb", "M350", [{"data_type": "DSM"}]),
+            ("2024-06-01", "RGB", "M350", [{"data_type": "dsm"}]),
+        ]
+        return FlightCollection(
+            collection=[
+                Flight(
+                    self.client,
+                    **{
+                        **TEST_FLIGHT,
+                        "acquisition_date": acquisition_date,
+                        "sensor": sensor,
+                        "platform": platform,
+                        "data_products": data_products,
+                    },
+                )
+                for acquisition_date, sensor, platform, data_products in flights
+            ]
+        )
+
+    def test_flight_query(self):
+        collection = self.make_flights()
+
+        query = (
+            collection.query()
+            .data_type("dsm")
+            .sensor("RGB", exact=True)
+            .date_range(date(2024, 5, 1), date(2024, 5, 31))
+            .platform("m350")
+        )
+
+        # Nothing is evaluated until execute, and indexed filters run first
+        self.assertIsInstance(query, Query)
+        self.assertEqual(
+            query.plan(),
+            ["index:sensor", "scan:date_range", "scan:platform", "scan:data_type"],
+        )
+
+        result = query.execute()
+        self.assertIsInstance(result, FlightCollection)
+        self.assertEqual([flight.acquisition_date for flight in result], ["2024-05-31"])
+        # Queries are immutable
+        self.assertEqual(len(collection.query().sensor("RGB").execute()), 4)
+
+    def test_where_and_errors(self):
+        collection = self.make_flights()
+
+        result = collection.query().where(lambda flight: flight.sensor == "RGB")
+        self.assertEqual(len(list(result)), 3)
+
+        # Data product filters are not available for flights
+        with self.assertRaises(ValueError):
+            collection.query().band_names(["NIR"])
+        # Server-side filters need a query that requests its data
+        query = collection.query().has_raster()
+        with self.assertRaises(ValueError):
+            query.execute()
+        # Representation of the query does not raise
+        self.assertEqual(repr(query), "Query(kind='flight', predicates=['has_raster'])")
+
+    def test_data_product_query(self):
+        collection = DataProductCollection(
+            collection=[
+                DataProduct(self.client, **TEST_DATA_PRODUCT, bbox=[0, 0, 1, 1]),
+                DataProduct(
+                    self.client,
+                    **{**TEST_DATA_PRODUCT, "data_type": "ortho"},
+                    bbox=[0, 0, 1, 1],
+                ),
+                DataProduct(self.client, **TEST_DATA_PRODUCT, bbox=[5, 5, 6, 6]),
+                DataProduct(self.client, **TEST_DATA_PRODUCT),
+            ]
+        )
+
+        result = (
+            collection.query()
+            .data_type("DSM")
+            .band_names(["gray"])
+            .intersects((0.5, 0.5, 2, 2))
+            .execute()
+        )
+        self.assertIsInstance(result, DataProductCollection)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0].bbox, [0, 0, 1, 1])
+
+    def test_project_query(self):
+        collection = ProjectCollection(
+            collection=[
+                Project(self.client, **TEST_PROJECT),
+                Project(
+                    self.client,
+                    **{
+                        **TEST_MULTI_PROJECT,
+                        "title": "Wheat",
+                        "centroid": {"x": 0, "y": 0},
+                    },
+                ),
+                Project(self.client, **{**TEST_MULTI_PROJECT, "title": "Test Wheat"}),
+            ]
+        )
+
+        # First project boundary, third project centroid
+        result = collection.query().intersects((35, 15, 45, 25)).execute()
+        self.assertEqual(len(result), 2)
+
+        result = collection.query().title("test").intersects((35, 15, 45, 25))
+        self.assertEqual(result.plan(), ["index:title", "scan:intersects"])
+        self.assertEqual(
+            [project.title for project in result.execute()],
+            ["Test Project", "Test Wheat"],
+        )
+
+        # Only the first project has start and end dates
+        result = collection.query().date_range(date(2000, 1, 1), date.today())
+        self.assertEqual(len(result.execute()), 1)
+
+    @patch("d2spy.api_client.APIClient.make_get_request")
+    def test_server_params(self, mock_make_get_request):
+        mock_make_get_request.return_value = [TEST_FLIGHT]
+        project = Project(self.client, **TEST_PROJECT)
+
+        query = project.query_flights().has_raster().sensor("RGB")
+        # Flights are only requested when the query is executed
+        mock_make_get_request.assert_not_called()
+        self.assertEqual(query.plan(), ["server:has_raster", "index:sensor"])
+
+        result = query.execute()
+        self.assertEqual(len(result), 1)
+        mock_make_get_request.assert_called_once_with(
+            f"/api/v1/projects/{TEST_PROJECT['id']}/flights",
+            params={"has_raster": True},
+        )
@@ -0,0 +1,187 @@
+import os
+import tempfile
+from datetime import date
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.extras.geo import HAS_GEO
+from d2spy.models.data_product import DataProduct
+from d2spy.models.data_product_collection import DataProductCollection
+from d2spy.models.flight import Flight
+from d2spy.models.flight_collection import FlightCollection
+
+from example_data import TEST_DATA_PRODUCT, TEST_FLIGHT
+
+# Upper left corner of the synthetic rasters in UTM zone 16N
+ORIGIN = (504000.0, 4588000.0)
+
+
+def utm_box(left, bottom, right, top):
+    """Returns bounding box in WGS84 of a box in UTM zone 16N."""
+    from pyproj import Transformer
+
+    transformer = Transformer.from_crs("EPSG:32616", "EPSG:4326", always_xy=True)
+    xmin, ymin = transformer.transform(left, bottom)
+    xmax, ymax = transformer.transform(right, top)
+    return (xmin, ymin, xmax, ymax)
+
+
+@skipUnless(HAS_GEO, "requires d2spy[geo]")
+class TestRaster(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import numpy as np
+        import rasterio
+        from rasterio.warp import calculate_default_transform, reproject
+
+        from d2spy.testing.rasters import write_raster
+
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        # 10 m x 10 m rasters at 0.1 m with values increasing from left to right
+        cls.values = np.tile(np.arange(100, dtype="float32"), (100, 1))
+        cls.paths = [
+            write_raster(
+                os.path.join(cls.temp_dir.name, f"dsm_{day}.tif"),
+                cls.values + day,
+                origin=ORIGIN,
+                overviews=True,
+            )
+            for day in range(3)
+        ]
+        # Same area in Web Mercator at a coarser resolution
+        cls.mercator_path = os.path.join(cls.temp_dir.name, "dsm_3857.tif")
+        with rasterio.open(cls.paths[0]) as dataset:
+            transform, width, height = calculate_default_transform(
+                dataset.crs, "EPSG:3857", dataset.width, dataset.height, *dataset.bounds
+            )
+            data = np.empty((height, width), dtype="float32")
+            reproject(
+                dataset.read(1),
+                data,
+                src_transform=dataset.transform,
+                src_crs=dataset.crs,
+                dst_transform=transform,
+                dst_crs="EPSG:3857",
+            )
+            profile = {**dataset.profile, "crs": "EPSG:3857"}
+            profile.update(transform=transform, width=width, height=height)
+        with rasterio.open(cls.mercator_path, "w", **profile) as out:
+            out.write(data, 1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_grid_from_geometry(self):
+        from d2spy.extras.raster import Grid
+
+        grid = Grid.from_geometry(utm_box(504002, 4587992, 504004, 4587994), 0.5)
+        self.assertEqual(grid.crs.to_epsg(), 32616)
+        self.assertEqual(grid.resolution, 0.5)
+        # Edges are snapped to multiples of the resolution
+        left, bottom, right, top = grid.bounds
+        self.assertAlmostEqual(left % 0.5, 0, places=6)
+        self.assertAlmostEqual(top % 0.5, 0, places=6)
+        self.assertEqual(len(grid.x), grid.width)
+        self.assertEqual(len(grid.y), grid.height)
+
+        with self.assertRaises(ValueError):
+            Grid.from_geometry(utm_box(504002, 4587992, 504004, 4587994), 0)
+
+    def test_read_aligned(self):
+        import numpy as np
+
+        from d2spy.extras.raster import Grid, read_aligned
+
+        grid = Grid.from_geometry(
+            utm_box(504002.05, 4587992.05, 504003.95, 4587993.95),
+            0.1,
+            crs="EPSG:32616",
+        )
+        values = read_aligned(self.paths[0], grid, resampling="nearest")
+        self.assertEqual(values.shape, (1, grid.height, grid.width))
+        columns = np.round((grid.x - ORIGIN[0] - 0.05) / 0.1)
+        np.testing.assert_allclose(values[0, 0], columns)
+
+        # Rasters in other coordinate systems are warped to the grid
+        warped = read_aligned(self.mercator_path, grid)
+        self.assertLess(np.nanmax(np.abs(warped - values)), 2)
+
+        # Pixels outside the raster are NaN
+        outside = Grid.from_geometry(
+            utm_box(504008, 4587992, 504012, 4587994), 0.5, crs="EPSG:32616"
+        )
+        values = read_aligned(self.paths[0], outside)
+        self.assertTrue(np.isnan(values[0, :, -1]).all())
+        self.assertFalse(np.isnan(values[0, :, 0]).any())
+
+    def test_to_cube(self):
+        import numpy as np
+
+        from d2spy.extras.raster import RasterCube, open_raster
+
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        client = APIClient("https://example.com", session)
+        days = [date(2024, 6, 15), date(2024, 5, 1), date(2024, 7, 1), date(2024, 6, 1)]
+        flights = [
+            Flight(
+                client,
+                **{**TEST_FLIGHT, "id": f"flight-{index}", "acquisition_date": day},
+            )
+            for index, day in enumerate(days)
+        ]
+        # Flight on 2024-06-01 has no DSM
+        sources = {
+            "flight-0": [("dsm", self.paths[1])],
+            "flight-1": [("ortho", self.paths[2]), ("dsm", self.paths[0])],
+            "flight-2": [("dsm", self.mercator_path)],
+            "flight-3": [("ortho", self.paths[2])],
+        }
+
+        def get_data_products(flight):
+            return DataProductCollection(
+                collection=[
+                    DataProduct(
+                        client,
+                        **{**TEST_DATA_PRODUCT, "data_type": data_type, "url": url},
+                    )
+                    for data_type, url in sources[str(flight.id)]
+                ]
+            )
+
+        with patch.object(Flight, "get_data_products", get_data_products):
+            cube = FlightCollection(collection=flights).to_cube(
+                "dsm", utm_box(504002, 4587992, 504004, 4587994), 0.2, workers=2
+            )
+
+        self.assertIsInstance(cube, RasterCube)
+        self.assertEqual(cube.shape[:2], (3, 1))
+        self.assertEqual(cube.dims, ("time", "band", "y", "x"))
+        self.assertEqual(
+            cube.dates.tolist(), [date(2024, 5, 1), date(2024, 6, 15), date(2024, 7, 1)]
+        )
+        self.assertEqual(cube.bands, ["Gray"])
+
+        # Time steps are read on first access
+        self.assertEqual(int(cube._loaded.sum()), 0)
+        # Each raster is opened once per read
+        with patch("d2spy.extras.raster.open_raster", wraps=open_raster) as opened:
+            second = cube[1]
+        self.assertEqual(opened.call_count, 1)
+        self.assertEqual(cube._loaded.tolist(), [False, True, False])
+        first = cube[cube.time_index(date(2024, 5, 1)), 0]
+        np.testing.assert_allclose(second[0] - first, 1, atol=1e-4)
+
+        data = np.asarray(cube)
+        self.assertTrue(cube._loaded.all())
+        self.assertIsInstance(cube.data, np.memmap)
+        self.assertFalse(np.isnan(data).any())
+        self.assertLess(np.abs(data[2] - data[0]).max(), 2)
+
+        filename = cube.data.filename
+        del cube, data, first, second
+        self.assertFalse(os.path.exists(filename))
@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from requests.exceptions import HTTPError
+
+from d2spy.instrumentation import MetricsAggregator
+from d2spy.models.project_collection import ProjectCollection
+from d2spy.testing import FakeD2SServer
+
+
+class TestFakeD2SServer(TestCase):
+    def setUp(self):
+        self.server = FakeD2SServer(
+            projects=2, flights_per_project=3, data_products_per_flight=2
+        ).start()
+        self.addCleanup(self.server.stop)
+        self.workspace = self.server.connect()
+
+    def test_crawl(self):
+        projects = self.workspace.get_projects()
+        self.assertIsInstance(projects, ProjectCollection)
+        self.assertEqual(len(projects), 2)
+
+        project = projects[0]
+        flights = project.get_flights()
+        self.assertEqual(len(flights), 3)
+        data_products = flights[0].get_data_products()
+        self.assertEqual(len(data_products), 2)
+        self.assertTrue(data_products[0].url.startswith(self.server.url))
+        self.assertEqual(len(flights[0].get_raw_data()), 1)
+
+        map_layers = project.get_map_layers()
+        self.assertEqual(len(map_layers[0]["features"]), 10)
+        self.assertEqual(project.get_project_boundary()["type"], "Feature")
+
+        self.assertEqual(
+            self.server.request_counts[("GET", "/api/v1/projects/{id}/flights")], 1
+        )
+
+    def test_token_refresh_and_errors(self):
+        # Expired access tokens are refreshed and the request is retried
+        self.server.expire_tokens()
+        self.assertEqual(len(self.workspace.get_projects()), 2)
+        self.assertEqual(
+            self.server.request_counts[("POST", "/api/v1/auth/refresh-token")], 1
+        )
+
+        self.server.inject_error("/api/v1/projects$", status=503)
+        with self.assertRaises(HTTPError):
+            self.workspace.get_projects()
+        # Injected errors are only returned once
+        self.assertEqual(len(self.workspace.get_projects()), 2)
+
+    def test_upload(self):
+        flight = self.workspace.get_projects()[0].get_flights()[0]
+
+        with tempfile.NamedTemporaryFile(suffix=".tif") as temp_data_product:
+            temp_data_product.write(b"0" * 1024)
+            temp_data_product.flush()
+            flight.add_data_product(temp_data_product.name, "ortho")
+
+        # Completed uploads are added to the flight
+        self.assertEqual(self.server.uploaded_bytes, 1024)
+        self.assertEqual(len(flight.get_data_products()), 3)
+
+    def test_compression(self):
+        server = FakeD2SServer(
+            projects=1, features_per_layer=1000, compress_responses=True
+        ).start()
+        self.addCleanup(server.stop)
+        workspace = server.connect()
+        project = workspace.get_projects()[0]
+        metrics = workspace.client.add_hook(MetricsAggregator())
+
+        map_layers = project.get_map_layers()
+        self.assertEqual(len(map_layers[0]["features"]), 1000)
+        (row,) = metrics.summary()
+        # Compressed size as received
+        self.assertLess(row["response_bytes"], len(json.dumps(map_layers)) / 4)
+
+        workspace.client.request_compression = "gzip"
+        workspace.client.compression_threshold = 0
+        map_layer = project.add_map_layer("plots", map_layers[0])
+        self.assertEqual(len(map_layer["features"]), 1000)
+
+    def test_upload_map_layer(self):
+        project = self.workspace.get_projects()[0]
+        features = project.get_map_layers()[0]["features"]
+
+        # Streamed with chunked transfer encoding, one request for the layer
+        map_layer = project.upload_map_layer(
+            iter(features), layer_name="plots", progress=False
+        )
+        self.assertEqual(len(map_layer["features"]), 10)
+        self.assertEqual(map_layer["features"][0]["properties"]["layer_name"], "plots")
+
+        reported = []
+        self.workspace.client.request_compression = "gzip"
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, "field_boundaries.geojson")
+            with open(filepath, "w") as geojson_file:
+                json.dump(
+                    {"type": "FeatureCollection", "features": features}, geojson_file
+                )
+            map_layer = project.upload_map_layer(
+                filepath, progress=lambda count, total: reported.append(count)
+            )
+        self.assertEqual(
+            map_layer["features"][0]["properties"]["layer_name"], "field_boundaries"
+        )
+        self.assertEqual(reported, [10])
+        self.assertEqual(
+            self.server.request_counts[
+                ("POST", "/api/v1/projects/{id}/vector_layers/geojson")
+            ],
+            2,
+        )
@@ -0,0 +1,97 @@
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+from d2spy.extras.geo import HAS_GEO
+from d2spy.models.data_product_collection import DataProductCollection
+from d2spy.testing import FakeD2SServer
+
+
+@skipUnless(HAS_GEO, "requires d2spy[geo]")
+class TestSpatialIndex(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        from d2spy.models import SpatialIndex
+
+        cls.server = FakeD2SServer(
+            projects=3, flights_per_project=2, data_products_per_flight=2
+        ).start()
+        cls.workspace = cls.server.connect()
+        cls.index = SpatialIndex.from_workspace(cls.workspace)
+        cls.project = cls.workspace.get_projects()[0]
+        cls.boundary = cls.project.get_project_boundary()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def test_from_workspace(self):
+        self.assertEqual(len(self.index), 3 + 3 * 2 * 2 + 3 * 10)
+        self.assertEqual(len(self.index.projects_intersecting(self.boundary)), 1)
+
+    def test_data_products_intersecting(self):
+        data_products = self.index.data_products_intersecting(self.boundary)
+        self.assertIsInstance(data_products, DataProductCollection)
+        self.assertEqual(len(data_products), 4)
+
+        # Bounding boxes and GeoJSON geometries are accepted
+        x, y = self.boundary["geometry"]["coordinates"][0][0]
+        self.assertEqual(
+            len(self.index.data_products_intersecting((x, y, x + 0.001, y + 0.001))),
+            4,
+        )
+        self.assertEqual(len(self.index.data_products_intersecting((0, 0, 1, 1))), 0)
+
+    def test_features_within(self):
+        data_product = self.index.data_products_intersecting(self.boundary)[0]
+        features = self.index.features_within(data_product)
+        self.assertEqual(len(features), 9)
+        self.assertTrue(
+            all(
+                feature["properties"]["project_id"] == str(self.project.id)
+                for feature in features
+            )
+        )
+        self.assertEqual(
+            self.index.features_within(data_product, project_id="other"), []
+        )
+
+    def test_save_and_load(self):
+        from d2spy.models import SpatialIndex
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, "spatial_index.json")
+            self.index.save(filepath)
+            index = SpatialIndex.load(filepath, self.workspace.client)
+
+        self.assertEqual(len(index), len(self.index))
+        (project,) = index.projects_intersecting(self.boundary)
+        self.assertEqual(project.id, self.project.id)
+        self.assertEqual(project.start_date, self.project.start_date)
+        data_products = index.data_products_intersecting(self.boundary)
+        self.assertEqual(
+            [data_product.id for data_product in data_products],
+            [
+                data_product.id
+                for data_product in self.index.data_products_intersecting(self.boundary)
+            ],
+        )
+        self.assertEqual(len(index.features_within(data_products[0])), 9)
+
+    def test_add_project_keeps_project(self):
+        from d2spy.models import SpatialIndex
+
+        project = self.workspace.get_projects()[1]
+        field = getattr(project, "field", None)
+        boundary = project.get_project_boundary()
+        index = SpatialIndex()
+        index.add_project(project, boundary=boundary)
+        self.assertIs(getattr(project, "field", None), field)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, "spatial_index.json")
+            index.save(filepath)
+            loaded = SpatialIndex.load(filepath, self.workspace.client)
+
+        (loaded_project,) = loaded.projects_intersecting(boundary)
+        self.assertEqual(loaded_project.field, boundary)
@@ -0,0 +1,207 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from requests import Session
+
+from d2spy.identity_map import IdentityMap
+from d2spy.sync import WorkspaceSync
+from d2spy.workspace import Workspace
+
+from example_data import TEST_DATA_PRODUCT, TEST_FLIGHT, TEST_MULTI_PROJECT
+
+
+PROJECT_ID = TEST_MULTI_PROJECT["id"]
+FLIGHT_ID = TEST_FLIGHT["id"]
+DATA_PRODUCT_ID = TEST_DATA_PRODUCT["id"]
+
+
+class FakeInstance:
+    """Serves project, flight, and data product listings from dicts."""
+
+    def __init__(self):
+        self.projects = [{**TEST_MULTI_PROJECT, "flight_count": 1}]
+        self.flights = [
+            {
+                **TEST_FLIGHT,
+                "data_products": [{"id": DATA_PRODUCT_ID, "status": "SUCCESS"}],
+            }
+        ]
+        self.data_products = [TEST_DATA_PRODUCT]
+        self.endpoints = []
+
+    def get(self, endpoint, **kwargs):
+        self.endpoints.append(endpoint)
+        if endpoint == "/api/v1/projects":
+            return self.projects
+        if endpoint == f"/api/v1/projects/{PROJECT_ID}/flights":
+            return self.flights
+        if endpoint.endswith(f"/flights/{FLIGHT_ID}/data_products"):
+            return self.data_products
+        raise AssertionError(f"Unexpected endpoint: {endpoint}")
+
+
+class TestWorkspaceSync(TestCase):
+    def setUp(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        self.workspace = Workspace("https://example.com", session)
+        self.instance = FakeInstance()
+
+    def test_sync(self):
+        with patch(
+            "d2spy.api_client.APIClient.make_get_request",
+            side_effect=self.instance.get,
+        ):
+            workspace_sync = WorkspaceSync(self.workspace)
+
+            # First sync reports the whole tree as added
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind) for event in events],
+                [
+                    ("added", "project"),
+                    ("added", "flight"),
+                    ("added", "data_product"),
+                ],
+            )
+            self.assertEqual(workspace_sync.request_count, 3)
+
+            # Nothing changed, only the project list is requested
+            self.instance.endpoints.clear()
+            self.assertEqual(workspace_sync.sync(), [])
+            self.assertEqual(self.instance.endpoints, ["/api/v1/projects"])
+
+            # Data product status changed, deep sync finds it
+            self.instance.flights = [
+                {
+                    **TEST_FLIGHT,
+                    "data_products": [{"id": DATA_PRODUCT_ID, "status": "FAILED"}],
+                }
+            ]
+            self.instance.data_products = [{**TEST_DATA_PRODUCT, "status": "FAILED"}]
+            self.assertEqual(workspace_sync.sync(), [])
+            workspace_sync.deep = True
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind) for event in events],
+                [("changed", "flight"), ("changed", "data_product")],
+            )
+            self.assertEqual(events[1].obj.status, "FAILED")
+
+            # Project removed, whole subtree is reported as removed
+            self.instance.projects = []
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind, event.id) for event in events],
+                [
+                    ("removed", "data_product", DATA_PRODUCT_ID),
+                    ("removed", "flight", FLIGHT_ID),
+                    ("removed", "project", PROJECT_ID),
+                ],
+            )
+            self.assertEqual(workspace_sync.projects, {})
+            self.assertEqual(workspace_sync.flights, {})
+            self.assertEqual(workspace_sync.data_products, {})
+
+    def test_sync_removed(self):
+        with patch(
+            "d2spy.api_client.APIClient.make_get_request",
+            side_effect=self.instance.get,
+        ):
+            workspace_sync = WorkspaceSync(self.workspace)
+            workspace_sync.sync()
+
+            # Data product removed from flight
+            self.instance.flights = [{**TEST_FLIGHT, "data_products": []}]
+            self.instance.data_products = []
+            workspace_sync.deep = True
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind, event.id) for event in events],
+                [
+                    ("changed", "flight", FLIGHT_ID),
+                    ("removed", "data_product", DATA_PRODUCT_ID),
+                ],
+            )
+            self.assertEqual(events[1].obj.status, "SUCCESS")
+            self.assertEqual(workspace_sync.data_products, {})
+
+            # Flight removed from project, found without a deep sync because the
+            # flight count changed
+            workspace_sync.deep = False
+            self.instance.projects = [{**TEST_MULTI_PROJECT, "flight_count": 0}]
+            self.instance.flights = []
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind, event.id) for event in events],
+                [
+                    ("changed", "project", PROJECT_ID),
+                    ("removed", "flight", FLIGHT_ID),
+                ],
+            )
+            self.assertEqual(workspace_sync.flights, {})
+
+    def test_sync_not_deep(self):
+        with patch(
+            "d2spy.api_client.APIClient.make_get_request",
+            side_effect=self.instance.get,
+        ):
+            workspace_sync = WorkspaceSync(self.workspace)
+            workspace_sync.sync()
+
+            # Adding a data product does not change the project's flight count,
+            # so only a deep sync finds it
+            new_data_product = {**TEST_DATA_PRODUCT, "id": "new-data-product"}
+            self.instance.flights = [
+                {
+                    **TEST_FLIGHT,
+                    "data_products": [
+                        {"id": DATA_PRODUCT_ID, "status": "SUCCESS"},
+                        {"id": "new-data-product", "status": "SUCCESS"},
+                    ],
+                }
+            ]
+            self.instance.data_products = [TEST_DATA_PRODUCT, new_data_product]
+            self.instance.endpoints.clear()
+            self.assertEqual(workspace_sync.sync(), [])
+            self.assertEqual(self.instance.endpoints, ["/api/v1/projects"])
+
+            workspace_sync.deep = True
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind, event.id) for event in events],
+                [
+                    ("changed", "flight", FLIGHT_ID),
+                    ("added", "data_product", "new-data-product"),
+                ],
+            )
+
+    def test_sync_identity_map(self):
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        workspace = Workspace(
+            "https://example.com", session, identity_map=IdentityMap()
+        )
+        with patch(
+            "d2spy.api_client.APIClient.make_get_request",
+            side_effect=self.instance.get,
+        ):
+            workspace_sync = WorkspaceSync(workspace, deep=True)
+            workspace_sync.sync()
+            data_product = workspace_sync.data_products[DATA_PRODUCT_ID]
+
+            # Cached instance is refreshed in place, status change is still found
+            self.instance.flights = [
+                {
+                    **TEST_FLIGHT,
+                    "data_products": [{"id": DATA_PRODUCT_ID, "status": "FAILED"}],
+                }
+            ]
+            self.instance.data_products = [{**TEST_DATA_PRODUCT, "status": "FAILED"}]
+            events = workspace_sync.sync()
+            self.assertEqual(
+                [(event.action, event.kind) for event in events],
+                [("changed", "flight"), ("changed", "data_product")],
+            )
+            self.assertIs(events[1].obj, data_product)
+            self.assertEqual(data_product.status, "FAILED")
@@ -0,0 +1,115 @@
+import math
+import os
+import tempfile
+import warnings
+from unittest import TestCase, skipUnless
+
+from d2spy.extras.geo import HAS_GEO
+
+
+@skipUnless(HAS_GEO, "requires d2spy[geo]")
+class TestTerrain(TestCase):
+    def test_percentile_filter(self):
+        import numpy as np
+
+        from d2spy.extras.terrain import percentile_filter
+
+        array = np.random.default_rng(0).normal(size=(12, 15)).astype("float32")
+        array[3:6, 3:6] = np.nan
+        padded = np.pad(array, 2, constant_values=np.nan)
+        for percentile in (0, 25, 50, 90, 100):
+            filtered = percentile_filter(array, percentile, size=5)
+            with warnings.catch_warnings():
+                # Windows of NaN values only
+                warnings.simplefilter("ignore", RuntimeWarning)
+                expected = np.empty((12, 15))
+                for row in range(12):
+                    bottom = row + 5
+                    for col in range(15):
+                        right = col + 5
+                        expected[row, col] = np.nanpercentile(
+                            padded[row:bottom, col:right], percentile
+                        )
+            np.testing.assert_allclose(filtered, expected, rtol=1e-5)
+
+        with self.assertRaises(ValueError):
+            percentile_filter(array, 50, size=4)
+        with self.assertRaises(ValueError):
+            percentile_filter(array, 101)
+
+    def test_hillshade(self):
+        import numpy as np
+
+        from d2spy.extras.terrain import hillshade
+
+        # Flat surfaces are lit by the cosine of the zenith angle
+        flat = hillshade(np.full((5, 5), 100.0), 1.0, altitude=45)
+        self.assertAlmostEqual(flat[2, 2], 255 * math.cos(math.radians(45)), places=3)
+        self.assertTrue(np.isnan(flat[0]).all())
+
+        # Slopes facing the light source are brighter than slopes facing away
+        ramp = np.tile(np.arange(5, dtype="float64"), (5, 1))
+        east_up = hillshade(ramp, 1.0, azimuth=270)[2, 2]
+        east_down = hillshade(ramp, 1.0, azimuth=90)[2, 2]
+        self.assertGreater(east_up, flat[2, 2])
+        self.assertLess(east_down, flat[2, 2])
+
+    def test_canopy_height_model(self):
+        import numpy as np
+        import rasterio
+
+        from d2spy.extras.terrain import NODATA, canopy_height_model
+        from d2spy.testing.rasters import write_raster
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            # Terrain sloping to the east at 0.4 m resolution, and a DSM at 0.1 m
+            # with 2 m tall canopy over the left half and a 1 m pit
+            terrain = np.tile(np.linspace(190, 195, 25, dtype="float32"), (25, 1))
+            dtm = write_raster(
+                os.path.join(temp_dir, "dtm.tif"), terrain, resolution=0.4
+            )
+            surface = np.repeat(np.repeat(terrain, 4, axis=0), 4, axis=1)
+            surface[:, :50] += 2
+            surface[20, 20] -= 1
+            surface[90:, 90:] = np.nan
+            dsm = write_raster(
+                os.path.join(temp_dir, "dsm.tif"), surface, nodata=float("nan")
+            )
+
+            outputs = {}
+            for block_size in (16, 1024):
+                out_raster = os.path.join(temp_dir, f"chm_{block_size}.tif")
+                hillshade_raster = os.path.join(temp_dir, f"hs_{block_size}.tif")
+                result = canopy_height_model(
+                    dsm,
+                    dtm,
+                    out_raster,
+                    percentile=100,
+                    hillshade_raster=hillshade_raster,
+                    block_size=block_size,
+                    workers=2,
+                )
+                self.assertEqual(result, out_raster)
+                with rasterio.open(out_raster) as dataset:
+                    self.assertEqual(
+                        dataset.tags(ns="IMAGE_STRUCTURE")["LAYOUT"], "COG"
+                    )
+                    self.assertEqual(dataset.nodata, NODATA)
+                    self.assertEqual(dataset.res, (0.1, 0.1))
+                    outputs[block_size] = dataset.read(1, masked=True)
+                with rasterio.open(hillshade_raster) as dataset:
+                    self.assertEqual(dataset.dtypes[0], "uint8")
+                    self.assertEqual(dataset.shape, (100, 100))
+
+            chm = outputs[16]
+            # Blocks are processed with margins, so results do not depend on the
+            # block size
+            np.testing.assert_array_equal(chm, outputs[1024])
+            self.assertTrue(chm.mask[90:, 90:].all())
+            # Pit is filled by the 3 x 3 maximum filter. Heights vary by about
+            # 0.1 m since the DSM terrain is blocky and the DTM is resampled.
+            self.assertAlmostEqual(float(chm[20, 20]), 2, delta=0.15)
+            self.assertAlmostEqual(float(np.ma.median(chm[:, 5:45])), 2, delta=0.15)
+            self.assertAlmostEqual(float(np.ma.median(chm[:80, 55:95])), 0, delta=0.15)
+            # Heights are at least 0
+            self.assertGreaterEqual(float(chm.min()), 0)
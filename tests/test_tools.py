@@ -0,0 +1,174 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from d2spy.models.data_product_collection import DataProductCollection
+from d2spy.testing import FakeD2SServer
+from d2spy.tools import (
+    CHM,
+    DTM,
+    ExG,
+    Hillshade,
+    NDVI,
+    VARI,
+    ZonalStatistics,
+    batch_tools,
+)
+
+DATA_PRODUCTS = "/api/v1/projects/{id}/flights/{id}/data_products"
+TOOLS = "/api/v1/projects/{id}/flights/{id}/data_products/{id}/tools"
+
+
+class TestTools(TestCase):
+    def setUp(self):
+        self.server = FakeD2SServer(projects=1, flights_per_project=3).start()
+        self.addCleanup(self.server.stop)
+        self.workspace = self.server.connect()
+        project = self.workspace.get_projects()[0]
+        self.project_id = str(project.id)
+        self.flights = project.get_flights()
+        self.data_products = [
+            flight.get_data_products() for flight in self.flights.collection
+        ]
+
+    def of_type(self, data_type: str) -> DataProductCollection:
+        return DataProductCollection(
+            collection=[
+                data_product
+                for data_products in self.data_products
+                for data_product in data_products.collection
+                if data_product.data_type == data_type
+            ]
+        )
+
+    def test_batch_tools(self):
+        batches = batch_tools(
+            [NDVI(1, 3), ExG(1, 2, 3), NDVI(1, 3), NDVI(2, 3), Hillshade()]
+        )
+        self.assertEqual(
+            batches, [[NDVI(1, 3), ExG(1, 2, 3), Hillshade()], [NDVI(2, 3)]]
+        )
+
+    def test_submit_tools(self):
+        orthos = self.of_type("ortho")
+        # First flight already has NDVI
+        self.server._create_data_product(
+            self.server.flights[str(self.flights[0].id)], "ndvi"
+        )
+        counts = dict(self.server.request_counts)
+
+        results = orthos.submit_tools(
+            [NDVI(red=1, nir=3), ExG(1, 2, 3), VARI(1, 2, 3), Hillshade()], workers=2
+        )
+        self.assertEqual(len(results), 3 * 4)
+        statuses = {
+            (str(result.data_product.id), type(result.tool).__name__): result.status
+            for result in results
+        }
+        first = str(orthos[0].id)
+        self.assertEqual(statuses[(first, "NDVI")], "skipped")
+        self.assertEqual(statuses[(first, "ExG")], "submitted")
+        self.assertEqual(statuses[(str(orthos[1].id), "NDVI")], "submitted")
+        # Hillshade requires a single band elevation raster
+        self.assertEqual(
+            [result.status for result in results if isinstance(result.tool, Hillshade)],
+            ["failed"] * 3,
+        )
+
+        # One request per data product with every derivation, and one request
+        # for the data products of each flight
+        self.assertEqual(self.server.request_counts[("POST", TOOLS)], 3)
+        self.assertEqual(
+            self.server.request_counts[("GET", DATA_PRODUCTS)]
+            - counts[("GET", DATA_PRODUCTS)],
+            3,
+        )
+        jobs = {job["data_product_id"]: job for job in self.server.jobs}
+        self.assertFalse(jobs[first]["ndvi"])
+        self.assertTrue(jobs[first]["exg"])
+        self.assertEqual((jobs[first]["variRed"], jobs[first]["variGreen"]), (1, 2))
+        self.assertFalse(jobs[first]["hillshade"])
+        # Zonal statistics are only requested by ZonalStatistics
+        self.assertFalse(jobs[first]["zonal"])
+        second = jobs[str(orthos[1].id)]
+        self.assertTrue(second["ndvi"])
+        self.assertEqual((second["ndviRed"], second["ndviNIR"]), (1, 3))
+
+    def test_submit_tools_band_pairs(self):
+        ortho = self.of_type("ortho")[0]
+        self.server._create_data_product(
+            self.server.flights[str(self.flights[0].id)], "ndvi"
+        )
+        tools = [NDVI(red=1, nir=3), NDVI(red=2, nir=3)]
+
+        # Existing outputs are matched by data type only, whatever their bands
+        results = ortho.submit_tools(tools)
+        self.assertEqual([result.status for result in results], ["skipped"] * 2)
+        self.assertEqual(self.server.jobs, [])
+
+        results = ortho.submit_tools(tools, skip_existing=False)
+        self.assertEqual([result.status for result in results], ["submitted"] * 2)
+        self.assertEqual(
+            [(job["ndviRed"], job["ndviNIR"]) for job in self.server.jobs],
+            [(1, 3), (2, 3)],
+        )
+
+    def test_submit_tools_lookup_failure(self):
+        from d2spy.tools import _flight_data_types
+
+        orthos = self.of_type("ortho")
+        first_flight = orthos[0].flight_id
+
+        def flight_data_types(data_product, project_id):
+            if data_product.flight_id == first_flight:
+                raise ValueError("Lookup failed")
+            return _flight_data_types(data_product, project_id)
+
+        with patch("d2spy.tools._flight_data_types", flight_data_types):
+            results = orthos.submit_tools([NDVI(1, 3), ExG(1, 2, 3)], workers=2)
+
+        # Only the tools of the data product whose lookup failed fail
+        self.assertEqual(
+            [(result.status, result.detail) for result in results[:2]],
+            [("failed", "Lookup failed")] * 2,
+        )
+        self.assertEqual([result.status for result in results[2:]], ["submitted"] * 4)
+        self.assertEqual(len(self.server.jobs), 2)
+
+    def test_submit_tools_point_cloud(self):
+        point_cloud = self.of_type("point_cloud")[0]
+
+        results = point_cloud.submit_tools(
+            [CHM(resolution=0.5), DTM(rigidness=2), NDVI(1, 2)]
+        )
+        self.assertEqual(
+            [result.status for result in results], ["submitted", "submitted", "failed"]
+        )
+        (job,) = self.server.jobs
+        self.assertEqual(
+            (job["chm"], job["chmResolution"], job["chmPercentile"]), (True, 0.5, 100)
+        )
+        self.assertEqual((job["dtm"], job["dtmRigidness"]), (True, 2))
+        self.assertFalse(job["ndvi"])
+
+    def test_submit_tools_zonal_statistics(self):
+        layer_id = self.server.layers[self.project_id][0]["features"][0]["properties"][
+            "layer_id"
+        ]
+        dsms = self.of_type("dsm")
+
+        results = dsms.submit_tools([ZonalStatistics(layer_id), Hillshade()])
+        self.assertTrue(all(result.status == "submitted" for result in results))
+        self.assertEqual(len(self.server.jobs), 3)
+        for job in self.server.jobs:
+            self.assertEqual(job["dem_id"], job["data_product_id"])
+            self.assertEqual(job["zonal_layer_id"], layer_id)
+            self.assertTrue(job["hillshade"])
+
+        # Zonal statistics are skipped once they exist
+        results = dsms.submit_tools([ZonalStatistics(layer_id)], workers=1)
+        self.assertEqual([result.status for result in results], ["skipped"] * 3)
+        self.assertEqual(len(self.server.jobs), 3)
+
+        # Existing outputs are requested again when not skipped
+        dsms.submit_tools([ZonalStatistics(layer_id)], skip_existing=False)
+        self.assertEqual(len(self.server.jobs), 6)
@@ -6,7 +6,7 @@ from unittest import TestCase
 import geopandas as gpd
 import rasterio
 
-from d2spy.extras.utils import clip_by_mask
+from d2spy.extras.utils import clip_by_mask, find_files, iter_files
 
 
 class TestUtils(TestCase):
@@ -49,3 +49,66 @@ class TestUtils(TestCase):
                 )
 
         self.assertEqual(str(context.exception), "Input shapes do not overlap raster.")
+
+    def test_iter_files(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            paths = [
+                "DJI_0001.JPG",
+                "notes.txt",
+                "flight_1/DJI_0002.jpg",
+                "flight_1/thumbnails/DJI_0002.jpg",
+                "flight_2/a/b/c/d/e/f/deep.jpg",
+                "flight_2/image.tif",
+            ]
+            for path in paths:
+                filepath = os.path.join(tmp_dir, *path.split("/"))
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                open(filepath, "w").close()
+
+            def relpaths(files):
+                return sorted(
+                    os.path.relpath(file, tmp_dir).replace(os.sep, "/")
+                    for file in files
+                )
+
+            # No types match no files, None matches all files
+            self.assertEqual(find_files(tmp_dir, []), [])
+            self.assertEqual(list(iter_files(tmp_dir, [], workers=2)), [])
+            self.assertTrue(list(iter_files(tmp_dir, None)))
+
+            # Depth 7 (folder and six subfolder levels) skips deep.jpg
+            self.assertEqual(
+                relpaths(find_files(tmp_dir, [".jpg", ".tif"])),
+                [
+                    "DJI_0001.JPG",
+                    "flight_1/DJI_0002.jpg",
+                    "flight_1/thumbnails/DJI_0002.jpg",
+                    "flight_2/image.tif",
+                ],
+            )
+            for workers in (1, 4):
+                self.assertEqual(
+                    relpaths(iter_files(tmp_dir, [".JPG"], workers=workers)),
+                    [
+                        "DJI_0001.JPG",
+                        "flight_1/DJI_0002.jpg",
+                        "flight_1/thumbnails/DJI_0002.jpg",
+                        "flight_2/a/b/c/d/e/f/deep.jpg",
+                    ],
+                )
+                self.assertEqual(
+                    relpaths(
+                        iter_files(
+                            tmp_dir,
+                            include=["DJI_*", "flight_2/*"],
+                            exclude=["thumbnails"],
+                            max_depth=2,
+                            workers=workers,
+                        )
+                    ),
+                    ["DJI_0001.JPG", "flight_1/DJI_0002.jpg", "flight_2/image.tif"],
+                )
+
+            # Files are found lazily
+            files = iter_files(tmp_dir, max_depth=1)
+            self.assertIn(relpaths([next(files)])[0], paths)
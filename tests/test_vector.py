@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+from unittest import TestCase, skipUnless
+
+from d2spy.extras.columnar import HAS_ARROW
+from d2spy.extras.geo import HAS_GEO
+from d2spy.extras.vector import count_features, iter_features
+
+from example_data import TEST_MAP_LAYER
+
+
+class TestVector(TestCase):
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.temp_dir = temp_dir.name
+        self.features = [
+            {
+                "type": "Feature",
+                "geometry": feature["geometry"],
+                "properties": {"row": 1, "col": index + 1},
+            }
+            for index, feature in enumerate(TEST_MAP_LAYER["features"])
+        ]
+
+    def write_geojson(self) -> str:
+        filepath = os.path.join(self.temp_dir, "plots.geojson")
+        with open(filepath, "w") as geojson_file:
+            json.dump(
+                {"type": "FeatureCollection", "features": self.features}, geojson_file
+            )
+        return filepath
+
+    def test_iter_features_geojson(self):
+        filepath = self.write_geojson()
+        self.assertEqual(list(iter_features(filepath)), self.features)
+        self.assertIsNone(count_features(filepath))
+
+    def test_iter_features_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            iter_features(os.path.join(self.temp_dir, "missing.geojson"))
+
+        filepath = os.path.join(self.temp_dir, "plots.kml")
+        open(filepath, "w").close()
+        with self.assertRaises(ValueError):
+            iter_features(filepath)
+
+    @skipUnless(HAS_GEO, "requires d2spy[geo]")
+    def test_iter_features_geopackage(self):
+        import geopandas as gpd
+
+        gdf = gpd.GeoDataFrame.from_features(self.features, crs="EPSG:4326")
+        filepath = os.path.join(self.temp_dir, "plots.gpkg")
+        # Projected layers are reprojected to WGS84
+        gdf.to_crs(epsg=32616).to_file(filepath)
+
+        self.assertEqual(count_features(filepath), len(self.features))
+        features = list(iter_features(filepath, batch_size=1))
+        self.assertEqual(len(features), len(self.features))
+        for feature, expected in zip(features, self.features):
+            self.assertEqual(feature["properties"], expected["properties"])
+            x, y = feature["geometry"]["coordinates"][0][0]
+            expected_x, expected_y = expected["geometry"]["coordinates"][0][0]
+            self.assertAlmostEqual(x, expected_x, places=6)
+            self.assertAlmostEqual(y, expected_y, places=6)
+
+    @skipUnless(HAS_GEO and HAS_ARROW, "requires d2spy[geo,arrow]")
+    def test_iter_features_geoparquet(self):
+        import geopandas as gpd
+
+        gdf = gpd.GeoDataFrame.from_features(self.features, crs="EPSG:4326")
+        filepath = os.path.join(self.temp_dir, "plots.parquet")
+        gdf.to_parquet(filepath)
+
+        self.assertEqual(count_features(filepath), len(self.features))
+        features = list(iter_features(filepath, batch_size=1))
+        self.assertEqual(
+            [feature["properties"] for feature in features],
+            [feature["properties"] for feature in self.features],
+        )
+        self.assertEqual(features[0]["geometry"]["type"], "Polygon")
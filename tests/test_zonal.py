@@ -0,0 +1,195 @@
+import os
+import tempfile
+from datetime import date
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from requests import Session
+
+from d2spy.api_client import APIClient
+from d2spy.extras.geo import HAS_GEO
+from d2spy.models.data_product import DataProduct
+from d2spy.models.data_product_collection import DataProductCollection
+from d2spy.models.flight import Flight
+from d2spy.models.flight_collection import FlightCollection
+
+from example_data import TEST_DATA_PRODUCT, TEST_FLIGHT
+
+# Upper left corner of the synthetic rasters in UTM zone 16N
+ORIGIN = (504000.0, 4588000.0)
+
+
+def plot_feature(left, bottom, right, top, plot):
+    """Returns GeoJSON Feature in WGS84 of a plot given in UTM zone 16N, shaped
+    like a D2S map layer feature."""
+    from pyproj import Transformer
+
+    transformer = Transformer.from_crs("EPSG:32616", "EPSG:4326", always_xy=True)
+    ring = [
+        list(transformer.transform(x, y))
+        for x, y in [
+            (left, bottom),
+            (right, bottom),
+            (right, top),
+            (left, top),
+            (left, bottom),
+        ]
+    ]
+    return {
+        "type": "Feature",
+        "geometry": {"type": "Polygon", "coordinates": [ring]},
+        "properties": {"id": f"feature-{plot}", "properties": {"plot": plot}},
+    }
+
+
+@skipUnless(HAS_GEO, "requires d2spy[geo]")
+class TestZonal(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import numpy as np
+
+        from d2spy.testing.rasters import write_raster
+
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        rng = np.random.default_rng(0)
+        # 10 m x 10 m at 0.1 m, with NaN nodata in the upper left corner
+        cls.values = rng.normal(0.5, 0.1, (100, 100)).astype("float32")
+        cls.values[:10, :10] = np.nan
+        cls.paths = [
+            write_raster(
+                os.path.join(cls.temp_dir.name, f"ndvi_{day}.tif"),
+                cls.values + day,
+                origin=ORIGIN,
+                nodata=float("nan"),
+            )
+            for day in range(2)
+        ]
+        # Plots of 2 m x 1 m (20 x 10 pixels), the first partly nodata, and a
+        # plot outside the rasters
+        cls.features = [
+            plot_feature(504000, 4587990 + 8.5, 504002, 4587990 + 9.5, 101),
+            plot_feature(504004, 4587992, 504006, 4587993, 102),
+            plot_feature(504020, 4587992, 504022, 4587993, 103),
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.temp_dir.cleanup()
+
+    def test_zones_statistics(self):
+        import numpy as np
+        from rasterio.transform import from_origin
+        from shapely.geometry import box
+
+        from d2spy.extras.raster import Grid
+        from d2spy.extras.zonal import Zones
+
+        grid = Grid("EPSG:32616", from_origin(0, 10, 1, 1), 10, 10)
+        zones = Zones([box(0, 5, 5, 10), box(5, 0, 10, 5), box(20, 20, 21, 21)], grid)
+        values = np.arange(100, dtype="float32").reshape(10, 10)
+        values[0, 0] = np.nan
+
+        stats = ["count", "sum", "mean", "std", "min", "max", "median", "p90"]
+        result = zones.statistics(values, stats)
+        first = values[:5, :5].ravel()[1:]
+        second = values[5:, 5:].ravel()
+        for stat, function in [
+            ("count", len),
+            ("sum", np.sum),
+            ("mean", np.mean),
+            ("std", np.std),
+            ("min", np.min),
+            ("max", np.max),
+            ("median", np.median),
+            ("p90", lambda array: np.percentile(array, 90)),
+        ]:
+            self.assertAlmostEqual(result[stat][0], function(first), places=4)
+            self.assertAlmostEqual(result[stat][1], function(second), places=4)
+        # Plot outside the grid
+        self.assertEqual(result["count"][2], 0)
+        self.assertTrue(np.isnan(result["mean"][2]))
+
+    def test_validate_stats(self):
+        from d2spy.extras.zonal import validate_stats
+
+        self.assertEqual(validate_stats(["mean", "p95"]), ["mean", "p95"])
+        for stat in ("average", "p101", "q50"):
+            with self.assertRaises(ValueError):
+                validate_stats([stat])
+
+    def test_extract_plot_series(self):
+        import numpy as np
+        import rasterio
+
+        session = Session()
+        session.cookies.set("access_token", "fake_token")
+        client = APIClient("https://example.com", session)
+        days = [date(2024, 6, 15), date(2024, 5, 1), date(2024, 6, 1)]
+        flights = [
+            Flight(
+                client,
+                **{**TEST_FLIGHT, "id": f"flight-{index}", "acquisition_date": day},
+            )
+            for index, day in enumerate(days)
+        ]
+        # Flight on 2024-06-01 has no NDVI
+        sources = {
+            "flight-0": [("ndvi", self.paths[1])],
+            "flight-1": [("ndvi", self.paths[0])],
+            "flight-2": [("ortho", self.paths[0])],
+        }
+
+        def get_data_products(flight):
+            return DataProductCollection(
+                collection=[
+                    DataProduct(
+                        client,
+                        **{**TEST_DATA_PRODUCT, "data_type": data_type, "url": url},
+                    )
+                    for data_type, url in sources[str(flight.id)]
+                ]
+            )
+
+        collection = FlightCollection(collection=flights)
+        with patch.object(Flight, "get_data_products", get_data_products), patch(
+            "rasterio.open", wraps=rasterio.open
+        ) as opened:
+            series = collection.extract_plot_series(
+                self.features, "ndvi", stats=["mean", "count"], id_property="plot"
+            )
+        # Native grid and values are read from one open dataset per raster
+        self.assertEqual(opened.call_count, 2)
+        with patch.object(Flight, "get_data_products", get_data_products):
+            resampled = collection.extract_plot_series(
+                self.features, "ndvi", stats=["mean"], resolution=0.2, workers=1
+            )
+
+        self.assertEqual(
+            list(series.columns), ["plot_id", "acquisition_date", "stat", "value"]
+        )
+        self.assertEqual(len(series), 3 * 2 * 2)
+        table = series.set_index(["plot_id", "acquisition_date", "stat"])["value"]
+
+        # Plot 101 covers rows 5 to 15 and columns 0 to 20, with nodata in rows
+        # 5 to 10 and columns 0 to 10
+        plot = self.values[5:15, 0:20]
+        self.assertEqual(table[(101, date(2024, 5, 1), "count")], 150)
+        self.assertAlmostEqual(
+            table[(101, date(2024, 5, 1), "mean")], np.nanmean(plot), places=5
+        )
+        plot = self.values[70:80, 40:60]
+        self.assertAlmostEqual(
+            table[(102, date(2024, 6, 15), "mean")], np.mean(plot) + 1, places=5
+        )
+        self.assertTrue(np.isnan(table[(103, date(2024, 5, 1), "mean")]))
+        self.assertEqual(table[(103, date(2024, 5, 1), "count")], 0)
+
+        # Plot IDs default to the D2S feature ID
+        self.assertEqual(
+            sorted(resampled["plot_id"].unique()),
+            ["feature-101", "feature-102", "feature-103"],
+        )
+        means = resampled.set_index(["plot_id", "acquisition_date"])["value"]
+        self.assertAlmostEqual(
+            means[("feature-102", date(2024, 6, 15))], np.mean(plot) + 1, places=2
+        )